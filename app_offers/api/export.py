@@ -0,0 +1,92 @@
+"""
+Streaming catalog export of offers with their details (NDJSON or CSV).
+
+Offers are read through a chunked `.iterator()` (a server-side cursor on
+PostgreSQL) and serialized chunk by chunk with OfferExportFastSerializer, so
+memory use does not grow with the size of the catalog.
+"""
+import csv
+import json
+from itertools import islice
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from app_offers.models import Offer
+from .filters import filter_offers, get_offer_order_by
+from .serializers import OfferExportFastSerializer
+
+EXPORT_CHUNK_SIZE = 500
+
+OFFER_COLUMNS = [
+    'id', 'user', 'title', 'image', 'description', 'created_at', 'updated_at', 'min_price', 'min_delivery_time',
+]
+DETAIL_COLUMNS = ['id', 'title', 'revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type']
+CSV_HEADER = OFFER_COLUMNS + [f'detail_{column}' for column in DETAIL_COLUMNS]
+
+
+def get_export_queryset(params):
+    """
+    Returns the offers to export, filtered and ordered like the offer listing
+    (creator_id, min_price, max_delivery_time, search, ordering).
+
+    Raises:
+        ValueError / TypeError: If a filter value has the wrong type or the ordering is unsupported.
+    """
+    queryset = filter_offers(Offer.objects.all(), params)
+    ordering = params.get('ordering')
+    if ordering:
+        return queryset.order_by(*get_offer_order_by(ordering))
+    if params.get('search'):
+        return queryset.order_by('search_rank', 'id')
+    return queryset.order_by('id')
+
+
+def iter_offers(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields exported offer dicts, fetching and serializing `chunk_size` offers at a time.
+    """
+    serializer = OfferExportFastSerializer()
+    rows = serializer.prepare(queryset).iterator(chunk_size=chunk_size)
+    for chunk in iter(lambda: list(islice(rows, chunk_size)), []):
+        yield from serializer.serialize(chunk)
+
+
+def ndjson_lines(offers):
+    """
+    Renders exported offers as one JSON object per line.
+    """
+    for offer in offers:
+        yield json.dumps(offer, cls=JSONEncoder, ensure_ascii=False) + '\n'
+
+
+class Echo:
+    """
+    File-like object whose write() returns the value, so csv.writer rows can be yielded.
+    """
+    def write(self, value):
+        return value
+
+
+def csv_lines(offers):
+    """
+    Renders exported offers as CSV with one row per detail; offer columns are
+    repeated on every row and offers without details get a single row.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_HEADER)
+    for offer in offers:
+        offer_values = [offer[column] for column in OFFER_COLUMNS]
+        for detail in offer['details'] or [None]:
+            if detail is None:
+                detail_values = [''] * len(DETAIL_COLUMNS)
+            else:
+                detail_values = [detail[column] for column in DETAIL_COLUMNS]
+                detail_values[DETAIL_COLUMNS.index('features')] = json.dumps(detail['features'], ensure_ascii=False)
+            yield writer.writerow(offer_values + detail_values)
+
+
+# export_format -> (content type, renderer, download file name)
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', ndjson_lines, 'offers.ndjson'),
+    'csv': ('text/csv', csv_lines, 'offers.csv'),
+}
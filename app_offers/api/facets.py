@@ -0,0 +1,77 @@
+from django.db.models import Case, Count, F, IntegerField, Value, When
+from django.db.models.functions import Floor
+
+# (label, lowest, highest) delivery-time buckets in days; None means open-ended.
+DELIVERY_TIME_BUCKETS = (
+    ("1", 1, 1),
+    ("2-3", 2, 3),
+    ("4-7", 4, 7),
+    ("8-14", 8, 14),
+    ("15+", 15, None),
+)
+DEFAULT_PRICE_BUCKET_SIZE = 50
+DEFAULT_CREATOR_LIMIT = 20
+
+
+def _grouped(queryset):
+    """
+    Strips ordering and eager loading so the facet aggregation is a plain
+    GROUP BY over the filtered offers.
+    """
+    return queryset.order_by().select_related(None).prefetch_related(None)
+
+
+def price_histogram(queryset, bucket_size=DEFAULT_PRICE_BUCKET_SIZE):
+    """
+    Returns fixed-width min_price buckets with their offer counts (one grouped query).
+    Offers without details (no min_price) are not counted.
+    """
+    rows = (
+        _grouped(queryset)
+        .filter(min_price__isnull=False)
+        .values(bucket=Floor(F("min_price") / bucket_size, output_field=IntegerField()))
+        .annotate(count=Count("id"))
+        .order_by("bucket")
+    )
+    return [
+        {"from": int(row["bucket"]) * bucket_size, "to": (int(row["bucket"]) + 1) * bucket_size, "count": row["count"]}
+        for row in rows
+    ]
+
+
+def delivery_time_buckets(queryset):
+    """
+    Returns the offer count per DELIVERY_TIME_BUCKETS entry based on
+    min_delivery_time (one grouped query). Empty buckets are included.
+    """
+    whens = []
+    for index, (_, lowest, highest) in enumerate(DELIVERY_TIME_BUCKETS):
+        condition = {"min_delivery_time__gte": lowest}
+        if highest is not None:
+            condition["min_delivery_time__lte"] = highest
+        whens.append(When(**condition, then=Value(index)))
+
+    rows = (
+        _grouped(queryset)
+        .filter(min_delivery_time__isnull=False)
+        .values(bucket=Case(*whens, default=Value(None), output_field=IntegerField()))
+        .annotate(count=Count("id"))
+    )
+    counts = {row["bucket"]: row["count"] for row in rows}
+    return [
+        {"label": label, "from": lowest, "to": highest, "count": counts.get(index, 0)}
+        for index, (label, lowest, highest) in enumerate(DELIVERY_TIME_BUCKETS)
+    ]
+
+
+def creator_counts(queryset, limit=DEFAULT_CREATOR_LIMIT):
+    """
+    Returns the creators with the most matching offers (one grouped query).
+    """
+    rows = (
+        _grouped(queryset)
+        .values("user_id", "user__username")
+        .annotate(count=Count("id"))
+        .order_by("-count", "user_id")[:limit]
+    )
+    return [{"creator_id": row["user_id"], "username": row["user__username"], "count": row["count"]} for row in rows]
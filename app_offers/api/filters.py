@@ -0,0 +1,62 @@
+from django.db.models import Exists, OuterRef
+
+from app_offers.models import Detail
+from app_offers.search import search_offers
+
+# Sort keys accepted by the `ordering` query parameter. Each one is served by a
+# composite (key, id) index on Offer; descending keys use a backward index scan.
+OFFER_ORDERINGS = (
+    "updated_at",
+    "-updated_at",
+    "min_price",
+    "-min_price",
+    "min_delivery_time",
+    "created_at",
+)
+
+
+def get_offer_order_by(ordering):
+    """
+    Returns the order_by() arguments for a whitelisted ordering, using `id`
+    (in the same direction) as tie-breaker.
+
+    Raises:
+        ValueError: If the ordering is not in OFFER_ORDERINGS.
+    """
+    if ordering not in OFFER_ORDERINGS:
+        raise ValueError(f"Unsupported ordering: {ordering}")
+    return [ordering, "-id" if ordering.startswith("-") else "id"]
+
+
+def filter_offers(queryset, params):
+    """
+    Applies the offer listing filters found in the query parameters:
+    creator_id, min_price, max_delivery_time and search.
+
+    Both keep their original "any detail" meaning without joining details, so
+    the listing stays a single scan over offers:
+    - max_delivery_time compares the denormalized min_delivery_time column
+      (range-searched via its composite index when ordering by it).
+    - min_price matches offers with at least one detail priced at or above the
+      value, via a correlated EXISTS on details (the offer's min_price alone
+      would drop offers whose cheapest tier is below it).
+
+    Raises:
+        ValueError / TypeError: If a filter value has the wrong type.
+    """
+    if "creator_id" in params and params["creator_id"]:
+        creator_id = int(params["creator_id"])
+        queryset = queryset.filter(user_id=creator_id)
+
+    if "min_price" in params and params["min_price"]:
+        min_price = float(params["min_price"])
+        queryset = queryset.filter(Exists(Detail.objects.filter(offer=OuterRef("pk"), price__gte=min_price)))
+
+    if "max_delivery_time" in params and params["max_delivery_time"]:
+        max_delivery = int(params["max_delivery_time"])
+        queryset = queryset.filter(min_delivery_time__lte=max_delivery)
+
+    if "search" in params and params["search"]:
+        queryset = search_offers(queryset, params["search"])
+
+    return queryset
@@ -1,4 +1,19 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from datetime import date
+from decimal import Decimal
+
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connection
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from app_offers.cache import get_offer_count
+
 
 class CustomPagination(PageNumberPagination):
     """
@@ -11,4 +26,331 @@ class CustomPagination(PageNumberPagination):
     """
     page_size = 6
     page_size_query_param = "page_size"
-    max_page_size = 100
\ No newline at end of file
+    max_page_size = 100
+
+
+def estimate_table_rows(model):
+    """
+    Returns the planner's row estimate for the model's table (PostgreSQL), or
+    None when no estimate is available.
+    """
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)", [model._meta.db_table])
+        row = cursor.fetchone()
+    # reltuples is -1 for tables that were never vacuumed / analyzed
+    return int(row[0]) if row and row[0] >= 0 else None
+
+
+def estimate_query_rows(queryset):
+    """
+    Returns the planner's row estimate for the queryset (PostgreSQL EXPLAIN),
+    or None when no estimate is available.
+    """
+    if connection.vendor != "postgresql":
+        return None
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedPage(Page):
+    """
+    Page whose has_next() is known from a look-ahead row instead of the total count.
+    """
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Django paginator that avoids an exact COUNT(*) over large result sets.
+
+    - Unfiltered querysets use a cheap table estimate: planner statistics on
+      PostgreSQL, else the `row_counter` callable (a maintained counter).
+    - Filtered querysets are counted exactly up to `exact_count_limit` rows
+      (COUNT over a LIMITed subquery); beyond that the planner estimate is used
+      where available, else an exact count.
+    - Small results (estimate up to `exact_count_limit`) are always counted exactly.
+
+    With an estimated count, page numbers are not checked against the (possibly
+    wrong) number of pages; pages are fetched with one extra row instead to know
+    whether a next page exists.
+    """
+    def __init__(self, object_list, per_page, row_counter=None, exact_count_limit=1000, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.row_counter = row_counter
+        self.exact_count_limit = exact_count_limit
+
+    @cached_property
+    def count_and_exactness(self):
+        queryset = self.object_list
+        limit = self.exact_count_limit
+        if not queryset.query.where:
+            estimate = estimate_table_rows(queryset.model)
+            if estimate is None and self.row_counter is not None:
+                estimate = self.row_counter()
+            if estimate is not None and estimate > limit:
+                return estimate, False
+            return queryset.count(), True
+
+        capped = queryset.order_by()[:limit + 1].count()
+        if capped <= limit:
+            return capped, True
+        estimate = estimate_query_rows(queryset)
+        if estimate is None:
+            return queryset.count(), True
+        return max(estimate, capped), False
+
+    @cached_property
+    def count(self):
+        return self.count_and_exactness[0]
+
+    @property
+    def count_is_exact(self):
+        return self.count_and_exactness[1]
+
+    def validate_number(self, number):
+        if self.count_is_exact:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        if self.count_is_exact:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedPage(rows[:self.per_page], number, self, has_more=len(rows) > self.per_page)
+
+
+class EstimatedCountPagination(CustomPagination):
+    """
+    CustomPagination returning an estimated `count` for large result sets
+    (see EstimatedCountPaginator) and a `count_is_exact` flag.
+
+    Attributes:
+        - exact_count_limit (int): Result sets up to this size are always counted exactly.
+        - row_counter (callable): Optional maintained row count of the unfiltered table.
+    """
+    exact_count_limit = 1000
+    row_counter = None
+
+    def django_paginator_class(self, object_list, per_page):
+        """
+        Builds the Django paginator used by PageNumberPagination.paginate_queryset.
+        """
+        return EstimatedCountPaginator(
+            object_list, per_page, row_counter=self.row_counter, exact_count_limit=self.exact_count_limit
+        )
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data["count_is_exact"] = self.page.paginator.count_is_exact
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_exact"] = {"type": "boolean", "example": True}
+        return response_schema
+
+
+class OfferPagination(EstimatedCountPagination):
+    """
+    Offer listing pagination; unfiltered totals on SQLite come from the
+    maintained offer count.
+    """
+    row_counter = staticmethod(get_offer_count)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination seeking on the (ordering key, id) tuple.
+    Works with model instances as well as `.values()` rows.
+
+    Instead of COUNT(*) + OFFSET, every page is fetched with a WHERE clause
+    that continues after (or before) the last seen row, so deep pages cost the
+    same as the first one. NULL keys sort wherever the database puts them.
+
+    Attributes:
+        - page_size / page_size_query_param / max_page_size: Same semantics as CustomPagination.
+        - cursor_query_param (str): Query parameter carrying the opaque cursor.
+          An empty value requests the first page.
+        - total_query_param (str): When set to true, the response includes the total count.
+        - ordering_fields (tuple): Fields that may be used as ordering key.
+    """
+    page_size = CustomPagination.page_size
+    page_size_query_param = CustomPagination.page_size_query_param
+    max_page_size = CustomPagination.max_page_size
+    cursor_query_param = "cursor"
+    total_query_param = "include_total"
+    ordering_fields = ("id", "created_at", "updated_at", "min_price", "min_delivery_time")
+    default_ordering = "id"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None, ordering=None):
+        """
+        Returns one page of the queryset ordered by `ordering` with `id` as tie-breaker.
+        """
+        self.request = request
+        self.ordering = ordering or self.default_ordering
+        self.field_name = self.ordering.lstrip("-")
+        self.descending = self.ordering.startswith("-")
+        if self.field_name not in self.ordering_fields:
+            raise ValidationError({"ordering": f"Unsupported ordering for cursor pagination: {self.ordering}"})
+
+        self.field = queryset.model._meta.get_field(self.field_name)
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+
+        self.count = None
+        if str(request.query_params.get(self.total_query_param, "")).lower() in ("1", "true", "yes"):
+            self.count = self.get_count(queryset)
+
+        backwards = bool(self.cursor and self.cursor["previous"])
+        if self.cursor:
+            queryset = queryset.filter(self.get_seek_filter(self.cursor["value"], self.cursor["id"], backwards))
+
+        rows = list(self.get_page(queryset, self.get_order_by(backwards), self.page_size + 1))
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if backwards:
+            rows.reverse()
+
+        self.next_position = rows[-1] if rows and (has_more or backwards) else None
+        self.previous_position = rows[0] if rows and (has_more if backwards else self.cursor) else None
+        return rows
+
+    def get_count(self, queryset):
+        """
+        Returns the total number of rows, for `include_total`.
+        """
+        return queryset.count()
+
+    def get_page(self, queryset, order_by, limit):
+        """
+        Orders and slices the (already seek-filtered) queryset.
+        """
+        return queryset.order_by(*order_by)[:limit]
+
+    def get_order_by(self, backwards=False):
+        """
+        Returns the ORDER BY expressions for the canonical order, or its exact
+        reverse when walking backwards. No NULLS FIRST/LAST modifiers are used,
+        so the (key, id) composite indexes can serve both directions.
+        """
+        prefix = "" if self.descending == backwards else "-"
+        if self.field_name == "id":
+            return [f"{prefix}id"]
+        return [f"{prefix}{self.field_name}", f"{prefix}id"]
+
+    def get_seek_filter(self, value, pk, backwards=False):
+        """
+        Builds the WHERE clause selecting rows after (or, when walking backwards,
+        before) the position (value, pk) in the canonical order. NULL keys are
+        placed where the database sorts them (see `nulls_order_largest`).
+        """
+        after = "gt" if self.descending == backwards else "lt"
+        name = self.field_name
+        if name == "id":
+            return Q(**{f"id__{after}": pk})
+        nulls_ahead = (connection.features.nulls_order_largest != self.descending) != backwards
+        if value is None:
+            seek = Q(**{f"{name}__isnull": True, f"id__{after}": pk})
+            return seek if nulls_ahead else seek | Q(**{f"{name}__isnull": False})
+        seek = Q(**{f"{name}__{after}": value}) | Q(**{name: value, f"id__{after}": pk})
+        if self.field.null and nulls_ahead:
+            seek |= Q(**{f"{name}__isnull": True})
+        return seek
+
+    def get_page_size(self, request):
+        """
+        Returns the requested page size, capped at max_page_size.
+        """
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def decode_cursor(self, request):
+        """
+        Decodes the opaque cursor from the query string. Returns None for the first page.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if payload["o"] != self.ordering:
+                raise ValueError("ordering mismatch")
+            value = payload["v"]
+            return {
+                "value": None if value is None else self.field.to_python(value),
+                "id": int(payload["i"]),
+                "previous": bool(payload.get("p")),
+            }
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_position(self, obj):
+        """
+        Returns the (ordering key, id) position of a model instance or `.values()` row.
+        """
+        if isinstance(obj, dict):
+            return obj[self.field_name], obj["id"]
+        return getattr(obj, self.field_name), obj.pk
+
+    def encode_cursor(self, obj, previous):
+        """
+        Returns the opaque cursor string pointing at obj.
+        """
+        value, pk = self.get_position(obj)
+        if isinstance(value, Decimal):
+            value = str(value)
+        elif isinstance(value, date):
+            value = value.isoformat()
+        payload = {"o": self.ordering, "v": value, "i": pk}
+        if previous:
+            payload["p"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def get_link(self, obj, previous):
+        if obj is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(obj, previous))
+
+    def get_next_link(self):
+        return self.get_link(self.next_position, previous=False)
+
+    def get_previous_link(self):
+        return self.get_link(self.previous_position, previous=True)
+
+    def get_paginated_response(self, data):
+        """
+        Returns next/previous cursor links and results; the count only when requested.
+        """
+        payload = {}
+        if self.count is not None:
+            payload["count"] = self.count
+        payload["next"] = self.get_next_link()
+        payload["previous"] = self.get_previous_link()
+        payload["results"] = data
+        return Response(payload)
@@ -1,6 +1,15 @@
-from django.urls import reverse
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Prefetch
 from rest_framework import serializers
+from app_offers.cache import adjust_offer_count, bump_catalog_version, detail_payload_cache, offer_payload_cache
 from app_offers.models import Offer, Detail
+from app_offers.search import get_search_backend
+from app_offers.suggest import title_index
+from core.fast_serializers import FastSerializer
+from core.images import ImageVariantsField
+from .fields import TemplateURLField, url_template
 
 REQUIRED_DETAILS_COUNT = 3
 
@@ -30,15 +39,9 @@ class DetailReadOnlySerializer(serializers.ModelSerializer):
 
     Fields:
         - id: Detail ID
-        - url: URL to access detail via API
+        - url: URL to access detail via API (built from a precompiled URL template)
     """
-    url = serializers.SerializerMethodField()
-
-    def get_url(self, obj):
-        """
-        Returns the API URL for a given detail instance.
-        """
-        return reverse('offer_details', args=[obj.pk])
+    url = TemplateURLField('offer_details')
 
     class Meta:
         model = Detail
@@ -62,6 +65,9 @@ class OfferCreateUpdateSerializer(serializers.ModelSerializer):
                     raise serializers.ValidationError({
                         "details": {i: "offer_type is required for each detail."}
                     })
+            offer_types = [detail['offer_type'] for detail in details]
+            if len(set(offer_types)) != len(offer_types):
+                raise serializers.ValidationError({"details": "Each offer_type may only appear once."})
         return attrs
 
     def validate_details(self, value):
@@ -84,36 +90,121 @@ class OfferCreateUpdateSerializer(serializers.ModelSerializer):
 
         return offer
 
+    @classmethod
+    def bulk_create(cls, user, validated_items, batch_size=500):
+        """
+        Creates many offers with their details from already validated data.
+        - Inserts all offers, then all details, with bulk_create in a single transaction.
+        - min_price / min_delivery_time are computed up front, since bulk_create
+          fires no signals; the search index is updated in one batch as well,
+          and the offer count, catalog version and suggest index once the
+          import commits.
+        - Databases that cannot return ids from bulk inserts save the offers
+          one by one instead, and their post_save handlers do all of the above.
+        - Returns the created offers in input order.
+        """
+        offers, details_per_offer = [], []
+        for data in validated_items:
+            data = dict(data)
+            details_data = data.pop('details', [])
+            offers.append(Offer(
+                user=user,
+                min_price=min((detail['price'] for detail in details_data), default=None),
+                min_delivery_time=min((detail['delivery_time_in_days'] for detail in details_data), default=None),
+                **data,
+            ))
+            details_per_offer.append(details_data)
+
+        with transaction.atomic():
+            if connection.features.can_return_rows_from_bulk_insert:
+                Offer.objects.bulk_create(offers, batch_size=batch_size)
+                get_search_backend().index_many(offers)
+                transaction.on_commit(lambda: cls.record_created(offers))
+            else:
+                for offer in offers:
+                    offer.save()
+            Detail.objects.bulk_create(
+                [
+                    Detail(offer=offer, **detail_data)
+                    for offer, details_data in zip(offers, details_per_offer)
+                    for detail_data in details_data
+                ],
+                batch_size=batch_size,
+            )
+        return offers
+
+    @staticmethod
+    def record_created(offers):
+        """
+        Applies what the Offer post_save handlers would have done for offers
+        inserted with bulk_create, apart from the search index.
+        """
+        adjust_offer_count(len(offers))
+        bump_catalog_version()
+        for offer in offers:
+            title_index.update(offer.id, offer.title)
+
     def update(self, instance, validated_data):
         """
         Updates an existing Offer and its associated Detail objects.
-        - Updates existing details based on 'offer_type'.
-        - Creates new details if they do not exist.
+        - Existing details are matched by 'offer_type'; only the fields whose
+          values actually changed are written, with a single bulk_update.
+        - New details are inserted with one bulk_create that upserts on
+          (offer, offer_type), so concurrent PATCHes cannot duplicate a tier.
+        - The written details are stored as the offer's prefetched details,
+          so the response does not query them again.
         """
         details_data = validated_data.pop('details', None)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        if validated_data or details_data is None:
+            instance.save()
 
         if details_data is not None:
-            existing_details_map = {detail.offer_type: detail for detail in instance.details.all()}
+            details_by_type = {detail.offer_type: detail for detail in instance.details.order_by('id')}
+            to_update, to_create, changed_fields = [], [], set()
 
             for detail_data in details_data:
-                offer_type = detail_data.get('offer_type', None)
-
-                if offer_type and offer_type in existing_details_map:
-                    detail_instance = existing_details_map[offer_type]
-
-                    detail_data.pop('id', None)
-
-                    for key, value in detail_data.items():
-                        setattr(detail_instance, key, value)
-                    detail_instance.save()
-
-                else:
-                    detail_data.pop('id', None)
-                    Detail.objects.create(offer=instance, **detail_data)
+                detail_data.pop('id', None)
+                detail_instance = details_by_type.get(detail_data['offer_type'])
+
+                if detail_instance is None:
+                    detail_instance = Detail(offer=instance, **detail_data)
+                    details_by_type[detail_instance.offer_type] = detail_instance
+                    to_create.append(detail_instance)
+                    continue
+
+                changed = {key for key, value in detail_data.items() if getattr(detail_instance, key) != value}
+                for key in changed:
+                    setattr(detail_instance, key, detail_data[key])
+                if changed:
+                    changed_fields |= changed
+                    to_update.append(detail_instance)
+
+            if to_update or to_create:
+                with transaction.atomic():
+                    if to_update:
+                        Detail.objects.bulk_update(to_update, sorted(changed_fields))
+                    if to_create:
+                        Detail.objects.bulk_create(
+                            to_create,
+                            update_conflicts=True,
+                            unique_fields=['offer', 'offer_type'],
+                            update_fields=[field for field in DetailSerializer.Meta.fields if field not in ('id', 'offer_type')],
+                        )
+                    # bulk operations send no signals
+                    instance.refresh_min_values()
+                bump_catalog_version()
+                offer_payload_cache.invalidate(instance.pk)
+                detail_payload_cache.invalidate(*(detail.pk for detail in details_by_type.values()))
+
+            details = instance.details.all()
+            details._result_cache = sorted(details_by_type.values(), key=lambda detail: detail.pk)
+            details._prefetch_done = True
+            if not hasattr(instance, '_prefetched_objects_cache'):
+                instance._prefetched_objects_cache = {}
+            instance._prefetched_objects_cache['details'] = details
 
         return instance
 
@@ -151,8 +242,10 @@ class OfferSerializer(serializers.ModelSerializer):
     - min_price
     - min_delivery_time
     - user_details (first name, last name, username)
+    - image_thumbnails (generated thumbnail URLs per size and format)
     """
     details = DetailReadOnlySerializer(many=True, read_only=True)
+    image_thumbnails = ImageVariantsField(source='image_variants')
     min_price = serializers.DecimalField(max_digits=16, decimal_places=2, read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
     user_details = serializers.SerializerMethodField()
@@ -164,6 +257,7 @@ class OfferSerializer(serializers.ModelSerializer):
             'user',
             'title',
             'image',
+            'image_thumbnails',
             'description',
             'created_at',
             'updated_at',
@@ -173,6 +267,22 @@ class OfferSerializer(serializers.ModelSerializer):
             'user_details'
         ]
 
+    @staticmethod
+    def prefetch_queryset(queryset, fields=None):
+        """
+        Eager-loads everything this serializer touches (user, profile and detail ids),
+        so serializing a page costs a fixed number of queries regardless of its size.
+        With a sparse fieldset, the profile join and the details prefetch are only
+        added when user_details / details are selected.
+        """
+        if fields is None or 'user_details' in fields:
+            queryset = queryset.select_related('user__profile')
+        if fields is None or 'details' in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch('details', queryset=Detail.objects.only('id', 'offer_id').order_by('id'))
+            )
+        return queryset
+
     def get_user_details(self, obj):
         """
         Retrieves user profile information (first name, last name, username) for the offer.
@@ -185,3 +295,87 @@ class OfferSerializer(serializers.ModelSerializer):
             'last_name': profile.last_name if profile else '',
             'username': obj.user.username
         }
+
+
+class OfferFastSerializer(FastSerializer):
+    """
+    Dict-based fast path producing the same output as OfferSerializer.
+    Detail ids for the whole page are loaded with one extra query, unless
+    `details` is left out of the fieldset.
+    """
+    serializer_class = OfferSerializer
+    represent_values = {
+        'details': ('id',),
+        'user_details': ('user__username', 'user__profile__first_name', 'user__profile__last_name'),
+    }
+
+    def load_related(self, rows):
+        self.detail_ids = defaultdict(list)
+        offer_ids = [row['id'] for row in rows] if self.includes('details') else []
+        if offer_ids:
+            details = Detail.objects.filter(offer_id__in=offer_ids).order_by('id').values_list('offer_id', 'id')
+            for offer_id, detail_id in details:
+                self.detail_ids[offer_id].append(detail_id)
+
+    def represent_details(self, row):
+        template = url_template('offer_details')
+        return [{'id': detail_id, 'url': template.format(detail_id)} for detail_id in self.detail_ids[row['id']]]
+
+    def represent_user_details(self, row):
+        return {
+            'first_name': row['user__profile__first_name'] or '',
+            'last_name': row['user__profile__last_name'] or '',
+            'username': row['user__username']
+        }
+
+
+class OfferExportSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the catalog export: offer fields with their full nested details.
+    """
+    details = DetailSerializer(many=True, read_only=True)
+    min_price = serializers.DecimalField(max_digits=16, decimal_places=2, read_only=True)
+    min_delivery_time = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Offer
+        fields = [
+            'id',
+            'user',
+            'title',
+            'image',
+            'description',
+            'created_at',
+            'updated_at',
+            'min_price',
+            'min_delivery_time',
+            'details',
+        ]
+
+
+class DetailFastSerializer(FastSerializer):
+    """
+    Dict-based fast path producing the same output as DetailSerializer.
+    """
+    serializer_class = DetailSerializer
+    extra_values = ('offer_id',)
+
+
+class OfferExportFastSerializer(FastSerializer):
+    """
+    Dict-based fast path producing the same output as OfferExportSerializer.
+    The details of all rows passed to serialize() are loaded with one extra query.
+    """
+    serializer_class = OfferExportSerializer
+
+    def load_related(self, rows):
+        self.details = defaultdict(list)
+        offer_ids = [row['id'] for row in rows]
+        if offer_ids:
+            detail_serializer = DetailFastSerializer()
+            detail_rows = list(detail_serializer.prepare(Detail.objects.filter(offer_id__in=offer_ids).order_by('id')))
+            for row, detail in zip(detail_rows, detail_serializer.serialize(detail_rows)):
+                self.details[row['offer_id']].append(detail)
+
+    def represent_details(self, row):
+        return self.details[row['id']]
@@ -1,9 +1,14 @@
 from django.urls import path
 
-from app_offers.api.views import OffersView, OfferView, OfferDetailView
+from app_offers.api.views import OffersView, OfferBulkCreateView, OfferCacheStatsView, OfferExportView, OfferFacetsView, OfferSuggestView, OfferView, OfferDetailView
 
 urlpatterns = [
     path('api/offers/', OffersView.as_view(), name='offers'),
+    path('api/offers/bulk/', OfferBulkCreateView.as_view(), name='offer_bulk_create'),
+    path('api/offers/export/', OfferExportView.as_view(), name='offer_export'),
+    path('api/offers/cache-stats/', OfferCacheStatsView.as_view(), name='offer_cache_stats'),
+    path('api/offers/suggest/', OfferSuggestView.as_view(), name='offer_suggest'),
+    path('api/offers/facets/', OfferFacetsView.as_view(), name='offer_facets'),
     path('api/offers/<int:id>/', OfferView.as_view(), name='offer'),
     path('api/offerdetails/<int:id>/', OfferDetailView.as_view(), name='offer_details'),
 ]
\ No newline at end of file
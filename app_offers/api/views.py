@@ -1,24 +1,59 @@
-from django.db.models import Min, Q
+import os
+
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
 from rest_framework import status
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.generics import get_object_or_404
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework.settings import api_settings
 from rest_framework.response import Response
+from rest_framework.serializers import as_serializer_error
 from rest_framework.views import APIView
 
 from app_authentication.api.permissions import IsBusinessUser, IsProfileOwnerOrReadOnly
+from app_offers.cache import (
+    catalog_version_is_shared, detail_payload_cache, get_catalog_modified, offer_facets_cache, offer_list_cache,
+    offer_payload_cache,
+)
 from app_offers.models import Offer, Detail
-from .pagination import CustomPagination
-from .serializers import OfferSerializer, OfferCreateUpdateSerializer, OfferReadOnlySerializer, DetailSerializer
+from app_offers.suggest import title_index
+from core.conditional import make_etag, not_modified_response, set_validators
+from core.fast_serializers import FastSerializationMixin
+from core.fieldsets import get_fieldset, select_fields
+from .export import EXPORT_FORMATS, get_export_queryset, iter_offers
+from .facets import DEFAULT_CREATOR_LIMIT, DEFAULT_PRICE_BUCKET_SIZE, creator_counts, delivery_time_buckets, price_histogram
+from .filters import OFFER_ORDERINGS, filter_offers, get_offer_order_by
+from .pagination import KeysetPagination, OfferPagination
+from .parsers import NDJSONParser
+from .serializers import (
+    OfferSerializer, OfferFastSerializer, OfferCreateUpdateSerializer, OfferReadOnlySerializer, DetailSerializer
+)
 
 
-class OffersView(APIView):
+def fieldset_response(request, payload, fields=None):
+    """
+    Builds the conditional response for a cached {"data", "etag", "last_modified"}
+    payload, cut down to a sparse fieldset. Every fieldset gets its own ETag.
+    """
+    etag = payload["etag"] if fields is None else make_etag(payload["etag"], *fields)
+    not_modified = not_modified_response(request, etag, payload["last_modified"])
+    if not_modified is not None:
+        return not_modified
+    data = select_fields(payload["data"], fields)
+    return set_validators(Response(data, status=status.HTTP_200_OK), etag, payload["last_modified"])
+
+
+class OffersView(FastSerializationMixin, APIView):
     """
     API view to list all offers or create a new offer.
 
     - GET: List all offers with optional filtering, searching, and ordering.
     - POST: Create a new offer (only accessible by business users).
     """
-    pagination_class = CustomPagination
+    pagination_class = OfferPagination
+    cursor_pagination_class = KeysetPagination
+    fast_serializer_class = OfferFastSerializer
 
     def get_permissions(self):
         """
@@ -33,52 +68,112 @@ class OffersView(APIView):
     def get(self, request):
         """
         Handles GET requests to list offers.
-        - Annotates offers with minimum price and delivery time.
-        - Applies optional filters: creator_id, min_price, max_delivery_time, search.
-        - Supports ordering by query parameter.
-        - Paginates results using CustomPagination.
+        - Unchanged listings are answered with 304 before serialization, see get_validators.
+        - Anonymous requests are served from the versioned listing cache when possible
+          (X-Cache: HIT / MISS); any offer, detail or profile write invalidates it.
         """
-        queryset = Offer.objects.all().annotate(
-            min_price_annotated=Min("details__price"),
-            min_delivery_time_annotated=Min("details__delivery_time_in_days"),
-        )
+        etag, last_modified = self.get_validators(request)
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
 
-        params = request.query_params
+        if request.user.is_authenticated:
+            response = self.list_offers(request)
+        else:
+            data = offer_list_cache.get(request)
+            if data is not None:
+                response = Response(data, headers={"X-Cache": "HIT"})
+            else:
+                response = self.list_offers(request)
+                if response.status_code == status.HTTP_200_OK:
+                    offer_list_cache.set(request, response.data)
+                response["X-Cache"] = "MISS"
 
+        if response.status_code == status.HTTP_200_OK:
+            set_validators(response, etag, last_modified)
+        return response
+
+    @staticmethod
+    def get_validators(request):
+        """
+        Returns the listing's (etag, last_modified).
+        - From the catalog version when it is kept in a shared cache (no query).
+        - Otherwise from one aggregate query over the filtered offers: the latest
+          offer, user and profile updated_at plus the count, which also changes
+          on deletes. Detail writes touch their offer's updated_at.
+        - (None, None) for invalid filters; the listing answers those with 400.
+        """
+        if catalog_version_is_shared():
+            return make_etag(offer_list_cache.get_key(request)), get_catalog_modified()
         try:
-            if "creator_id" in params and params["creator_id"]:
-                creator_id = int(params["creator_id"])
-                queryset = queryset.filter(user_id=creator_id)
+            queryset = filter_offers(Offer.objects.all(), request.query_params)
+        except (ValueError, TypeError):
+            return None, None
+        state = queryset.order_by().aggregate(
+            count=Count("id"),
+            offers=Max("updated_at"),
+            users=Max("user__updated_at"),
+            profiles=Max("user__profile__updated_at"),
+        )
+        timestamps = [state["offers"], state["users"], state["profiles"]]
+        etag = make_etag("offers", offer_list_cache.get_fingerprint(request), state["count"], *timestamps)
+        return etag, max((value for value in timestamps if value is not None), default=None)
 
-            if "min_price" in params and params["min_price"]:
-                min_price = float(params["min_price"])
-                queryset = queryset.filter(details__price__gte=min_price)
+    def list_offers(self, request):
+        """
+        Builds the offer listing response.
+        - Reads the denormalized min_price / min_delivery_time columns (no aggregation).
+        - Eager-loads users, profiles and detail ids in a fixed number of queries.
+        - Serializes through `fast_serializer_class` (dict rows) when set, else OfferSerializer.
+        - `fields` / `exclude` select a sparse fieldset (400 for unknown fields); only
+          the columns, joins and prefetches the selected fields need are loaded.
+        - Applies optional filters: creator_id, min_price, max_delivery_time, search.
+        - `search` uses the full-text index with prefix matching per term.
+        - Supports ordering by one of OFFER_ORDERINGS (400 otherwise); search results
+          default to relevance order.
+        - Paginates results using OfferPagination (estimated counts on large result
+          sets), or KeysetPagination when a `cursor` parameter is present (an empty
+          cursor requests the first page).
+        """
+        fields = get_fieldset(request, OfferSerializer)
+        queryset = OfferSerializer.prefetch_queryset(Offer.objects.all(), fields)
 
-            if "max_delivery_time" in params and params["max_delivery_time"]:
-                max_delivery = int(params["max_delivery_time"])
-                queryset = queryset.filter(details__delivery_time_in_days__lte=max_delivery)
+        params = request.query_params
 
+        try:
+            queryset = filter_offers(queryset, params)
         except (ValueError, TypeError):
             return Response(
                 {"detail": "Invalid query parameter type."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        if "search" in params and params["search"]:
-            search = params["search"]
-            queryset = queryset.filter(Q(title__icontains=search) | Q(description__icontains=search))
-
         ordering = params.get("ordering")
+        if ordering and ordering not in OFFER_ORDERINGS:
+            return Response(
+                {"detail": f"Invalid ordering. Allowed values: {', '.join(OFFER_ORDERINGS)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if KeysetPagination.cursor_query_param in params:
+            paginator = self.cursor_pagination_class()
+            # cursors are built from the ordering key and id of the page's rows
+            cursor_values = ("id", (ordering or paginator.default_ordering).lstrip("-"))
+            page = paginator.paginate_queryset(
+                self.prepare_queryset(queryset, fields, cursor_values), request, view=self, ordering=ordering
+            )
+            return paginator.get_paginated_response(self.serialize_rows(page, OfferSerializer, fields))
+
         if ordering:
-            queryset = queryset.order_by(ordering)
+            queryset = queryset.order_by(*get_offer_order_by(ordering))
+        elif params.get("search"):
+            queryset = queryset.order_by("search_rank", "id")
         else:
             queryset = queryset.order_by("id")
 
         paginator = self.pagination_class()
-        page = paginator.paginate_queryset(queryset, request)
-
-        serializer = OfferSerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        page = paginator.paginate_queryset(self.prepare_queryset(queryset, fields), request)
+        return paginator.get_paginated_response(self.serialize_rows(page, OfferSerializer, fields))
 
     def post(self, request):
         """
@@ -94,6 +189,205 @@ class OffersView(APIView):
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
 
+class OfferBulkCreateView(APIView):
+    """
+    API view to create many offers in one request.
+
+    - POST: Bulk create offers from a JSON array or an NDJSON body (only accessible by business users).
+    """
+    permission_classes = [IsBusinessUser]
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, NDJSONParser]
+    max_items = 1000
+
+    def post(self, request):
+        """
+        Handles POST requests to bulk create offers.
+        - Every item is validated up front with the regular offer serializer.
+        - All valid items are inserted with bulk_create in a single transaction.
+        - Returns per-item results: 201 if all items were created, 207 if some
+          failed validation and 400 if none could be created.
+        """
+        items = request.data
+        if not isinstance(items, list):
+            return Response({"detail": "Expected a JSON array or NDJSON body of offers."}, status=status.HTTP_400_BAD_REQUEST)
+        if not items:
+            return Response({"detail": "No offers provided."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.max_items:
+            return Response({"detail": f"At most {self.max_items} offers can be created per request."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # One serializer instance validates every item (like ListSerializer does),
+        # so the field set is built once instead of once per offer.
+        serializer = OfferCreateUpdateSerializer(context={'request': request})
+        results, valid_indexes, valid_items = [], [], []
+        for index, item in enumerate(items):
+            try:
+                valid_items.append(serializer.run_validation(item))
+            except ValidationError as exc:
+                results.append({"index": index, "status": "error", "errors": as_serializer_error(exc)})
+            else:
+                valid_indexes.append(index)
+                results.append(None)
+
+        if valid_items:
+            offers = OfferCreateUpdateSerializer.bulk_create(request.user, valid_items)
+            for index, offer in zip(valid_indexes, offers):
+                results[index] = {"index": index, "status": "created", "id": offer.id}
+
+        created, errors = len(valid_items), len(items) - len(valid_items)
+        if not created:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif errors:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+        return Response({"created": created, "errors": errors, "results": results}, status=response_status)
+
+
+class OfferExportView(APIView):
+    """
+    API view streaming the whole (filtered) offer catalog in one response.
+
+    - GET: Export offers with their details as NDJSON or CSV.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        Handles GET requests for the catalog export.
+        - `export_format` selects ndjson (default) or csv; `format` is reserved
+          by DRF for content negotiation.
+        - Accepts the same filters and ordering as the offer listing.
+        - Streams the response while reading offers in chunks, so memory stays
+          flat regardless of the catalog size.
+        """
+        params = request.query_params
+        export_format = params.get("export_format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"Invalid export_format. Allowed values: {', '.join(EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        ordering = params.get("ordering")
+        if ordering and ordering not in OFFER_ORDERINGS:
+            return Response(
+                {"detail": f"Invalid ordering. Allowed values: {', '.join(OFFER_ORDERINGS)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            queryset = get_export_queryset(params)
+        except (ValueError, TypeError):
+            return Response(
+                {"detail": "Invalid query parameter type."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        content_type, render, filename = EXPORT_FORMATS[export_format]
+        response = StreamingHttpResponse(render(iter_offers(queryset)), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class OfferSuggestView(APIView):
+    """
+    API view returning offer title completions for the search box.
+
+    - GET: Up to `limit` offers whose title (or one of its leading words) starts with `q`.
+    """
+    permission_classes = [AllowAny]
+    default_limit = 8
+    max_limit = 20
+
+    def get(self, request):
+        """
+        Handles GET requests for title suggestions.
+        - Served from the in-memory title prefix index, without database access
+          (except for the periodic index rebuild).
+        - `limit` defaults to 8 (max 20).
+        """
+        query = request.query_params.get("q", "")
+        try:
+            limit = min(int(request.query_params.get("limit", self.default_limit)), self.max_limit)
+        except (TypeError, ValueError):
+            return Response({"detail": "Invalid query parameter type."}, status=status.HTTP_400_BAD_REQUEST)
+        if limit < 1:
+            return Response({"detail": "limit must be positive."}, status=status.HTTP_400_BAD_REQUEST)
+
+        title_index.ensure_fresh()
+        results = [{"id": offer_id, "title": title} for offer_id, title in title_index.suggest(query, limit)]
+        return Response({"query": query, "results": results})
+
+
+class OfferCacheStatsView(APIView):
+    """
+    API view exposing the offer cache counters (staff only).
+
+    - GET: Hit/miss counters and hit ratios of the listing, facets and payload caches.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        """
+        Handles GET requests for cache statistics.
+        - Listing and facets counters are shared between workers; payload cache
+          counters (and local LRU sizes) are those of the answering process.
+        """
+        return Response({
+            "pid": os.getpid(),
+            "offer_list": offer_list_cache.stats(),
+            "offer_facets": offer_facets_cache.stats(),
+            "offer_payloads": offer_payload_cache.stats(),
+            "detail_payloads": detail_payload_cache.stats(),
+        })
+
+
+class OfferFacetsView(APIView):
+    """
+    API view returning filter-sidebar facets for the current offer filter/search set.
+
+    - GET: min_price histogram, delivery-time buckets and per-creator counts.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        Handles GET requests for offer facets.
+        - Accepts the same filters as the offer listing (creator_id, min_price,
+          max_delivery_time, search).
+        - `price_bucket_size` sets the histogram bucket width (default 50),
+          `creator_limit` the number of creators returned (default 20, max 100).
+        - Each facet is computed with a single grouped query; anonymous
+          responses are cached like the listing.
+        """
+        cached = not request.user.is_authenticated
+        if cached:
+            data = offer_facets_cache.get(request)
+            if data is not None:
+                return Response(data, headers={"X-Cache": "HIT"})
+
+        params = request.query_params
+        try:
+            queryset = filter_offers(Offer.objects.all(), params)
+            bucket_size = int(params.get("price_bucket_size") or DEFAULT_PRICE_BUCKET_SIZE)
+            creator_limit = int(params.get("creator_limit") or DEFAULT_CREATOR_LIMIT)
+            if bucket_size <= 0 or not 0 < creator_limit <= 100:
+                raise ValueError("out of range")
+        except (ValueError, TypeError):
+            return Response(
+                {"detail": "Invalid query parameter type."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = {
+            "min_price": price_histogram(queryset, bucket_size),
+            "delivery_time": delivery_time_buckets(queryset),
+            "creators": creator_counts(queryset, creator_limit),
+        }
+        if not cached:
+            return Response(data, status=status.HTTP_200_OK)
+        offer_facets_cache.set(request, data)
+        return Response(data, status=status.HTTP_200_OK, headers={"X-Cache": "MISS"})
+
+
 class OfferView(APIView):
     """
     API view for retrieving, updating, or deleting a single offer.
@@ -114,18 +408,36 @@ class OfferView(APIView):
     def get(self, request, id):
         """
         Retrieves a single offer by ID.
-        - Annotates with minimum price and delivery time.
+        - Serves the serialized offer and its validators from offer_payload_cache
+          (per-process LRU over the shared cache); loads user, profile and details
+          eagerly on a miss.
+        - Answers 304 when the ETag / Last-Modified validators (offer, user and
+          profile timestamps) match.
+        - `fields` / `exclude` select a sparse fieldset, cut from the cached payload.
         - Returns serialized offer data.
         """
-        offer = get_object_or_404(
-            Offer.objects.annotate(
-                min_price_annotated=Min("details__price"),
-                min_delivery_time_annotated=Min("details__delivery_time_in_days"),
-            ),
-            pk=id
-        )
-        serializer = OfferSerializer(offer)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        fields = get_fieldset(request, OfferSerializer)
+        payload = offer_payload_cache.get_or_load(id, lambda: self.load_payload(id))
+        if payload is None:
+            raise NotFound()
+        return fieldset_response(request, payload, fields)
+
+    @staticmethod
+    def load_payload(id):
+        """
+        Loads and serializes one offer together with its validators (offer,
+        user and profile timestamps), or returns None if it does not exist.
+        """
+        offer = OfferSerializer.prefetch_queryset(Offer.objects.all()).filter(pk=id).first()
+        if offer is None:
+            return None
+        profile = getattr(offer.user, "profile", None)
+        versions = (offer.updated_at, offer.user.updated_at, profile.updated_at if profile else None)
+        return {
+            "data": OfferSerializer(offer).data,
+            "etag": make_etag("offer", id, *versions),
+            "last_modified": max(v for v in versions if v is not None),
+        }
 
     def patch(self, request, id):
         """
@@ -165,8 +477,29 @@ class OfferDetailView(APIView):
     def get(self, request, id):
         """
         Retrieves a single detail by ID.
+        - Serves the serialized detail and its validators from detail_payload_cache.
+        - Answers 304 when the validators match; detail writes touch the parent
+          offer's updated_at, which therefore versions the detail as well.
+        - `fields` / `exclude` select a sparse fieldset, cut from the cached payload.
         - Returns serialized detail data.
         """
-        detail = get_object_or_404(Detail, pk=id)
-        serializer = DetailSerializer(detail)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        fields = get_fieldset(request, DetailSerializer)
+        payload = detail_payload_cache.get_or_load(id, lambda: self.load_payload(id))
+        if payload is None:
+            raise NotFound()
+        return fieldset_response(request, payload, fields)
+
+    @staticmethod
+    def load_payload(id):
+        """
+        Loads and serializes one detail together with its validators, or
+        returns None if it does not exist.
+        """
+        detail = Detail.objects.select_related("offer").only("offer__updated_at", *DetailSerializer.Meta.fields).filter(pk=id).first()
+        if detail is None:
+            return None
+        return {
+            "data": DetailSerializer(detail).data,
+            "etag": make_etag("detail", id, detail.offer.updated_at),
+            "last_modified": detail.offer.updated_at,
+        }
@@ -1,6 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class AppOffersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app_offers'
+
+    def ready(self):
+        from app_offers import signals
+        post_migrate.connect(signals.setup_search_index, sender=self)
@@ -0,0 +1,284 @@
+import hashlib
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+from app_offers.models import Detail, Offer
+from core.lru import LocalLRUCache
+
+CATALOG_VERSION_KEY = "offers:catalog_version"
+CATALOG_MODIFIED_KEY = "offers:catalog_modified"
+OFFER_COUNT_KEY = "offers:row_count"
+# The maintained offer count is re-counted at most this often (seconds), which
+# corrects drift from writes that bypass signals (raw SQL, racing first counts).
+OFFER_COUNT_TIMEOUT = 3600
+
+
+def _initial_version():
+    # Seeded from the clock so a version lost with the cache is never reused,
+    # which would make stale ETags and cache keys valid again.
+    return int(time.time() * 1000)
+
+
+def get_catalog_version():
+    """
+    Returns the global catalog version, initialising it on first use.
+    """
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, _initial_version(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def catalog_version_is_shared():
+    """
+    Returns True if the catalog version is kept in a cache shared by all workers.
+    With a per-process backend (locmem, dummy) each worker has its own version,
+    which misses the writes handled by the other workers.
+    """
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def get_catalog_modified():
+    """
+    Returns when the catalog version was last bumped (now, if unknown).
+    """
+    timestamp = cache.get(CATALOG_MODIFIED_KEY)
+    if timestamp is None:
+        timestamp = time.time()
+        cache.add(CATALOG_MODIFIED_KEY, timestamp, timeout=None)
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def bump_catalog_version():
+    """
+    Increments the global catalog version, invalidating every cached listing.
+    """
+    cache.set(CATALOG_MODIFIED_KEY, time.time(), timeout=None)
+    try:
+        return cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.add(CATALOG_VERSION_KEY, _initial_version(), timeout=None)
+        return cache.incr(CATALOG_VERSION_KEY)
+
+
+def get_offer_count():
+    """
+    Returns the maintained number of offers, counting them once if unknown.
+    """
+    count = cache.get(OFFER_COUNT_KEY)
+    if count is None:
+        count = Offer.objects.count()
+        cache.add(OFFER_COUNT_KEY, count, timeout=OFFER_COUNT_TIMEOUT)
+    return count
+
+
+def adjust_offer_count(delta):
+    """
+    Adds `delta` to the maintained offer count, if it is currently known.
+    """
+    try:
+        if delta >= 0:
+            cache.incr(OFFER_COUNT_KEY, delta)
+        else:
+            cache.decr(OFFER_COUNT_KEY, -delta)
+    except ValueError:
+        pass
+
+
+def reset_offer_count():
+    """
+    Forgets the maintained offer count; the next read counts the offers again.
+    """
+    cache.delete(OFFER_COUNT_KEY)
+
+
+class VersionedResponseCache:
+    """
+    Response cache keyed by the normalized query parameters and the catalog version.
+
+    Bumping the catalog version makes every previously stored entry unreachable;
+    stale entries simply expire after `timeout` seconds. Hit and miss counters
+    are kept in the cache itself so they are shared between workers.
+
+    Attributes:
+        - namespace (str): Prefix of all keys written by this cache.
+        - query_params (tuple): Query parameters that affect the response.
+    """
+    def __init__(self, namespace, query_params):
+        self.namespace = namespace
+        self.query_params = tuple(sorted(query_params))
+
+    @property
+    def timeout(self):
+        return settings.OFFERS_CACHE_TIMEOUT
+
+    def get_fingerprint(self, request):
+        """
+        Returns a digest of the host and the relevant query parameters.
+        """
+        params = [(name, request.query_params.getlist(name)) for name in self.query_params if name in request.query_params]
+        fingerprint = json.dumps([request.get_host(), params], separators=(",", ":"))
+        return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+    def get_key(self, request):
+        """
+        Builds the cache key from host, catalog version and the relevant query parameters.
+        """
+        return f"{self.namespace}:{get_catalog_version()}:{self.get_fingerprint(request)}"
+
+    def get(self, request):
+        """
+        Returns the cached response data for the request, or None.
+        """
+        data = cache.get(self.get_key(request))
+        self._count("hits" if data is not None else "misses")
+        return data
+
+    def set(self, request, data):
+        """
+        Stores the response data for the request.
+        """
+        cache.set(self.get_key(request), data, timeout=self.timeout)
+
+    def stats(self):
+        """
+        Returns the shared hit/miss counters and the resulting hit ratio.
+        """
+        hits = cache.get(f"{self.namespace}:stats:hits", 0)
+        misses = cache.get(f"{self.namespace}:stats:misses", 0)
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_ratio": hits / total if total else 0.0}
+
+    def _count(self, name):
+        key = f"{self.namespace}:stats:{name}"
+        if not cache.add(key, 1, timeout=None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, timeout=None)
+
+
+offer_list_cache = VersionedResponseCache(
+    "offers:list",
+    ("creator_id", "min_price", "max_delivery_time", "search", "ordering", "page", "page_size",
+     "cursor", "include_total", "fields", "exclude"),
+)
+
+offer_facets_cache = VersionedResponseCache(
+    "offers:facets",
+    ("creator_id", "min_price", "max_delivery_time", "search", "price_bucket_size", "creator_limit"),
+)
+
+
+class PayloadCache:
+    """
+    Read-through cache for serialized single-object payloads.
+
+    Two layers: a per-process LocalLRUCache (bounded, short TTL) over the shared
+    Django cache. Shared entries are keyed by object id and a per-object version
+    token; invalidate() replaces the token, which makes the old shared entry
+    unreachable in every process, and evicts the local entry of this process.
+    Other processes may serve their local copy for up to PAYLOAD_CACHE_LOCAL_TTL
+    seconds; pass local=False for payloads that must be fresh in every process.
+
+    Attributes:
+        - namespace (str): Prefix of all keys written by this cache.
+    """
+    def __init__(self, namespace, local=True):
+        self.namespace = namespace
+        max_entries = settings.PAYLOAD_CACHE_MAX_ENTRIES if local else 0
+        self.local = LocalLRUCache(max_entries, settings.PAYLOAD_CACHE_LOCAL_TTL)
+        self.shared_hits = self.shared_misses = 0
+
+    def version_key(self, pk):
+        return f"{self.namespace}:version:{pk}"
+
+    def get_version(self, pk):
+        """
+        Returns the current version token of an object, initialising it on first use.
+        """
+        key = self.version_key(pk)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            version = cache.get(key)
+        return version
+
+    def get_or_load(self, pk, loader):
+        """
+        Returns the cached payload for pk, calling `loader()` on a miss.
+        A loader result of None (object does not exist) is not cached.
+        """
+        payload = self.local.get(pk)
+        if payload is not None:
+            return payload
+        key = f"{self.namespace}:{pk}:{self.get_version(pk)}"
+        payload = cache.get(key)
+        if payload is None:
+            self.shared_misses += 1
+            payload = loader()
+            if payload is None:
+                return None
+            cache.set(key, payload, timeout=settings.PAYLOAD_CACHE_TIMEOUT)
+        else:
+            self.shared_hits += 1
+        self.local.set(pk, payload)
+        return payload
+
+    def invalidate(self, *pks):
+        """
+        Makes the cached payloads of the given objects unreachable.
+        """
+        if not pks:
+            return
+
+        def bump():
+            cache.set_many({self.version_key(pk): uuid.uuid4().hex for pk in pks}, timeout=None)
+            for pk in pks:
+                self.local.delete(pk)
+        # Once now, and again after commit: a concurrent read may otherwise cache
+        # the pre-commit state under the new version.
+        bump()
+        transaction.on_commit(bump)
+
+    def stats(self):
+        """
+        Returns local (this process) and shared layer counters with hit ratios.
+        """
+        local = self.local.stats()
+        total = self.shared_hits + self.shared_misses
+        return {
+            "local": local,
+            "shared": {
+                "hits": self.shared_hits,
+                "misses": self.shared_misses,
+                "hit_ratio": self.shared_hits / total if total else 0.0,
+            },
+            "hit_ratio": (local["hits"] + self.shared_hits) / (local["hits"] + local["misses"]) if local["hits"] + local["misses"] else 0.0,
+        }
+
+
+offer_payload_cache = PayloadCache("offers:payload")
+detail_payload_cache = PayloadCache("offers:detail_payload")
+
+
+def invalidate_offer_payloads(offer_ids, detail_ids=()):
+    """
+    Invalidates the cached payloads of the given offers and of all their
+    details (a detail's validators derive from its offer), plus `detail_ids`.
+    """
+    offer_ids = list(offer_ids)
+    offer_payload_cache.invalidate(*offer_ids)
+    detail_ids = set(detail_ids)
+    if offer_ids:
+        detail_ids.update(Detail.objects.filter(offer_id__in=offer_ids).values_list("id", flat=True))
+    detail_payload_cache.invalidate(*detail_ids)
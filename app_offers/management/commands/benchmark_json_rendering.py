@@ -0,0 +1,70 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from app_offers.api.serializers import OfferCreateUpdateSerializer, OfferExportSerializer
+from app_offers.api.views import OffersView
+from app_offers.models import Offer
+from core.renderers import FastJSONRenderer
+
+from .benchmark_offer_import import Rollback, discard_rolled_back_offers, sample_offer
+
+
+class Command(BaseCommand):
+    """
+    Compares DRF's stdlib JSONRenderer with FastJSONRenderer on a 100-offer
+    listing page and on the same offers with their full details (prices,
+    timestamps and `features`). Both renderers must produce identical bytes.
+    The offers are created inside a transaction that is rolled back.
+    """
+    help = "Benchmark FastJSONRenderer against DRF's JSONRenderer on offer payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=100, help="Number of offers per payload (max 100).")
+        parser.add_argument("--rounds", type=int, default=200, help="Renders per renderer and payload.")
+
+    def handle(self, *args, **options):
+        count, rounds = min(options["count"], OffersView.pagination_class.max_page_size), options["rounds"]
+        try:
+            with transaction.atomic():
+                user = get_user_model().objects.create(username="__benchmark_json__", type="business")
+                serializer = OfferCreateUpdateSerializer()
+                OfferCreateUpdateSerializer.bulk_create(user, [serializer.run_validation(sample_offer(i)) for i in range(count)])
+
+                request = APIRequestFactory().get("/api/offers/", {"creator_id": user.id, "page_size": count})
+                page = OffersView.as_view()(request).data
+                # a plain prefetch: OfferSerializer's only loads the detail ids
+                offers = Offer.objects.filter(user=user).prefetch_related("details")
+                payloads = {
+                    "Listing page": page,
+                    "Offers with details": OfferExportSerializer(offers, many=True).data,
+                }
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            discard_rolled_back_offers()
+
+        for name, data in payloads.items():
+            stdlib, fast = JSONRenderer(), FastJSONRenderer()
+            if stdlib.render(data) != fast.render(data):
+                raise CommandError(f"{name}: renderers produced different output.")
+            stdlib_seconds = self.time_render(stdlib, data, rounds)
+            fast_seconds = self.time_render(fast, data, rounds)
+            size = len(fast.render(data))
+            self.stdout.write(
+                f"{name} ({size:,} bytes): JSONRenderer {stdlib_seconds / rounds * 1000:.3f} ms, "
+                f"FastJSONRenderer {fast_seconds / rounds * 1000:.3f} ms"
+            )
+            self.stdout.write(self.style.SUCCESS(f"{name} speedup: {stdlib_seconds / fast_seconds:.1f}x"))
+
+    @staticmethod
+    def time_render(renderer, data, rounds):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            renderer.render(data)
+        return time.perf_counter() - started
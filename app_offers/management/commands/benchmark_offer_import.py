@@ -0,0 +1,88 @@
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from app_offers.api.views import OfferBulkCreateView, OffersView
+from app_offers.cache import bump_catalog_version, reset_offer_count
+from app_offers.suggest import title_index
+
+
+class Rollback(Exception):
+    pass
+
+
+def discard_rolled_back_offers():
+    """
+    The Offer signal handlers update the shared offer count and catalog version
+    and this process's suggest index right away, also for offers whose
+    transaction is rolled back. Drops that state, so it is rebuilt from the
+    database on next use.
+    """
+    reset_offer_count()
+    bump_catalog_version()
+    title_index.clear()
+
+
+def sample_offer(index):
+    return {
+        "title": f"Benchmark offer {index}",
+        "description": "Imported offer used to benchmark offer creation.",
+        "details": [
+            {"title": tier.title(), "revisions": revisions, "delivery_time_in_days": days,
+             "price": price, "features": ["Logo", "Visitenkarte"], "offer_type": tier}
+            for tier, revisions, days, price in (
+                ("basic", 1, 7, 100), ("standard", 3, 5, 200), ("premium", -1, 3, 500),
+            )
+        ],
+    }
+
+
+class Command(BaseCommand):
+    """
+    Compares creating offers one POST /api/offers/ request at a time with a
+    single POST /api/offers/bulk/ request. Everything runs inside a transaction
+    that is rolled back, so the database is left untouched, and the caches the
+    created offers went into are reset afterwards.
+    """
+    help = "Benchmark the bulk offer import against the single-offer POST loop."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=200, help="Number of offers to create per run.")
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        payload = [sample_offer(index) for index in range(count)]
+        factory = APIRequestFactory()
+        try:
+            with transaction.atomic():
+                user = get_user_model().objects.create(username="__benchmark_import__", type="business")
+
+                loop_view = OffersView.as_view()
+                started = time.perf_counter()
+                for item in payload:
+                    request = factory.post("/api/offers/", item, format="json")
+                    force_authenticate(request, user=user)
+                    assert loop_view(request).status_code == 201
+                loop_seconds = time.perf_counter() - started
+
+                request = factory.post(
+                    "/api/offers/bulk/", "\n".join(json.dumps(item) for item in payload),
+                    content_type="application/x-ndjson",
+                )
+                force_authenticate(request, user=user)
+                started = time.perf_counter()
+                assert OfferBulkCreateView.as_view()(request).status_code == 201
+                bulk_seconds = time.perf_counter() - started
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            discard_rolled_back_offers()
+
+        self.stdout.write(f"POST loop: {count / loop_seconds:,.0f} offers/s ({loop_seconds:.3f}s)")
+        self.stdout.write(f"Bulk import: {count / bulk_seconds:,.0f} offers/s ({bulk_seconds:.3f}s)")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {loop_seconds / bulk_seconds:.1f}x"))
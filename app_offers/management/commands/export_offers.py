@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app_offers.api.export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, get_export_queryset, iter_offers
+from app_offers.api.filters import OFFER_ORDERINGS
+
+
+class Command(BaseCommand):
+    """
+    Writes the offer catalog with all details as NDJSON or CSV, reading offers
+    in chunks so memory stays flat for any catalog size.
+    """
+    help = "Export offers with their details as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--export-format", choices=list(EXPORT_FORMATS), default="ndjson")
+        parser.add_argument("--output", help="File to write to (default: stdout).")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+        parser.add_argument("--creator-id")
+        parser.add_argument("--min-price")
+        parser.add_argument("--max-delivery-time")
+        parser.add_argument("--search")
+        parser.add_argument("--ordering", choices=OFFER_ORDERINGS)
+
+    def handle(self, *args, **options):
+        params = {
+            key: options[key]
+            for key in ("creator_id", "min_price", "max_delivery_time", "search", "ordering")
+            if options[key]
+        }
+        try:
+            queryset = get_export_queryset(params)
+        except (ValueError, TypeError):
+            raise CommandError("Invalid filter value.")
+
+        _, render, _ = EXPORT_FORMATS[options["export_format"]]
+        lines = render(iter_offers(queryset, chunk_size=options["chunk_size"]))
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from app_offers.search import get_search_backend
+
+
+class Command(BaseCommand):
+    """
+    Creates (if needed) and fully rebuilds the offer full-text search index.
+    """
+    help = "Rebuild the full-text search index over offer titles and descriptions."
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        backend.setup()
+        backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt offer search index ({type(backend).__name__})."))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Min, OuterRef, Subquery
+
+from app_offers.models import Offer, Detail
+
+
+class Command(BaseCommand):
+    """
+    Backfills or repairs the denormalized min_price / min_delivery_time
+    columns of all offers from their details in a single UPDATE.
+    """
+    help = "Recompute Offer.min_price and Offer.min_delivery_time from the offer details."
+
+    def handle(self, *args, **options):
+        details = Detail.objects.filter(offer=OuterRef("pk")).order_by().values("offer")
+        updated = Offer.objects.update(
+            min_price=Subquery(details.annotate(value=Min("price")).values("value")),
+            min_delivery_time=Subquery(details.annotate(value=Min("delivery_time_in_days")).values("value")),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Refreshed min values for {updated} offers."))
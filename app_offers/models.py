@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class Offer(models.Model):
@@ -13,10 +14,9 @@ class Offer(models.Model):
         - description: Detailed description of the offer.
         - created_at: Timestamp when the offer was created.
         - updated_at: Timestamp when the offer was last updated.
-
-    Properties:
-        - min_price: Returns the minimum price among associated details.
-        - min_delivery_time: Returns the minimum delivery time among associated details.
+        - min_price: Lowest price among the associated details (denormalized).
+        - min_delivery_time: Shortest delivery time among the associated details (denormalized).
+        - image_variants: Paths of the generated thumbnails of image (see core.images).
     """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="offers")
     title = models.CharField(max_length=255)
@@ -24,22 +24,34 @@ class Offer(models.Model):
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.DecimalField(max_digits=16, decimal_places=2, null=True, blank=True, editable=False)
+    min_delivery_time = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
 
-    @property
-    def min_price(self):
-        """
-        Returns the lowest price from the associated details.
-        """
-        detail = self.details.order_by("price").first()
-        return detail.price if detail else None
+    class Meta:
+        # One composite index per supported sort key, with id as tie-breaker.
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="offer_updated_at_id_idx"),
+            models.Index(fields=["created_at", "id"], name="offer_created_at_id_idx"),
+            models.Index(fields=["min_price", "id"], name="offer_min_price_id_idx"),
+            models.Index(fields=["min_delivery_time", "id"], name="offer_min_delivery_id_idx"),
+        ]
 
-    @property
-    def min_delivery_time(self):
+    def refresh_min_values(self):
         """
-        Returns the shortest delivery time (in days) from the associated details.
+        Recomputes min_price and min_delivery_time from the associated details
+        and writes them with a single UPDATE. updated_at is touched as well,
+        since a detail change is a change of the offer (see conditional GET).
         """
-        detail = self.details.order_by("delivery_time_in_days").first()
-        return detail.delivery_time_in_days if detail else None
+        values = self.details.aggregate(
+            min_price=models.Min("price"),
+            min_delivery_time=models.Min("delivery_time_in_days"),
+        )
+        values["updated_at"] = timezone.now()
+        self.min_price = values["min_price"]
+        self.min_delivery_time = values["min_delivery_time"]
+        self.updated_at = values["updated_at"]
+        Offer.objects.filter(pk=self.pk).update(**values)
 
     def __str__(self):
         """
@@ -76,8 +88,37 @@ class Detail(models.Model):
     offer_type = models.CharField(max_length=32, choices=OFFER_TYPES)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # One tier per type and offer; detail upserts conflict on this key.
+        constraints = [
+            models.UniqueConstraint(fields=["offer", "offer_type"], name="detail_offer_offer_type_unique"),
+        ]
+
     def __str__(self):
         """
         String representation of the detail, including offer title and type.
         """
         return f"{self.offer.title} – {self.title} ({self.offer_type})"
+
+
+class OfferSearchIndex(models.Model):
+    """
+    Unmanaged model mapping the SQLite FTS5 table that indexes offer titles
+    and descriptions. The table is created and kept in sync by app_offers.search
+    and only exists when running on SQLite.
+
+    Fields:
+        - offer: The indexed offer (stored as the FTS rowid).
+        - title: Indexed copy of the offer title.
+        - description: Indexed copy of the offer description.
+    """
+    offer = models.OneToOneField(
+        Offer, primary_key=True, db_column="rowid", db_constraint=False,
+        on_delete=models.DO_NOTHING, related_name="search_index"
+    )
+    title = models.TextField()
+    description = models.TextField()
+
+    class Meta:
+        managed = False
+        db_table = "app_offers_offer_fts"
@@ -0,0 +1,206 @@
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, Expression, F, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from app_offers.models import Offer, OfferSearchIndex
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    """
+    Splits a search string into lower-cased word tokens.
+    """
+    return [token.lower() for token in TOKEN_PATTERN.findall(text or "")]
+
+
+class FTS5Match(Expression):
+    """
+    Boolean expression `<fts table> MATCH <query>` against the joined FTS5 table.
+    """
+    conditional = True
+    output_field = BooleanField()
+
+    def __init__(self, column, query):
+        super().__init__()
+        self.column = column
+        self.query = query
+
+    def resolve_expression(self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False):
+        clone = self.copy()
+        clone.column = self.column.resolve_expression(query, allow_joins, reuse, summarize, for_save)
+        return clone
+
+    def as_sql(self, compiler, connection):
+        return f"{compiler.quote_name_unless_alias(self.column.alias)} MATCH %s", [self.query]
+
+
+class FTS5Rank(FTS5Match):
+    """
+    BM25 relevance of the current FTS5 match (lower is more relevant).
+    """
+    conditional = False
+    output_field = FloatField()
+
+    def __init__(self, column):
+        super().__init__(column, None)
+
+    def as_sql(self, compiler, connection):
+        return f"bm25({compiler.quote_name_unless_alias(self.column.alias)})", []
+
+
+class BaseSearchBackend:
+    """
+    Fallback search backend using case-insensitive LIKE over title and description.
+
+    Subclasses provide a real full-text index. Every backend annotates matching
+    offers with `search_rank`, where a lower value means a more relevant result.
+    """
+    def setup(self):
+        """
+        Creates the database structures backing the index.
+        """
+
+    def index(self, offer):
+        """
+        Adds or refreshes a single offer in the index.
+        """
+
+    def index_many(self, offers):
+        """
+        Adds freshly inserted offers (e.g. from bulk_create) to the index.
+        """
+        for offer in offers:
+            self.index(offer)
+
+    def remove(self, offer_id):
+        """
+        Removes a single offer from the index.
+        """
+
+    def rebuild(self):
+        """
+        Rebuilds the whole index from the offers table.
+        """
+
+    def search(self, queryset, text):
+        """
+        Filters the queryset to offers matching every search term.
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return queryset.none()
+        condition = Q()
+        for token in tokens:
+            condition &= Q(title__icontains=token) | Q(description__icontains=token)
+        return queryset.filter(condition).annotate(search_rank=RawSQL("0", [], output_field=FloatField()))
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    Search backend using an SQLite FTS5 virtual table keyed by offer id (rowid).
+    """
+    table = OfferSearchIndex._meta.db_table
+
+    def setup(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} "
+                f"USING fts5(title, description, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+    def index(self, offer):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [offer.pk])
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, title, description) VALUES (%s, %s, %s)",
+                [offer.pk, offer.title, offer.description],
+            )
+
+    def index_many(self, offers):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {self.table} (rowid, title, description) VALUES (%s, %s, %s)",
+                [(offer.pk, offer.title, offer.description) for offer in offers],
+            )
+
+    def remove(self, offer_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [offer_id])
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, title, description) "
+                f"SELECT id, title, description FROM {Offer._meta.db_table}"
+            )
+
+    def search(self, queryset, text):
+        tokens = tokenize(text)
+        if not tokens:
+            return queryset.none()
+        match = " ".join(f'"{token}"*' for token in tokens)
+        column = F("search_index__title")
+        return queryset.filter(FTS5Match(column, match), search_index__isnull=False).annotate(
+            search_rank=FTS5Rank(column)
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Search backend using a GIN expression index over the offer's tsvector.
+
+    The index is maintained by PostgreSQL itself, so saves need no extra work.
+    """
+    config = "simple"
+    index_name = "app_offers_offer_search_idx"
+
+    @property
+    def document(self):
+        table = Offer._meta.db_table
+        return (
+            f"to_tsvector('{self.config}'::regconfig, "
+            f"COALESCE({table}.title, '') || ' ' || COALESCE({table}.description, ''))"
+        )
+
+    def setup(self):
+        table = Offer._meta.db_table
+        document = self.document.replace(f"{table}.", "")
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {self.index_name} ON {table} USING GIN (({document}))")
+
+    def search(self, queryset, text):
+        tokens = tokenize(text)
+        if not tokens:
+            return queryset.none()
+        ts_query = " & ".join(f"{token}:*" for token in tokens)
+        query_sql = f"to_tsquery('{self.config}'::regconfig, %s)"
+        return queryset.alias(
+            search_match=RawSQL(f"{self.document} @@ {query_sql}", [ts_query], output_field=BooleanField()),
+        ).filter(search_match=True).annotate(
+            search_rank=RawSQL(f"-ts_rank({self.document}, {query_sql})", [ts_query], output_field=FloatField()),
+        )
+
+
+def get_search_backend():
+    """
+    Returns the search backend matching the configured DB_ENGINE.
+    """
+    engine = getattr(settings, "DB_ENGINE", settings.DATABASES["default"]["ENGINE"])
+    if engine == "django.db.backends.sqlite3":
+        return SQLiteSearchBackend()
+    if engine.startswith("django.db.backends.postgresql"):
+        return PostgresSearchBackend()
+    return BaseSearchBackend()
+
+
+def search_offers(queryset, text):
+    """
+    Filters the queryset to offers matching the search text (prefix match per term)
+    and annotates them with `search_rank`.
+    """
+    return get_search_backend().search(queryset, text)
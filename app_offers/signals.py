@@ -0,0 +1,168 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app_offers.cache import (
+    adjust_offer_count, bump_catalog_version, detail_payload_cache, invalidate_offer_payloads, offer_payload_cache
+)
+from app_offers.models import Offer, Detail
+from app_offers.search import get_search_backend
+from app_offers.suggest import title_index
+from app_profile.models import Profile
+from core.images import schedule_variants
+
+
+@receiver(post_save, sender=Offer)
+def index_offer_on_save(sender, instance, **kwargs):
+    """
+    Keeps the full-text search index in sync with the saved offer.
+    """
+    get_search_backend().index(instance)
+
+
+@receiver(post_save, sender=Offer)
+def generate_offer_image_variants(sender, instance, **kwargs):
+    """
+    Queues thumbnail generation when the offer image was uploaded or replaced.
+    """
+    schedule_variants(instance, 'image', 'image_variants')
+
+
+@receiver(post_delete, sender=Offer)
+def remove_offer_from_index(sender, instance, **kwargs):
+    """
+    Drops a deleted offer from the full-text search index.
+    """
+    get_search_backend().remove(instance.pk)
+
+
+@receiver(post_save, sender=Offer)
+def count_created_offer(sender, instance, created, **kwargs):
+    """
+    Keeps the maintained offer count (estimated listing totals) up to date.
+    """
+    if created:
+        adjust_offer_count(1)
+
+
+@receiver(post_delete, sender=Offer)
+def count_deleted_offer(sender, instance, **kwargs):
+    """
+    Keeps the maintained offer count up to date on deletes (including cascades).
+    """
+    adjust_offer_count(-1)
+
+
+@receiver(post_save, sender=Detail)
+def refresh_offer_min_values_on_save(sender, instance, **kwargs):
+    """
+    Keeps the denormalized min_price / min_delivery_time of the parent offer
+    up to date whenever a detail is created or updated.
+    """
+    _offer_for(instance).refresh_min_values()
+
+
+@receiver(post_delete, sender=Detail)
+def refresh_offer_min_values_on_delete(sender, instance, origin=None, **kwargs):
+    """
+    Recomputes the parent offer's min values after a detail was deleted.
+    Skipped when the detail is removed as part of a cascade (offer or user
+    deletion), since the offer itself is gone as well.
+    """
+    origin_model = getattr(origin, "model", type(origin))
+    if origin_model is not Detail:
+        return
+    _offer_for(instance).refresh_min_values()
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=Detail)
+@receiver(post_delete, sender=Detail)
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_catalog(sender, **kwargs):
+    """
+    Bumps the catalog version on every write that can change a listing response.
+    """
+    bump_catalog_version()
+
+
+@receiver(post_save, sender=Offer)
+def invalidate_offer_payload_on_save(sender, instance, **kwargs):
+    """
+    Drops the cached single-offer payload and those of the offer's details.
+    """
+    invalidate_offer_payloads([instance.pk])
+
+
+@receiver(post_delete, sender=Offer)
+def invalidate_offer_payload_on_delete(sender, instance, **kwargs):
+    offer_payload_cache.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Detail)
+def invalidate_detail_payloads_on_save(sender, instance, **kwargs):
+    """
+    A detail write changes the offer payload and touches the offer's
+    updated_at, which versions all of its details.
+    """
+    invalidate_offer_payloads([instance.offer_id])
+
+
+@receiver(post_delete, sender=Detail)
+def invalidate_detail_payloads_on_delete(sender, instance, origin=None, **kwargs):
+    detail_payload_cache.invalidate(instance.pk)
+    if getattr(origin, "model", type(origin)) is Detail:
+        invalidate_offer_payloads([instance.offer_id])
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_offer_payloads_on_profile_change(sender, instance, **kwargs):
+    """
+    Offer payloads embed the creator's profile names (user_details).
+    """
+    offer_payload_cache.invalidate(*Offer.objects.filter(user_id=instance.user_id).values_list("id", flat=True))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_catalog_on_user_update(sender, instance, created, **kwargs):
+    """
+    Usernames are part of the listing and offer payloads (user_details), so user
+    updates invalidate them as well. New registrations cannot affect any offer yet.
+    """
+    if not created:
+        bump_catalog_version()
+        offer_payload_cache.invalidate(*Offer.objects.filter(user=instance).values_list("id", flat=True))
+
+
+@receiver(post_save, sender=Offer)
+def update_title_index(sender, instance, **kwargs):
+    """
+    Applies offer writes to this process's suggest index. Connected after
+    invalidate_catalog, so the index records the already bumped catalog version.
+    """
+    title_index.update(instance.pk, instance.title)
+
+
+@receiver(post_delete, sender=Offer)
+def remove_from_title_index(sender, instance, **kwargs):
+    title_index.remove(instance.pk)
+
+
+def _offer_for(detail):
+    """
+    Returns the detail's offer, reusing the cached instance when available so
+    in-memory offers reflect the refreshed values.
+    """
+    if Detail.offer.is_cached(detail):
+        return detail.offer
+    return Offer(pk=detail.offer_id)
+
+
+def setup_search_index(sender, **kwargs):
+    """
+    post_migrate handler creating the full-text search structures.
+    """
+    get_search_backend().setup()
@@ -0,0 +1,166 @@
+"""
+In-memory prefix index over offer titles for search-box autocompletion.
+
+Each title is indexed under its normalized text starting at each of its first
+words ("logo design studio" -> "logo design studio", "design studio",
+"studio"), so typing the beginning of any leading word finds it. Keys live in
+two sorted lists (title starts, inner words) and are looked up with bisect: a
+lookup is a binary search plus a scan of about `limit` entries per list, with
+no database access.
+
+The index is per process. Offer signals apply writes of this process
+incrementally; writes made elsewhere are picked up by a rebuild once the index
+is older than SUGGEST_INDEX_TTL seconds and the catalog version has changed.
+Memory is bounded by SUGGEST_INDEX_MAX_TITLES (most recently updated offers
+win), SUGGEST_INDEX_MAX_WORDS keys per title and SUGGEST_INDEX_KEY_LENGTH
+characters per key.
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+
+from django.conf import settings
+
+from app_offers.cache import get_catalog_version
+from app_offers.models import Offer
+from app_offers.search import tokenize
+
+
+def normalize(text):
+    """
+    Lower-cases the text and collapses everything but word characters to single spaces.
+    """
+    return " ".join(tokenize(text))
+
+
+class TitlePrefixIndex:
+    """
+    Sorted-array prefix index mapping normalized title keys to offer ids.
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._keys = ([], [])  # sorted (key, offer_id) for title starts, inner words
+        self._titles = OrderedDict()  # offer_id -> (title, normalized title), least recently written first
+        self.version = None
+        self.built_at = None
+
+    def keys_for(self, normalized):
+        """
+        Returns the (list index, key) pairs of a normalized title: 0 for the
+        whole title, 1 for the text from each further leading word on.
+        """
+        words = normalized.split(" ")
+        max_length = settings.SUGGEST_INDEX_KEY_LENGTH
+        return {
+            (min(i, 1), " ".join(words[i:])[:max_length])
+            for i in range(min(len(words), settings.SUGGEST_INDEX_MAX_WORDS)) if words[i]
+        }
+
+    def rebuild(self):
+        """
+        Reloads the index from the most recently updated offers.
+        """
+        version = get_catalog_version()
+        rows = Offer.objects.order_by("-updated_at", "-id").values_list("id", "title")[:settings.SUGGEST_INDEX_MAX_TITLES]
+        titles = OrderedDict((offer_id, (title, normalize(title))) for offer_id, title in reversed(list(rows)))
+        keys = ([], [])
+        for offer_id, (_, normalized) in titles.items():
+            for index, key in self.keys_for(normalized):
+                keys[index].append((key, offer_id))
+        keys[0].sort()
+        keys[1].sort()
+        with self._lock:
+            self._keys, self._titles = keys, titles
+            self.version, self.built_at = version, time.monotonic()
+
+    def ensure_fresh(self):
+        """
+        Builds the index on first use and rebuilds it when it is older than the
+        TTL and the catalog changed meanwhile (writes from other processes).
+        """
+        if self.built_at is None:
+            self.rebuild()
+        elif time.monotonic() - self.built_at > settings.SUGGEST_INDEX_TTL:
+            if get_catalog_version() != self.version:
+                self.rebuild()
+            else:
+                self.built_at = time.monotonic()
+
+    def update(self, offer_id, title):
+        """
+        Adds or re-indexes one offer, evicting the least recently written titles
+        beyond SUGGEST_INDEX_MAX_TITLES. A no-op until the index is built.
+        """
+        with self._lock:
+            if self.built_at is None:
+                return
+            self._remove(offer_id)
+            normalized = normalize(title)
+            self._titles[offer_id] = (title, normalized)
+            for index, key in self.keys_for(normalized):
+                insort(self._keys[index], (key, offer_id))
+            while len(self._titles) > settings.SUGGEST_INDEX_MAX_TITLES:
+                self._remove(next(iter(self._titles)))
+            self.version = get_catalog_version()
+
+    def remove(self, offer_id):
+        """
+        Drops one offer from the index.
+        """
+        with self._lock:
+            if self.built_at is None:
+                return
+            self._remove(offer_id)
+            self.version = get_catalog_version()
+
+    def _remove(self, offer_id):
+        entry = self._titles.pop(offer_id, None)
+        if entry is None:
+            return
+        for index, key in self.keys_for(entry[1]):
+            keys = self._keys[index]
+            position = bisect_left(keys, (key, offer_id))
+            if position < len(keys) and keys[position] == (key, offer_id):
+                del keys[position]
+
+    def suggest(self, text, limit):
+        """
+        Returns up to `limit` (offer_id, title) pairs whose title or one of its
+        leading words starts with the text. Titles starting with the text come
+        first; each group is in alphabetical order and duplicate titles are
+        returned once.
+        """
+        prefix = normalize(text)[:settings.SUGGEST_INDEX_KEY_LENGTH]
+        if not prefix:
+            return []
+        results, seen = [], set()
+        with self._lock:
+            for keys in self._keys:
+                position = bisect_left(keys, (prefix,))
+                # The scan is bounded, so heavily duplicated titles cannot make it linear.
+                for key, offer_id in keys[position:position + limit * 4]:
+                    if not key.startswith(prefix):
+                        break
+                    title = self._titles[offer_id][0]
+                    if title in seen:
+                        continue
+                    seen.add(title)
+                    results.append((offer_id, title))
+                    if len(results) == limit:
+                        return results
+        return results
+
+    def clear(self):
+        """
+        Forgets the index; it is rebuilt on next use.
+        """
+        with self._lock:
+            self._keys, self._titles = ([], []), OrderedDict()
+            self.version = self.built_at = None
+
+    def __len__(self):
+        return len(self._titles)
+
+
+title_index = TitlePrefixIndex()
@@ -0,0 +1,144 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from app_authentication.models import CustomUser
+from app_offers.cache import offer_list_cache, offer_payload_cache
+from app_offers.models import Offer, Detail
+from app_profile.models import Profile
+from core.lru import LocalLRUCache
+
+
+@pytest.mark.django_db
+class TestOfferListCache:
+
+    @pytest.fixture
+    def client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def offer(self):
+        user = CustomUser.objects.create(username="business", email="business@test.com", type="business")
+        Profile.objects.create(user=user, first_name="Old")
+        offer = Offer.objects.create(user=user, title="Test Offer", description="Desc")
+        Detail.objects.create(offer=offer, title="Basic", revisions=1, delivery_time_in_days=3, price=10, features=[], offer_type="basic")
+        return offer
+
+    def test_repeated_anonymous_requests_hit_cache(self, client, offer):
+        first = client.get(reverse("offers"), {"page_size": 5})
+        second = client.get(reverse("offers"), {"page_size": 5})
+        other = client.get(reverse("offers"), {"page_size": 4})
+
+        assert first["X-Cache"] == "MISS"
+        assert second["X-Cache"] == "HIT"
+        assert other["X-Cache"] == "MISS"
+        assert first.json() == second.json()
+        assert offer_list_cache.stats() == {"hits": 1, "misses": 2, "hit_ratio": 1 / 3}
+
+    def test_writes_invalidate_cached_listing(self, client, offer):
+        client.get(reverse("offers"))
+
+        detail = offer.details.get()
+        detail.price = 99
+        detail.save()
+        response = client.get(reverse("offers"))
+        assert response["X-Cache"] == "MISS"
+        assert response.json()["results"][0]["min_price"] == "99.00"
+
+        profile = offer.user.profile
+        profile.first_name = "New"
+        profile.save()
+        response = client.get(reverse("offers"))
+        assert response["X-Cache"] == "MISS"
+        assert response.json()["results"][0]["user_details"]["first_name"] == "New"
+
+    def test_authenticated_requests_bypass_cache(self, client, offer):
+        client.force_authenticate(user=offer.user)
+        client.get(reverse("offers"))
+        response = client.get(reverse("offers"))
+        assert "X-Cache" not in response
+        assert offer_list_cache.stats()["hits"] == 0
+
+    def test_file_based_backend(self, client, offer, tmp_path):
+        caches = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)}}
+        with override_settings(CACHES=caches):
+            cache.clear()
+            assert client.get(reverse("offers"))["X-Cache"] == "MISS"
+            assert client.get(reverse("offers"))["X-Cache"] == "HIT"
+
+            Offer.objects.create(user=offer.user, title="Another Offer", description="Desc")
+            response = client.get(reverse("offers"))
+            assert response["X-Cache"] == "MISS"
+            assert response.json()["count"] == 2
+
+
+@pytest.mark.django_db
+class TestPayloadCache:
+
+    @pytest.fixture
+    def client(self):
+        client = APIClient()
+        client.force_authenticate(user=CustomUser.objects.create(username="customer", email="customer@test.com", type="customer"))
+        return client
+
+    @pytest.fixture
+    def offer(self):
+        user = CustomUser.objects.create(username="business", email="business@test.com", type="business")
+        Profile.objects.create(user=user, first_name="Old")
+        offer = Offer.objects.create(user=user, title="Test Offer", description="Desc")
+        Detail.objects.create(offer=offer, title="Basic", revisions=1, delivery_time_in_days=3, price=10, features=[], offer_type="basic")
+        return offer
+
+    def test_local_layer_is_bounded_and_expires(self, monkeypatch):
+        lru = LocalLRUCache(max_entries=2, ttl=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        assert lru.get("a") == 1
+        lru.set("c", 3)
+        assert (lru.get("a"), lru.get("b"), lru.get("c")) == (1, None, 3)
+
+        monkeypatch.setattr(lru, "ttl", -1)
+        lru.set("d", 4)
+        assert lru.get("d") is None
+        assert lru.stats()["hits"] == 3 and lru.stats()["misses"] == 2
+
+    def test_falls_back_to_shared_layer(self, client, offer, django_assert_num_queries):
+        url = reverse("offer", args=[offer.id])
+        first = client.get(url).json()
+        offer_payload_cache.local.clear()
+
+        # another process: empty local layer, payload still in the shared cache
+        with django_assert_num_queries(0):
+            assert client.get(url).json() == first
+        assert offer_payload_cache.local.stats()["entries"] == 1
+
+    def test_model_writes_invalidate_payloads(self, client, offer):
+        detail = offer.details.get()
+        client.get(reverse("offer", args=[offer.id]))
+        client.get(reverse("offer_details", args=[detail.id]))
+
+        detail.price = 7
+        detail.save()
+        assert client.get(reverse("offer_details", args=[detail.id])).json()["price"] == "7.00"
+        assert client.get(reverse("offer", args=[offer.id])).json()["min_price"] == "7.00"
+
+        offer.user.profile.first_name = "New"
+        offer.user.profile.save()
+        assert client.get(reverse("offer", args=[offer.id])).json()["user_details"]["first_name"] == "New"
+
+        offer_id = offer.id
+        offer.delete()
+        assert client.get(reverse("offer", args=[offer_id])).status_code == 404
+        assert client.get(reverse("offer_details", args=[detail.id])).status_code == 404
+
+    def test_stats_endpoint_is_staff_only(self, client, offer):
+        client.get(reverse("offer", args=[offer.id]))
+        client.get(reverse("offer", args=[offer.id]))
+        assert client.get(reverse("offer_cache_stats")).status_code == 403
+
+        client.force_authenticate(user=CustomUser.objects.create(username="staff", email="staff@test.com", is_staff=True))
+        data = client.get(reverse("offer_cache_stats")).json()
+        assert set(data) == {"pid", "offer_list", "offer_facets", "offer_payloads", "detail_payloads"}
+        assert data["offer_payloads"]["local"]["hits"] == 1
+        assert data["offer_payloads"]["local"]["hit_ratio"] == 0.5
@@ -0,0 +1,72 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from app_authentication.models import CustomUser
+from app_offers.cache import get_offer_count
+from app_offers.models import Offer, Detail
+from app_offers.suggest import title_index
+
+
+@pytest.mark.django_db
+class TestOfferCommands:
+
+    @pytest.fixture
+    def offer(self):
+        user = CustomUser.objects.create(username="business", email="business@test.com", type="business")
+        offer = Offer.objects.create(user=user, title="Test Offer", description="Desc")
+        Detail.objects.create(offer=offer, title="Basic", revisions=1, delivery_time_in_days=4, price=15, features=[], offer_type="basic")
+        Detail.objects.create(offer=offer, title="Premium", revisions=3, delivery_time_in_days=2, price=40, features=[], offer_type="premium")
+        return offer
+
+    def test_refresh_offer_min_values_repairs_drift(self, offer):
+        Offer.objects.filter(pk=offer.pk).update(min_price=None, min_delivery_time=99)
+
+        call_command("refresh_offer_min_values")
+
+        offer.refresh_from_db()
+        assert offer.min_price == 15
+        assert offer.min_delivery_time == 2
+
+    def test_benchmark_offer_import_leaves_database_untouched(self, offer, capsys):
+        assert get_offer_count() == 1
+        title_index.ensure_fresh()
+
+        call_command("benchmark_offer_import", "--count", "3")
+
+        output = capsys.readouterr().out
+        assert "POST loop" in output and "Bulk import" in output and "Speedup" in output
+        assert Offer.objects.count() == 1
+        assert not CustomUser.objects.filter(username="__benchmark_import__").exists()
+        # the rolled-back offers left no trace in the offer count or suggest index
+        assert get_offer_count() == 1
+        title_index.ensure_fresh()
+        assert title_index.suggest("benchmark", 10) == []
+
+    def test_benchmark_json_rendering_compares_identical_output(self, offer, capsys):
+        with CaptureQueriesContext(connection) as few:
+            call_command("benchmark_json_rendering", "--count", "2", "--rounds", "1")
+        with CaptureQueriesContext(connection) as more:
+            call_command("benchmark_json_rendering", "--count", "5", "--rounds", "2")
+        # the payloads are loaded with a fixed number of queries, not per offer
+        assert len(more.captured_queries) == len(few.captured_queries)
+
+        output = capsys.readouterr().out
+        assert "Listing page" in output and "Offers with details" in output and "speedup" in output
+        assert Offer.objects.count() == 1
+
+    def test_export_offers_reads_in_chunks(self, offer, tmp_path, django_assert_num_queries):
+        for i in range(4):
+            extra = Offer.objects.create(user=offer.user, title=f"Extra {i}", description="Desc")
+            Detail.objects.create(offer=extra, title="Basic", revisions=1, delivery_time_in_days=1, price=i + 1, features=[], offer_type="basic")
+        output = tmp_path / "offers.ndjson"
+
+        # one chunked offers query, one details query per chunk of two offers
+        with django_assert_num_queries(4):
+            call_command("export_offers", "--chunk-size", "2", "--output", str(output))
+        lines = output.read_text().splitlines()
+        assert len(lines) == 5
+        assert '"offer_type": "premium"' in lines[0]
+
+        call_command("export_offers", "--export-format", "csv", "--max-delivery-time", "1", "--output", str(output))
+        assert len(output.read_text().splitlines()) == 1 + 4
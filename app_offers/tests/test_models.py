@@ -1,6 +1,12 @@
+import io
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
 from app_offers.models import Offer, Detail
+from core import images
 
 User = get_user_model()
 
@@ -73,3 +79,100 @@ class TestOfferModels:
         assert "Basic" in titles
         assert "Standard" in titles
         assert "Premium" in titles
+
+    def test_min_values_follow_detail_updates(self, offer, details):
+        details[0].price = 50.0
+        details[0].save()
+        offer.refresh_from_db()
+        assert offer.min_price == 20
+        assert offer.min_delivery_time == 1
+
+    def test_min_values_follow_detail_deletes(self, offer, details):
+        details[2].delete()
+        offer.refresh_from_db()
+        assert offer.min_delivery_time == 3
+
+        Detail.objects.filter(offer=offer).delete()
+        offer.refresh_from_db()
+        assert offer.min_price is None
+        assert offer.min_delivery_time is None
+
+    @staticmethod
+    def jpeg_upload(name, size):
+        buffer = io.BytesIO()
+        Image.new("RGB", size, (200, 30, 30)).save(buffer, "JPEG")
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+    @pytest.fixture
+    def image_settings(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.IMAGE_PROCESSING_SYNC = True
+        return settings
+
+    def test_image_variants_are_generated_after_commit(self, user, image_settings, django_capture_on_commit_callbacks, monkeypatch):
+        with django_capture_on_commit_callbacks(execute=True):
+            offer = Offer.objects.create(user=user, title="Pic", description="", image=self.jpeg_upload("pic.jpg", (2400, 1200)))
+
+        offer.refresh_from_db()
+        assert offer.image_variants["source"] == offer.image.name
+        assert set(offer.image_variants) == {"source", "small", "medium"}
+        with default_storage.open(offer.image_variants["medium"]["webp"]) as variant:
+            assert Image.open(variant).size == (480, 240)
+        with default_storage.open(offer.image_variants["small"]["jpeg"]) as variant:
+            assert Image.open(variant).format == "JPEG"
+
+        # Saving without a new upload does not regenerate anything.
+        monkeypatch.setattr(images, "process_variants", lambda *job: pytest.fail("variants regenerated"))
+        with django_capture_on_commit_callbacks(execute=True):
+            offer.title = "Renamed"
+            offer.save()
+
+    def test_oversized_images_are_not_decoded(self, user, image_settings, django_capture_on_commit_callbacks, monkeypatch):
+        image_settings.IMAGE_MAX_DECODE_PIXELS = 1_000_000
+        buffer = io.BytesIO()
+        Image.new("RGB", (2000, 1000), (30, 30, 200)).save(buffer, "PNG")
+
+        # PNG has no draft mode, so the full 2 MP would be decoded
+        with monkeypatch.context() as patch, django_capture_on_commit_callbacks(execute=True):
+            patch.setattr(Image.Image, "load", lambda image: pytest.fail("oversized image decoded"))
+            offer = Offer.objects.create(user=user, title="Huge", description="",
+                                         image=SimpleUploadedFile("huge.png", buffer.getvalue(), content_type="image/png"))
+        offer.refresh_from_db()
+        assert offer.image_variants == {"source": offer.image.name}
+
+        # a JPEG of the same size is decoded at reduced scale and stays below the limit
+        with django_capture_on_commit_callbacks(execute=True):
+            offer.image = self.jpeg_upload("huge.jpg", (2000, 1000))
+            offer.save()
+        offer.refresh_from_db()
+        assert set(offer.image_variants) == {"source", "small", "medium"}
+
+    def test_uploads_sharing_a_stem_keep_their_own_variants(self, user, image_settings, django_capture_on_commit_callbacks):
+        buffer = io.BytesIO()
+        Image.new("RGB", (960, 960), (30, 200, 30)).save(buffer, "PNG")
+        with django_capture_on_commit_callbacks(execute=True):
+            wide = Offer.objects.create(user=user, title="Wide", description="", image=self.jpeg_upload("pic.jpg", (960, 480)))
+            square = Offer.objects.create(user=user, title="Square", description="",
+                                          image=SimpleUploadedFile("pic.png", buffer.getvalue(), content_type="image/png"))
+        wide.refresh_from_db()
+        square.refresh_from_db()
+
+        assert wide.image_variants["medium"]["webp"] != square.image_variants["medium"]["webp"]
+        with default_storage.open(wide.image_variants["medium"]["webp"]) as variant:
+            assert Image.open(variant).size == (480, 240)
+        with default_storage.open(square.image_variants["medium"]["webp"]) as variant:
+            assert Image.open(variant).size == (480, 480)
+
+    def test_replacing_the_image_replaces_its_variants(self, offer, image_settings, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            offer.image = self.jpeg_upload("first.jpg", (800, 800))
+            offer.save()
+        offer.refresh_from_db()
+        old_variant = offer.image_variants["small"]["webp"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            offer.image = self.jpeg_upload("second.jpg", (800, 800))
+            offer.save()
+        offer.refresh_from_db()
+        assert "second" in offer.image_variants["small"]["webp"]
+        assert not default_storage.exists(old_variant)
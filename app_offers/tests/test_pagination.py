@@ -0,0 +1,130 @@
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+from django.urls import reverse
+from app_authentication.models import CustomUser
+from app_offers.api.pagination import OfferPagination
+from app_offers.cache import get_offer_count
+from app_offers.models import Offer, Detail
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+
+    @pytest.fixture
+    def client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def offers(self):
+        user = CustomUser.objects.create(username="business", email="business@test.com", type="business")
+        offers = []
+        for i, price in enumerate([30, 10, 20, 10, None, 40, 20]):
+            offer = Offer.objects.create(user=user, title=f"Offer {i}", description="Desc")
+            if price is not None:
+                Detail.objects.create(offer=offer, title="Basic", revisions=1, delivery_time_in_days=i + 1, price=price, features=[], offer_type="basic")
+            offers.append(offer)
+        return offers
+
+    def walk(self, client, params):
+        response = client.get(reverse("offers"), {"cursor": "", **params})
+        assert response.status_code == 200
+        pages = [response.json()]
+        while pages[-1]["next"]:
+            pages.append(client.get(pages[-1]["next"]).json())
+        return pages
+
+    @pytest.mark.parametrize("ordering", [None, "min_price", "-min_price", "min_delivery_time", "updated_at", "-updated_at"])
+    def test_forward_walk_matches_full_ordering(self, client, offers, ordering):
+        params = {"page_size": 2, **({"ordering": ordering} if ordering else {})}
+        pages = self.walk(client, params)
+        seen = [o["id"] for page in pages for o in page["results"]]
+
+        ordering = ordering or "id"
+        field = ordering.lstrip("-")
+        reverse_order = ordering.startswith("-")
+        for offer in offers:
+            offer.refresh_from_db()
+        with_value = sorted((o for o in offers if getattr(o, field) is not None), key=lambda o: (getattr(o, field), o.id))
+        without_value = sorted((o for o in offers if getattr(o, field) is None), key=lambda o: o.id)
+        expected = with_value + without_value if connection.features.nulls_order_largest else without_value + with_value
+        if reverse_order:
+            expected.reverse()
+        assert seen == [o.id for o in expected]
+        assert all("count" not in page for page in pages)
+
+    def test_previous_links_walk_back(self, client, offers):
+        pages = self.walk(client, {"ordering": "min_price", "page_size": 3})
+        assert pages[0]["previous"] is None
+
+        back = client.get(pages[-1]["previous"]).json()
+        assert back["results"] == pages[-2]["results"]
+        back = client.get(back["previous"]).json()
+        assert back["results"] == pages[0]["results"]
+        assert back["previous"] is None
+
+    def test_total_is_optional(self, client, offers):
+        response = client.get(reverse("offers"), {"cursor": "", "include_total": "true"})
+        assert response.json()["count"] == len(offers)
+
+    def test_invalid_cursor_and_ordering(self, client, offers):
+        response = client.get(reverse("offers"), {"cursor": "garbage"})
+        assert response.status_code == 404
+
+        response = client.get(reverse("offers"), {"cursor": "", "ordering": "title"})
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("ordering", ["min_price", "-min_price"])
+    def test_previous_links_cross_null_keys(self, client, offers, ordering):
+        pages = self.walk(client, {"ordering": ordering, "page_size": 2})
+        page = pages[-1]
+        walked_back = [page["results"]]
+        while page["previous"]:
+            page = client.get(page["previous"]).json()
+            walked_back.insert(0, page["results"])
+        assert walked_back == [p["results"] for p in pages]
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPagination:
+
+    @pytest.fixture
+    def client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def offers(self):
+        user = CustomUser.objects.create(username="business", email="business@test.com", type="business")
+        return [Offer.objects.create(user=user, title=f"Offer {i}", description="Desc") for i in range(7)]
+
+    @pytest.fixture
+    def small_exact_limit(self, monkeypatch):
+        monkeypatch.setattr(OfferPagination, "exact_count_limit", 3)
+
+    def test_small_listings_are_counted_exactly(self, client, offers):
+        data = client.get(reverse("offers")).json()
+        assert (data["count"], data["count_is_exact"]) == (7, True)
+
+    def test_unfiltered_listing_uses_maintained_counter(self, client, offers, small_exact_limit, django_assert_num_queries):
+        get_offer_count()
+        Offer.objects.create(user=offers[0].user, title="One more", description="Desc")
+        offers[1].delete()
+
+        # validators aggregate, no COUNT(*): offers joined with user and profile (one look-ahead row), details
+        with django_assert_num_queries(3):
+            data = client.get(reverse("offers"), {"page_size": 3}).json()
+        assert (data["count"], data["count_is_exact"]) == (7, False)
+
+        pages = [data]
+        while pages[-1]["next"]:
+            pages.append(client.get(pages[-1]["next"]).json())
+        assert [len(page["results"]) for page in pages] == [3, 3, 1]
+        assert client.get(reverse("offers"), {"page_size": 3, "page": 4}).status_code == 404
+
+    def test_large_filtered_listing_falls_back_to_exact_count(self, client, offers, small_exact_limit):
+        data = client.get(reverse("offers"), {"creator_id": offers[0].user_id}).json()
+        assert data["count"] == 7
+        assert data["count_is_exact"] is (connection.vendor != "postgresql")
+
+        data = client.get(reverse("offers"), {"search": "offer 1"}).json()
+        assert (data["count"], data["count_is_exact"]) == (1, True)
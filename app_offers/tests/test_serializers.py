@@ -6,10 +6,17 @@ from app_offers.api.serializers import (
     OfferReadOnlySerializer,
     OfferSerializer,
     DetailSerializer,
-    DetailReadOnlySerializer
+    DetailReadOnlySerializer,
+    OfferFastSerializer,
+    OfferExportSerializer,
+    OfferExportFastSerializer,
 )
+from app_profile.models import Profile
+from core.fieldsets import restrict_fields
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
 from app_authentication.models import CustomUser
-from django.urls import reverse
+from django.urls import reverse, set_script_prefix, get_script_prefix
 
 @pytest.mark.django_db
 class TestOfferSerializers:
@@ -40,6 +47,17 @@ class TestOfferSerializers:
         assert data['id'] == detail.id
         assert data['url'] == reverse('offer_details', args=[detail.id])
 
+    @pytest.mark.parametrize("prefix", ["/", "/coderr/", "/mounted app/v1/"])
+    def test_detail_url_matches_reverse_under_script_prefix(self, offer, prefix):
+        original = get_script_prefix()
+        set_script_prefix(prefix)
+        try:
+            for detail in offer.details.all():
+                url = DetailReadOnlySerializer(detail).data['url']
+                assert url == reverse('offer_details', args=[detail.id])
+        finally:
+            set_script_prefix(original)
+
     def test_offer_create_update_serializer_valid(self, user):
         data = {
             "title": "New Offer",
@@ -84,3 +102,50 @@ class TestOfferSerializers:
         assert data['user_details']['username'] == offer.user.username
         assert data['user_details']['first_name'] == ''
         assert data['user_details']['last_name'] == ''
+
+    def test_offer_fast_serializer_matches_offer_serializer(self, offer, user):
+        Profile.objects.create(user=user, first_name="Bíz", last_name="Öne")
+        other_user = CustomUser.objects.create(username="biz2", email="biz2@test.com", type="business")
+        Offer.objects.create(user=other_user, title="No details", description="", image="offers/pic.png", image_variants={
+            "source": "offers/pic.png",
+            "small": {"webp": "thumbnails/offers/pic_small.webp", "jpeg": "thumbnails/offers/pic_small.jpeg"},
+        })
+        single = Offer.objects.create(user=other_user, title="Single tier", description="")
+        Detail.objects.create(offer=single, title="Extra", revisions=1, delivery_time_in_days=9, price="7.5", features=["a"], offer_type="basic")
+
+        queryset = OfferSerializer.prefetch_queryset(Offer.objects.order_by('id'))
+        fast = OfferFastSerializer()
+        expected = OfferSerializer(queryset, many=True).data
+        actual = fast.serialize(fast.prepare(queryset))
+
+        assert actual == expected
+        assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
+
+    @pytest.mark.parametrize("fields", [("id", "details"), ("title", "user_details"), ("image_thumbnails", "min_price")])
+    def test_offer_fast_serializer_matches_with_sparse_fieldsets(self, offer, fields):
+        queryset = OfferSerializer.prefetch_queryset(Offer.objects.order_by('id'), fields)
+        fast = OfferFastSerializer(fields=fields)
+        expected = restrict_fields(OfferSerializer(queryset, many=True), fields).data
+
+        assert fast.serialize(fast.prepare(queryset)) == expected
+        assert [list(row) for row in expected] == [list(fields)]
+
+    def test_offer_serializer_exposes_thumbnail_urls(self, offer):
+        assert OfferSerializer(offer).data["image_thumbnails"] == {}
+
+        offer.image_variants = {"source": "offers/pic.png", "small": {"webp": "thumbnails/offers/pic_small.webp"}}
+        request = APIRequestFactory().get("/")
+
+        data = OfferSerializer(offer, context={"request": request}).data
+        assert data["image_thumbnails"] == {"small": {"webp": "http://testserver/media/thumbnails/offers/pic_small.webp"}}
+
+    def test_offer_export_fast_serializer_matches_export_serializer(self, offer, user):
+        Offer.objects.create(user=user, title="No details", description="", image="offers/pic.png")
+
+        queryset = Offer.objects.order_by('id')
+        fast = OfferExportFastSerializer()
+        expected = OfferExportSerializer(queryset, many=True).data
+        actual = fast.serialize(fast.prepare(queryset))
+
+        assert actual == expected
+        assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
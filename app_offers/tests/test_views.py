@@ -1,8 +1,28 @@
+import csv
+import io
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
 import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from app_authentication.models import CustomUser
+from app_offers.api import views
+from app_offers.api.filters import filter_offers, get_offer_order_by
+from app_offers.api.serializers import OfferFastSerializer, OfferSerializer
+from app_offers.cache import bump_catalog_version, get_offer_count
 from app_offers.models import Offer, Detail
+from app_offers.suggest import title_index
+from core.lru import clear_local_caches
+from core.renderers import FastJSONRenderer
 
 
 @pytest.mark.django_db
@@ -35,6 +55,37 @@ class TestOfferViews:
         data = response.json()
         assert data['results'][0]['title'] == "Test Offer"
 
+    def test_filter_and_order_by_denormalized_min_values(self, client, offer, business_user):
+        cheap = Offer.objects.create(user=business_user, title="Cheap Offer", description="Desc")
+        Detail.objects.create(offer=cheap, title="Basic", revisions=1, delivery_time_in_days=7, price=5, features=[], offer_type="basic")
+
+        response = client.get(reverse("offers"), {"ordering": "min_price"})
+        assert [o["id"] for o in response.json()["results"]] == [cheap.id, offer.id]
+
+        response = client.get(reverse("offers"), {"min_price": 8})
+        assert [o["id"] for o in response.json()["results"]] == [offer.id]
+
+        response = client.get(reverse("offers"), {"max_delivery_time": 2})
+        assert [o["id"] for o in response.json()["results"]] == [offer.id]
+
+    def test_min_price_filter_matches_any_detail(self, client, offer, business_user):
+        tiered = Offer.objects.create(user=business_user, title="Tiered Offer", description="Desc")
+        Detail.objects.create(offer=tiered, title="Basic", revisions=1, delivery_time_in_days=7, price=5, features=[], offer_type="basic")
+        Detail.objects.create(offer=tiered, title="Premium", revisions=3, delivery_time_in_days=3, price=500, features=[], offer_type="premium")
+
+        # the cheapest tier is below the bound, the premium one is above it
+        response = client.get(reverse("offers"), {"min_price": 100})
+        assert [o["id"] for o in response.json()["results"]] == [tiered.id]
+        assert response.json()["results"][0]["min_price"] == "5.00"
+
+        response = client.get(reverse("offers"), {"min_price": 1000})
+        assert response.json()["results"] == []
+
+    @pytest.mark.parametrize("ordering", ["title", "details__price", "user__password", "-min_delivery_time"])
+    def test_unknown_ordering_is_rejected(self, client, offer, ordering):
+        response = client.get(reverse("offers"), {"ordering": ordering})
+        assert response.status_code == 400
+
     def test_post_offer_requires_business_user(self, client, business_user, customer_user):
         client.force_authenticate(user=customer_user)
         url = reverse("offers")
@@ -50,6 +101,155 @@ class TestOfferViews:
         assert response.status_code == 201
         assert Offer.objects.filter(title="New Offer").exists()
 
+    @staticmethod
+    def offer_payload(title, base_price=10):
+        return {"title": title, "description": "Imported", "details": [
+            {"title": offer_type.title(), "revisions": 1, "delivery_time_in_days": days, "price": base_price * factor, "features": [], "offer_type": offer_type}
+            for offer_type, days, factor in (("basic", 5, 1), ("standard", 3, 2), ("premium", 2, 3))
+        ]}
+
+    def test_bulk_create_offers_from_json_array(self, client, business_user, customer_user, django_assert_num_queries):
+        url = reverse("offer_bulk_create")
+        payload = [self.offer_payload(f"Imported {i}", base_price=10 + i) for i in range(5)]
+        client.force_authenticate(user=customer_user)
+        assert client.post(url, payload, format="json").status_code == 403
+
+        client.force_authenticate(user=business_user)
+        # savepoint, offers INSERT, details INSERT, search index INSERT, release
+        with django_assert_num_queries(5):
+            response = client.post(url, payload, format="json")
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 5 and data["errors"] == 0
+        assert [r["status"] for r in data["results"]] == ["created"] * 5
+
+        offer = Offer.objects.get(id=data["results"][2]["id"])
+        assert offer.title == "Imported 2" and offer.user == business_user
+        assert offer.details.count() == 3
+        assert (offer.min_price, offer.min_delivery_time) == (12, 2)
+        assert client.get(reverse("offers"), {"search": "imported"}).json()["count"] == 5
+
+    @pytest.mark.parametrize("returns_rows", [True, False])
+    def test_bulk_create_updates_count_and_indexes_once(self, client, business_user, monkeypatch, returns_rows,
+                                                        django_capture_on_commit_callbacks):
+        # without returned ids the offers are saved one by one and their signals do the bookkeeping
+        monkeypatch.setattr(type(connection.features), "can_return_rows_from_bulk_insert", returns_rows)
+        client.force_authenticate(user=business_user)
+        assert get_offer_count() == 0
+        title_index.ensure_fresh()
+
+        payload = [self.offer_payload("Imported logo"), self.offer_payload("Imported flyer")]
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(reverse("offer_bulk_create"), payload, format="json")
+        assert response.status_code == 201
+
+        assert get_offer_count() == 2
+        assert client.get(reverse("offers"), {"search": "imported"}).json()["count"] == 2
+        assert [title for _, title in title_index.suggest("imported", 10)] == ["Imported flyer", "Imported logo"]
+
+    def test_bulk_create_offers_from_ndjson_reports_item_errors(self, client, business_user):
+        client.force_authenticate(user=business_user)
+        invalid = self.offer_payload("Broken")
+        invalid["details"] = invalid["details"][:1]
+        body = "\n".join(json.dumps(item) for item in [self.offer_payload("First"), invalid, self.offer_payload("Third")])
+
+        response = client.post(reverse("offer_bulk_create"), body, content_type="application/x-ndjson")
+        assert response.status_code == 207
+        data = response.json()
+        assert (data["created"], data["errors"]) == (2, 1)
+        assert data["results"][1]["status"] == "error"
+        assert "details" in data["results"][1]["errors"]
+        assert sorted(Offer.objects.values_list("title", flat=True)) == ["First", "Third"]
+
+    @pytest.mark.parametrize("body, content_type", [
+        ('{"title": "Not a list"}', "application/json"),
+        ("[]", "application/json"),
+        ('{"title": "ok"}\n{not json', "application/x-ndjson"),
+        ('[{"title": "Missing everything"}]', "application/json"),
+    ])
+    def test_bulk_create_rejects_invalid_bodies(self, client, business_user, body, content_type):
+        client.force_authenticate(user=business_user)
+        response = client.post(reverse("offer_bulk_create"), body, content_type=content_type)
+        assert response.status_code == 400
+        assert not Offer.objects.exists()
+
+    def test_export_streams_ndjson_with_listing_filters(self, client, offer, business_user):
+        cheap = Offer.objects.create(user=business_user, title="Cheap", description="Desc")
+        Detail.objects.create(offer=cheap, title="Basic", revisions=1, delivery_time_in_days=7, price=5, features=["x"], offer_type="basic")
+
+        response = client.get(reverse("offer_export"))
+        assert response.status_code == 200 and response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        assert [o["id"] for o in lines] == [offer.id, cheap.id]
+        assert [d["offer_type"] for d in lines[0]["details"]] == ["basic", "standard", "premium"]
+        assert lines[1]["details"][0] == {"id": cheap.details.get().id, "title": "Basic", "revisions": 1, "delivery_time_in_days": 7,
+                                          "price": "5.00", "features": ["x"], "offer_type": "basic"}
+
+        response = client.get(reverse("offer_export"), {"min_price": 8, "ordering": "-updated_at"})
+        assert [json.loads(line)["id"] for line in b"".join(response.streaming_content).decode().splitlines()] == [offer.id]
+
+    def test_export_csv_has_one_row_per_detail(self, client, offer, business_user):
+        Offer.objects.create(user=business_user, title="Empty", description="Desc")
+
+        response = client.get(reverse("offer_export"), {"export_format": "csv"})
+        assert response["Content-Type"] == "text/csv"
+        assert response["Content-Disposition"] == 'attachment; filename="offers.csv"'
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        assert [(row["title"], row["detail_offer_type"]) for row in rows] == [
+            ("Test Offer", "basic"), ("Test Offer", "standard"), ("Test Offer", "premium"), ("Empty", ""),
+        ]
+        assert rows[0]["detail_price"] == "10.00" and rows[0]["detail_features"] == "[]"
+
+    @pytest.mark.parametrize("params", [{"export_format": "xml"}, {"ordering": "title"}, {"creator_id": "abc"}])
+    def test_export_rejects_invalid_parameters(self, client, params):
+        assert client.get(reverse("offer_export"), params).status_code == 400
+
+    def test_suggest_completes_titles_from_memory(self, client, offer, business_user, django_assert_num_queries):
+        for title in ("Logo design", "Logo animation", "Website with logo", "Logo design"):
+            Offer.objects.create(user=business_user, title=title, description="Desc")
+        assert client.get(reverse("offer_suggest"), {"q": "lo"}).status_code == 200  # builds the index
+
+        with django_assert_num_queries(0):
+            response = client.get(reverse("offer_suggest"), {"q": "LOGO  d"})
+        assert [r["title"] for r in response.json()["results"]] == ["Logo design"]
+
+        response = client.get(reverse("offer_suggest"), {"q": "logo", "limit": 2})
+        assert [r["title"] for r in response.json()["results"]] == ["Logo animation", "Logo design"]
+        response = client.get(reverse("offer_suggest"), {"q": "with"})
+        assert [r["title"] for r in response.json()["results"]] == ["Website with logo"]
+        # title starts first, then inner words
+        response = client.get(reverse("offer_suggest"), {"q": "logo"})
+        assert [r["title"] for r in response.json()["results"]] == ["Logo animation", "Logo design", "Website with logo"]
+        assert client.get(reverse("offer_suggest"), {"q": " "}).json()["results"] == []
+        assert client.get(reverse("offer_suggest"), {"q": "lo", "limit": "x"}).status_code == 400
+
+    def test_suggest_index_follows_writes(self, client, offer, business_user, settings):
+        client.get(reverse("offer_suggest"), {"q": "test"})
+        offer.title = "Illustration"
+        offer.save()
+        added = Offer.objects.create(user=business_user, title="Illustrated book", description="Desc")
+        assert [r["id"] for r in client.get(reverse("offer_suggest"), {"q": "illus"}).json()["results"]] == [added.id, offer.id]
+        assert client.get(reverse("offer_suggest"), {"q": "test"}).json()["results"] == []
+
+        added.delete()
+        assert len(client.get(reverse("offer_suggest"), {"q": "illus"}).json()["results"]) == 1
+
+        # Writes from other processes (no signals here) show up after the TTL.
+        Offer.objects.filter(pk=offer.pk).update(title="Animation")
+        bump_catalog_version()
+        settings.SUGGEST_INDEX_TTL = 0
+        assert client.get(reverse("offer_suggest"), {"q": "anim"}).json()["results"] == [{"id": offer.id, "title": "Animation"}]
+
+    def test_suggest_index_is_bounded(self, client, offer, business_user, settings):
+        settings.SUGGEST_INDEX_MAX_TITLES = 2
+        client.get(reverse("offer_suggest"), {"q": "x"})
+        for title in ("Alpha", "Beta", "Gamma"):
+            Offer.objects.create(user=business_user, title=title, description="Desc")
+        assert len(title_index) == 2
+        assert client.get(reverse("offer_suggest"), {"q": "alpha"}).json()["results"] == []
+        assert len(client.get(reverse("offer_suggest"), {"q": "gamma"}).json()["results"]) == 1
+
     def test_get_offer_detail(self, client, offer, customer_user):
         client.force_authenticate(user=customer_user)
         url = reverse("offer", args=[offer.id])
@@ -66,6 +266,44 @@ class TestOfferViews:
         offer.refresh_from_db()
         assert offer.title == "Updated Title"
 
+    def test_patch_details_writes_only_changes_in_batches(self, client, offer, business_user):
+        offer.details.filter(offer_type="premium").delete()
+        client.force_authenticate(user=business_user)
+        url = reverse("offer", args=[offer.id])
+        payload = {"details": [
+            {"title": "Basic", "revisions": 1, "delivery_time_in_days": 3, "price": 8, "features": [], "offer_type": "basic"},
+            {"title": "Standard", "revisions": 2, "delivery_time_in_days": 2, "price": 20, "features": [], "offer_type": "standard"},
+            {"title": "Premium", "revisions": 5, "delivery_time_in_days": 1, "price": 50, "features": ["a"], "offer_type": "premium"},
+        ]}
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.patch(url, payload, format="json")
+        assert response.status_code == 200
+        statements = [q["sql"] for q in queries.captured_queries]
+        detail_updates = [sql for sql in statements if sql.startswith('UPDATE "app_offers_detail"')]
+        detail_inserts = [sql for sql in statements if sql.startswith('INSERT INTO "app_offers_detail"')]
+        assert len(detail_updates) == 1 and '"price"' in detail_updates[0] and '"title"' not in detail_updates[0]
+        assert len(detail_inserts) == 1 and "ON CONFLICT" in detail_inserts[0]
+        # the details are loaded once; the response reuses what was written
+        detail_selects = [sql for sql in statements if sql.startswith('SELECT "app_offers_detail"')]
+        assert len(detail_selects) == 1
+
+        details = {d["offer_type"]: d for d in response.json()["details"]}
+        assert (details["basic"]["price"], details["premium"]["revisions"]) == ("8.00", 5)
+        offer.refresh_from_db()
+        assert offer.min_price == 8 and offer.details.count() == 3
+
+        # Nothing changed: no detail writes at all.
+        with CaptureQueriesContext(connection) as queries:
+            client.patch(url, payload, format="json")
+        assert not [q for q in queries.captured_queries if "app_offers_detail" in q["sql"] and not q["sql"].startswith("SELECT")]
+
+    def test_patch_rejects_duplicate_offer_types(self, client, offer, business_user):
+        client.force_authenticate(user=business_user)
+        detail = {"title": "Basic", "revisions": 1, "delivery_time_in_days": 3, "price": 8, "features": [], "offer_type": "basic"}
+        response = client.patch(reverse("offer", args=[offer.id]), {"details": [detail, detail]}, format="json")
+        assert response.status_code == 400
+
     def test_delete_offer_by_owner(self, client, offer, business_user):
         client.force_authenticate(user=business_user)
         url = reverse("offer", args=[offer.id])
@@ -81,3 +319,264 @@ class TestOfferViews:
         assert response.status_code == 200
         data = response.json()
         assert data['id'] == detail_id
+
+    def test_search_uses_prefix_terms_and_relevance(self, client, offer, business_user):
+        logo = Offer.objects.create(user=business_user, title="Logo design", description="Logos and branding")
+        Offer.objects.create(user=business_user, title="Website", description="A landing page with a logo")
+
+        response = client.get(reverse("offers"), {"search": "log"})
+        titles = [o["title"] for o in response.json()["results"]]
+        assert titles == ["Logo design", "Website"]
+
+        response = client.get(reverse("offers"), {"search": "logo bran"})
+        assert [o["id"] for o in response.json()["results"]] == [logo.id]
+
+    def test_search_index_follows_offer_updates_and_deletes(self, client, offer):
+        offer.title = "Illustration"
+        offer.save()
+        assert client.get(reverse("offers"), {"search": "illus"}).json()["count"] == 1
+        assert client.get(reverse("offers"), {"search": "test"}).json()["count"] == 0
+
+        offer.delete()
+        assert client.get(reverse("offers"), {"search": "illus"}).json()["count"] == 0
+
+    @pytest.mark.parametrize("page_size", [1, 6, 100])
+    def test_listing_query_count_is_constant(self, client, business_user, customer_user, django_assert_num_queries, page_size):
+        for i in range(page_size):
+            offer = Offer.objects.create(user=business_user, title=f"Offer {i}", description="Desc")
+            for offer_type, price in (("basic", 10), ("standard", 20), ("premium", 30)):
+                Detail.objects.create(offer=offer, title=offer_type, revisions=1, delivery_time_in_days=1, price=price, features=[], offer_type=offer_type)
+        client.force_authenticate(user=customer_user)
+        get_offer_count()  # the maintained offer count is cached after its first use
+
+        # validators aggregate, COUNT(*), offers joined with user and profile, prefetched details
+        with django_assert_num_queries(4):
+            response = client.get(reverse("offers"), {"page_size": page_size})
+        assert len(response.json()["results"]) == page_size
+        assert all(len(o["details"]) == 3 for o in response.json()["results"])
+
+        # validators aggregate, offers joined with user and profile, prefetched details
+        with django_assert_num_queries(3):
+            response = client.get(reverse("offers"), {"cursor": "", "page_size": page_size})
+        assert len(response.json()["results"]) == page_size
+
+    def test_listing_sparse_fieldset_skips_unneeded_queries(self, client, offer, customer_user):
+        client.force_authenticate(user=customer_user)
+        get_offer_count()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse("offers"), {"fields": "id,title,min_price"})
+        assert response.status_code == 200
+        assert response.json()["results"] == [{"id": offer.id, "title": "Test Offer", "min_price": "10.00"}]
+        # validators aggregate, then COUNT(*) and the page: no details query and no user/profile join
+        assert len(queries.captured_queries) == 3
+        assert not any("JOIN" in q["sql"] or "app_offers_detail" in q["sql"] for q in queries.captured_queries[1:])
+
+        response = client.get(reverse("offers"), {"exclude": "details,description", "fields": "title,details,user_details"})
+        assert response.json()["results"] == [{"title": "Test Offer", "user_details": {"first_name": "", "last_name": "", "username": "business"}}]
+
+    def test_listing_sparse_fieldset_with_cursor_and_cache(self, client, offer, business_user):
+        second = Offer.objects.create(user=business_user, title="Second", description="Desc")
+        response = client.get(reverse("offers"), {"cursor": "", "page_size": 1, "fields": "title", "ordering": "created_at"})
+        assert response.json()["results"] == [{"title": "Test Offer"}]
+        response = client.get(response.json()["next"])
+        assert response.json()["results"] == [{"title": "Second"}]
+
+        # anonymous listings are cached per fieldset
+        assert client.get(reverse("offers"), {"fields": "id"}).json()["results"] == [{"id": offer.id}, {"id": second.id}]
+        assert "title" in client.get(reverse("offers")).json()["results"][0]
+
+    @pytest.mark.parametrize("params", [{"fields": "id,password"}, {"exclude": "user__password"}])
+    def test_unknown_sparse_fields_are_rejected(self, client, offer, customer_user, params):
+        assert client.get(reverse("offers"), params).status_code == 400
+        client.force_authenticate(user=customer_user)
+        response = client.get(reverse("offer", args=[offer.id]), params)
+        assert response.status_code == 400
+        assert "Unknown field(s)" in response.json()["detail"]
+
+    def test_offer_and_detail_sparse_fieldsets(self, client, offer, customer_user, django_assert_num_queries):
+        client.force_authenticate(user=customer_user)
+        full = client.get(reverse("offer", args=[offer.id]))
+        with django_assert_num_queries(0):
+            sparse = client.get(reverse("offer", args=[offer.id]), {"fields": "id,title"})
+        assert sparse.json() == {"id": offer.id, "title": "Test Offer"}
+        assert sparse["ETag"] != full["ETag"]
+        assert client.get(reverse("offer", args=[offer.id]), {"fields": "id,title"}, HTTP_IF_NONE_MATCH=full["ETag"]).status_code == 200
+
+        detail = offer.details.first()
+        response = client.get(reverse("offer_details", args=[detail.id]), {"exclude": "features,revisions"})
+        assert set(response.json()) == {"id", "title", "delivery_time_in_days", "price", "offer_type"}
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="asserts on SQLite's EXPLAIN QUERY PLAN output")
+    @pytest.mark.parametrize("params, index", [
+        ({"min_price": 10, "ordering": "min_price"}, "SCAN app_offers_offer USING INDEX offer_min_price_id_idx"),
+        ({"max_delivery_time": 3, "ordering": "min_delivery_time"}, "SEARCH app_offers_offer USING INDEX offer_min_delivery_id_idx"),
+        ({"min_price": 10, "max_delivery_time": 3}, None),
+    ])
+    def test_detail_based_filters_do_not_join_details(self, client, offer, params, index):
+        queryset = OfferSerializer.prefetch_queryset(Offer.objects.all())
+        queryset = filter_offers(queryset, params).order_by(*get_offer_order_by(params.get("ordering", "created_at")))
+        plan = OfferFastSerializer().prepare(queryset).explain()
+
+        # min_price only probes details per offer through the offer_id index
+        detail_lines = [line for line in plan.splitlines() if "app_offers_detail" in line]
+        assert all("USING INDEX app_offers_detail_offer_id" in line for line in detail_lines)
+        assert len(detail_lines) == ("min_price" in params)
+        assert "GROUP BY" not in plan
+        assert plan.count("app_offers_offer") == 1
+        if index:
+            assert index in plan
+
+        # No query of the view joins details.
+        with CaptureQueriesContext(connection) as queries:
+            assert client.get(reverse("offers"), params).status_code == 200
+        assert not any('JOIN "app_offers_detail"' in q["sql"] for q in queries.captured_queries)
+
+    def test_offer_detail_query_count(self, client, offer, customer_user, django_assert_num_queries):
+        client.force_authenticate(user=customer_user)
+        # offer joined with user and profile, prefetched details
+        with django_assert_num_queries(2):
+            response = client.get(reverse("offer", args=[offer.id]))
+        assert response.status_code == 200
+
+        # served from the payload cache
+        with django_assert_num_queries(0):
+            assert client.get(reverse("offer", args=[offer.id])).json() == response.json()
+
+    def test_facets_for_filtered_set(self, client, offer, business_user, customer_user, django_assert_num_queries):
+        other = CustomUser.objects.create(username="other", email="other@test.com", type="business")
+        for owner, price, days in ((business_user, 60, 5), (other, 75, 20), (other, 130, 2)):
+            extra = Offer.objects.create(user=owner, title="Logo", description="Desc")
+            Detail.objects.create(offer=extra, title="Basic", revisions=1, delivery_time_in_days=days, price=price, features=[], offer_type="basic")
+        Offer.objects.create(user=other, title="Empty", description="No details")
+
+        client.force_authenticate(user=customer_user)
+        with django_assert_num_queries(3):
+            response = client.get(reverse("offer_facets"), {"price_bucket_size": 50})
+        data = response.json()
+        assert data["min_price"] == [
+            {"from": 0, "to": 50, "count": 1},
+            {"from": 50, "to": 100, "count": 2},
+            {"from": 100, "to": 150, "count": 1},
+        ]
+        assert [(b["label"], b["count"]) for b in data["delivery_time"]] == [("1", 1), ("2-3", 1), ("4-7", 1), ("8-14", 0), ("15+", 1)]
+        assert data["creators"] == [
+            {"creator_id": other.id, "username": "other", "count": 3},
+            {"creator_id": business_user.id, "username": "business", "count": 2},
+        ]
+
+        response = client.get(reverse("offer_facets"), {"search": "logo", "min_price": 70})
+        data = response.json()
+        assert data["min_price"] == [{"from": 50, "to": 100, "count": 1}, {"from": 100, "to": 150, "count": 1}]
+        assert data["creators"] == [{"creator_id": other.id, "username": "other", "count": 2}]
+
+    def test_facets_are_cached_for_anonymous_requests(self, client, offer):
+        assert client.get(reverse("offer_facets"))["X-Cache"] == "MISS"
+        assert client.get(reverse("offer_facets"))["X-Cache"] == "HIT"
+        assert client.get(reverse("offer_facets"), {"price_bucket_size": 0}).status_code == 400
+
+    def test_conditional_get_on_offer_list_with_shared_cache(self, client, offer, django_assert_num_queries, monkeypatch):
+        monkeypatch.setattr(views, "catalog_version_is_shared", lambda: True)
+        response = client.get(reverse("offers"))
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        # validated against the catalog version alone
+        with django_assert_num_queries(0):
+            response = client.get(reverse("offers"), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert client.get(reverse("offers"), HTTP_IF_MODIFIED_SINCE=last_modified).status_code == 304
+        assert client.get(reverse("offers"), {"page_size": 1}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+        Offer.objects.create(user=offer.user, title="New", description="Desc")
+        assert client.get(reverse("offers"), HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_conditional_get_on_offer_list_with_per_process_cache(self, client, offer, django_assert_num_queries):
+        response = client.get(reverse("offers"))
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        # every request could reach another worker with its own cache
+        cache.clear()
+        clear_local_caches()
+        with django_assert_num_queries(1):
+            response = client.get(reverse("offers"), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert client.get(reverse("offers"), HTTP_IF_MODIFIED_SINCE=last_modified).status_code == 304
+        assert client.get(reverse("offers"), {"page_size": 1}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+        assert client.get(reverse("offers"), {"min_price": "x"}, HTTP_IF_NONE_MATCH=etag).status_code == 400
+
+        # a write handled by another worker never bumped this process's catalog version
+        Offer.objects.filter(pk=offer.pk).update(title="Renamed", updated_at=timezone.now())
+        assert client.get(reverse("offers"), HTTP_IF_NONE_MATCH=etag).status_code == 200
+        etag = client.get(reverse("offers"))["ETag"]
+        offer.delete()
+        assert client.get(reverse("offers"), HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_conditional_get_on_offer_and_detail(self, client, offer, customer_user, django_assert_num_queries):
+        client.force_authenticate(user=customer_user)
+        detail = offer.details.first()
+        offer_etag = client.get(reverse("offer", args=[offer.id]))["ETag"]
+        detail_etag = client.get(reverse("offer_details", args=[detail.id]))["ETag"]
+
+        with django_assert_num_queries(0):
+            response = client.get(reverse("offer", args=[offer.id]), HTTP_IF_NONE_MATCH=offer_etag)
+        assert response.status_code == 304
+        with django_assert_num_queries(0):
+            response = client.get(reverse("offer_details", args=[detail.id]), HTTP_IF_NONE_MATCH=detail_etag)
+        assert response.status_code == 304
+
+        detail.price = 12
+        detail.save()
+        assert client.get(reverse("offer", args=[offer.id]), HTTP_IF_NONE_MATCH=offer_etag).status_code == 200
+        assert client.get(reverse("offer_details", args=[detail.id]), HTTP_IF_NONE_MATCH=detail_etag).status_code == 200
+
+
+class TestFastJSON:
+
+    def test_renderer_output_matches_drf_json_renderer(self):
+        payload = {
+            "price": Decimal("12.50"),
+            "text": "Grüße \u2028 line \u2029 paragraph \"quoted\"",
+            "lazy": gettext_lazy("Offer"),
+            "utc": datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            "offset": datetime(2024, 5, 1, 12, 30, tzinfo=dt_timezone(timedelta(hours=2))),
+            "day": date(2024, 5, 1),
+            "duration": timedelta(days=1, seconds=3),
+            "uuid": uuid.UUID(int=7),
+            "features": ["Logo", {"nested": [1, 2.5, None, True]}],
+            "int_keys": {1: "one"},
+            "huge": 2 ** 70,
+        }
+        assert FastJSONRenderer().render(payload) == JSONRenderer().render(payload)
+        assert FastJSONRenderer().render(None) == b""
+        indented = FastJSONRenderer().render({"a": 1}, "application/json; indent=2")
+        assert indented == JSONRenderer().render({"a": 1}, "application/json; indent=2")
+
+    @pytest.mark.parametrize("value", [
+        0.1, 1 / 3, 2.0, 1e-4, 1e-5, -2.5e-7, 5e-324, 1e15, 1e16, -1.2345678901234568e17, 1.7976931348623157e308,
+    ])
+    def test_renderer_writes_floats_like_drf_json_renderer(self, value):
+        payload = {"average": value, "values": [value, "1e+5 stays text"]}
+        assert FastJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+    def test_renderer_renders_non_finite_floats_as_null(self):
+        # JSONRenderer raises ValueError here (strict JSON); see core/renderers.py
+        assert FastJSONRenderer().render({"value": float("nan"), "limit": float("inf")}) == b'{"value":null,"limit":null}'
+
+    @pytest.mark.django_db
+    def test_api_uses_fast_json_for_requests_and_responses(self):
+        business_user = CustomUser.objects.create(username="business", email="business@test.com", type="business")
+        client = APIClient()
+        client.force_authenticate(user=business_user)
+        payload = TestOfferViews.offer_payload("Café")
+
+        response = client.post(reverse("offers"), json.dumps(payload), content_type="application/json")
+        assert response.status_code == 201
+        assert isinstance(response.accepted_renderer, FastJSONRenderer)
+        response = client.get(reverse("offers"), {"fields": "title"})
+        assert response.content == '{"count":1,"next":null,"previous":null,"results":[{"title":"Café"}],"count_is_exact":true}'.encode()
+
+        response = client.post(reverse("offers"), '{"title": NaN}', content_type="application/json")
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("JSON parse error")
@@ -1,6 +1,8 @@
 from django.contrib import admin
 
-from app_orders.models import Order
+from app_orders.models import BusinessOrderStats, Order, OrderIdempotencyKey
 
 
-admin.site.register(Order)
\ No newline at end of file
+admin.site.register(Order)
+admin.site.register(BusinessOrderStats)
+admin.site.register(OrderIdempotencyKey)
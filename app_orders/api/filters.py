@@ -0,0 +1,56 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from app_orders.models import Order
+
+ORDER_STATUSES = tuple(dict(Order.STATUS_CHOICES))
+
+
+def parse_timestamp(value, next_day=False):
+    """
+    Parses an ISO 8601 datetime or date. A date stands for the start of that
+    day (of the following day with next_day=True); naive values are
+    interpreted in the current time zone.
+
+    Raises:
+        ValueError: If the value is neither a datetime nor a date.
+    """
+    day = parse_date(value)
+    if day is not None:
+        moment = datetime.combine(day + timedelta(days=1) if next_day else day, time.min)
+    else:
+        moment = parse_datetime(value)
+        if moment is None:
+            raise ValueError(f"Invalid timestamp: {value}")
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def filter_orders(queryset, params):
+    """
+    Applies the order listing filters found in the query parameters:
+    - status: one of ORDER_STATUSES
+    - created_after: orders created at or after the timestamp
+    - created_before: orders created before the timestamp; a date includes that whole day
+
+    Raises:
+        ValueError: If a parameter has an invalid value.
+    """
+    status = params.get("status")
+    if status:
+        if status not in ORDER_STATUSES:
+            raise ValueError(f"Invalid status: {status}")
+        queryset = queryset.filter(status=status)
+
+    created_after = params.get("created_after")
+    if created_after:
+        queryset = queryset.filter(created_at__gte=parse_timestamp(created_after))
+
+    created_before = params.get("created_before")
+    if created_before:
+        queryset = queryset.filter(created_at__lt=parse_timestamp(created_before, next_day=True))
+
+    return queryset
@@ -0,0 +1,48 @@
+from functools import reduce
+from operator import or_
+
+from django.db import connection
+
+from app_offers.api.pagination import KeysetPagination
+
+
+class OrderPagination(KeysetPagination):
+    """
+    Keyset pagination for the order listing, newest first by default.
+
+    The orders of a user are those matching any of several `branches` (placed as
+    customer, received as business user). An OR across the two foreign keys cannot
+    be served by a single index, so every page is read per branch, each an ordered
+    range scan of its (user, created_at, id) index limited to one page:
+
+    - with a UNION of the limited branch queries where the database supports
+      ordered, sliced compound queries (PostgreSQL, MySQL, Oracle);
+    - otherwise (SQLite) with one limited query per branch, merged in Python.
+
+    Attributes:
+        - ordering_fields (tuple): Only created_at; `id` breaks ties.
+    """
+    page_size = 20
+    ordering_fields = ("created_at",)
+    default_ordering = "-created_at"
+
+    def paginate_queryset(self, queryset, request, view=None, ordering=None, branches=()):
+        """
+        Returns one page of the rows of queryset matching any of the branch filters (Q objects).
+        """
+        self.branches = branches
+        return super().paginate_queryset(queryset, request, view=view, ordering=ordering)
+
+    def get_count(self, queryset):
+        return queryset.filter(reduce(or_, self.branches)).count()
+
+    def get_page(self, queryset, order_by, limit):
+        """
+        Returns the first `limit` rows of the union of the branches in `order_by` order.
+        """
+        pages = [queryset.filter(branch).order_by(*order_by)[:limit] for branch in self.branches]
+        if connection.features.supports_slicing_ordering_in_compound:
+            return pages[0].union(*pages[1:]).order_by(*order_by)[:limit]
+        # A row matching several branches is returned once, like with UNION.
+        rows = {self.get_position(row)[1]: row for page in pages for row in page}
+        return sorted(rows.values(), key=self.get_position, reverse=order_by[0].startswith("-"))[:limit]
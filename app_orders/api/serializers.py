@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from app_offers.models import Detail
 from app_orders.models import Order
+from core.fast_serializers import FastSerializer
 
 
 class OrderCreateSerializer(serializers.Serializer):
@@ -9,20 +10,34 @@ class OrderCreateSerializer(serializers.Serializer):
     Serializer for creating an Order from an offer detail.
 
     Fields:
-        - offer_detail_id: Integer ID of the Detail to create the order from.
+        - offer_detail_id: Integer ID of the Detail to create the order from;
+          validated_data["offer_detail"] holds the Detail, fetched together
+          with its offer in one query.
     """
-    offer_detail_id = serializers.IntegerField()
+    offer_detail_id = serializers.PrimaryKeyRelatedField(
+        queryset=Detail.objects.select_related('offer'),
+        source='offer_detail',
+        error_messages={'does_not_exist': "Detail with this ID does not exist."},
+    )
 
-    def validate_offer_detail_id(self, value):
-        """
-        Validates that the given offer_detail_id exists in the database.
 
-        Raises:
-            serializers.ValidationError: If the Detail with the given ID does not exist.
-        """
-        if not Detail.objects.filter(id=value).exists():
-            raise serializers.ValidationError("Detail with this ID does not exist.")
-        return value
+class OrderBulkStatusSerializer(serializers.Serializer):
+    """
+    Serializer for changing the status of many orders at once.
+
+    Fields:
+        - ids: IDs of the orders (1 to 1000, duplicates are ignored).
+        - status: Target status of all orders.
+    """
+    max_ids = 1000
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=max_ids
+    )
+    status = serializers.ChoiceField(choices=Order.STATUS_CHOICES)
+
+    def validate_ids(self, value):
+        return list(dict.fromkeys(value))
 
 
 class OrderSerializer(serializers.ModelSerializer):
@@ -59,3 +74,28 @@ class OrderSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+
+
+class OrderFastSerializer(FastSerializer):
+    """
+    Dict-based fast path producing the same output as OrderSerializer.
+    """
+    serializer_class = OrderSerializer
+
+
+class OrderSummarySerializer(serializers.Serializer):
+    """
+    Read-only representation of the aggregated order statistics of a business user.
+
+    Fields:
+        - business_user: ID of the business user
+        - status_counts: Number of orders per status
+        - total_orders: Number of orders
+        - total_revenue: Sum of the order prices
+        - average_delivery_time_in_days: Mean delivery time (null without orders)
+    """
+    business_user = serializers.IntegerField()
+    status_counts = serializers.DictField(child=serializers.IntegerField())
+    total_orders = serializers.IntegerField()
+    total_revenue = serializers.DecimalField(max_digits=20, decimal_places=2)
+    average_delivery_time_in_days = serializers.FloatField(allow_null=True)
@@ -1,24 +1,35 @@
+from django.db import IntegrityError, transaction
 from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
 from rest_framework import status
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from app_authentication.models import CustomUser
 from app_authentication.api.permissions import IsCustomerUser, IsBusinessUser
-from app_offers.models import Detail
-from app_orders.api.serializers import OrderSerializer, OrderCreateSerializer
-from app_orders.models import Order
+from app_orders.api.filters import filter_orders
+from app_orders.api.pagination import OrderPagination
+from app_orders.api.serializers import (
+    OrderSerializer, OrderBulkStatusSerializer, OrderCreateSerializer, OrderFastSerializer, OrderSummarySerializer,
+)
+from app_orders.idempotency import IDEMPOTENCY_KEY_MAX_LENGTH, get_idempotent_order
+from app_orders.models import Order, OrderIdempotencyKey
+from app_orders.stats import count_status_transitions, get_order_summary, get_status_count
+from core.fast_serializers import FastSerializationMixin
+from core.fieldsets import get_fieldset
 
 
-class OrdersView(APIView):
+class OrdersView(FastSerializationMixin, APIView):
     """
     API view to list orders for the authenticated user or to create a new order.
 
-    - GET: Retrieves all orders where the user is the customer or business user.
+    - GET: Lists the orders where the user is the customer or business user (cursor paginated).
     - POST: Creates a new order for a specific offer detail (customer only).
     """
+    fast_serializer_class = OrderFastSerializer
+    pagination_class = OrderPagination
 
     def get_permissions(self):
         """
@@ -35,31 +46,85 @@ class OrdersView(APIView):
 
     def get(self, request):
         """
-        Retrieves all orders associated with the authenticated user
-        (as customer or business user) and returns serialized data.
+        Lists the orders associated with the authenticated user
+        (as customer or business user), one cursor page at a time.
+        - Ordered by created_at (newest first, `ordering=created_at` for oldest
+          first) with id as tie-breaker; `cursor` carries the position and
+          `include_total=true` adds the count.
+        - Optional filters: status, created_after, created_before (400 if invalid).
+        - Each page is read from the (customer_user, created_at, id) and
+          (business_user, created_at, id) indexes, see OrderPagination.
+        - `fields` / `exclude` select a sparse fieldset.
         """
+        fields = get_fieldset(request, OrderSerializer)
+        try:
+            queryset = filter_orders(Order.objects.all(), request.query_params)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
         user = request.user
-        queryset = Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
-        serializer = OrderSerializer(queryset, many=True)
-        return Response(serializer.data)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(
+            # cursors are built from the created_at and id of the page's rows
+            self.prepare_queryset(queryset, fields, ("id", "created_at")),
+            request,
+            view=self,
+            ordering=request.query_params.get("ordering"),
+            branches=(Q(customer_user=user), Q(business_user=user)),
+        )
+        return paginator.get_paginated_response(self.serialize_rows(page, OrderSerializer, fields))
 
     def post(self, request):
         """
         Creates a new order based on an offer detail ID.
-        - Validates that the detail exists.
-        - Creates an order linking the customer and business user.
+        - The detail and its offer are read with one query (400 if the detail
+          does not exist).
+        - Creates an order linking the customer and business user; the business
+          user's order counters are updated in the same transaction.
+        - An optional Idempotency-Key header (up to 255 characters) makes retries
+          safe: repeating a key returns the order created by its first request
+          (in its current state) with an `Idempotent-Replayed: true` header.
         - Returns serialized order data.
         """
+        key = request.headers.get("Idempotency-Key")
+        if key is not None:
+            if not key or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+                return Response(
+                    {"detail": f"Idempotency-Key must be 1 to {IDEMPOTENCY_KEY_MAX_LENGTH} characters."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            order = get_idempotent_order(request.user, key)
+            if order is not None:
+                return self.replayed_response(order)
+
         serializer = OrderCreateSerializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        offer_detail_id = serializer.validated_data["offer_detail_id"]
-        offer_detail = get_object_or_404(Detail, pk=offer_detail_id)
+        offer_detail = serializer.validated_data["offer_detail"]
+        try:
+            with transaction.atomic():
+                order = self.create_order(request.user, offer_detail)
+                if key is not None:
+                    OrderIdempotencyKey.objects.create(user=request.user, key=key, order=order)
+        except IntegrityError:
+            # a concurrent request with the same key created the order first
+            order = get_idempotent_order(request.user, key) if key is not None else None
+            if order is None:
+                raise
+            return self.replayed_response(order)
+
+        response_serializer = OrderSerializer(order)
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
-        order = Order.objects.create(
-            customer_user=request.user,
-            business_user=offer_detail.offer.user,
+    @staticmethod
+    def create_order(customer, offer_detail):
+        """
+        Inserts the order for an offer detail (with its offer loaded).
+        """
+        return Order.objects.create(
+            customer_user=customer,
+            business_user_id=offer_detail.offer.user_id,
             title=offer_detail.title,
             revisions=offer_detail.revisions,
             delivery_time_in_days=offer_detail.delivery_time_in_days,
@@ -69,8 +134,11 @@ class OrdersView(APIView):
             status="in_progress",
         )
 
-        response_serializer = OrderSerializer(order)
-        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+    @staticmethod
+    def replayed_response(order):
+        response = Response(OrderSerializer(order).data, status=status.HTTP_201_CREATED)
+        response["Idempotent-Replayed"] = "true"
+        return response
 
 
 class OrderView(APIView):
@@ -109,8 +177,10 @@ class OrderView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        order.status = status_value
-        order.save()
+        # the status transition and its counter update commit together
+        with transaction.atomic():
+            order.status = status_value
+            order.save()
 
         serializer = OrderSerializer(order)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -122,10 +192,52 @@ class OrderView(APIView):
         - Returns HTTP 204 No Content on success.
         """
         order = get_object_or_404(Order, pk=id)
-        order.delete()
+        with transaction.atomic():
+            order.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class OrderBulkStatusView(APIView):
+    """
+    API view to change the status of many orders of the business user at once.
+
+    - PATCH: Set one status on a list of orders (business user only)
+    """
+    permission_classes = [IsAuthenticated, IsBusinessUser]
+
+    def patch(self, request):
+        """
+        Sets `status` on the orders listed in `ids`.
+        - Ownership of the whole set is checked with one query; ids that do not
+          exist or belong to another business user are rejected.
+        - The owned orders not already in the status are changed with a single
+          `UPDATE ... WHERE id IN (...)`, and the business user's counters and
+          cached statistics are adjusted in the same transaction.
+        - Returns the ids that were updated, unchanged and rejected.
+        """
+        serializer = OrderBulkStatusSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        ids, status_value = serializer.validated_data["ids"], serializer.validated_data["status"]
+
+        with transaction.atomic():
+            owned = dict(
+                Order.objects.select_for_update()
+                .filter(id__in=ids, business_user=request.user)
+                .values_list("id", "status")
+            )
+            updated = [pk for pk in ids if pk in owned and owned[pk] != status_value]
+            if updated:
+                Order.objects.filter(id__in=updated).update(status=status_value, updated_at=timezone.now())
+                count_status_transitions(request.user.id, [owned[pk] for pk in updated], status_value)
+
+        return Response({
+            "updated": updated,
+            "unchanged": [pk for pk in ids if owned.get(pk) == status_value],
+            "rejected": [pk for pk in ids if pk not in owned],
+        }, status=status.HTTP_200_OK)
+
+
 class OrderCountView(APIView):
     """
     API view to retrieve the number of in-progress orders for a specific business user.
@@ -134,10 +246,12 @@ class OrderCountView(APIView):
 
     def get(self, request, business_user_id):
         """
-        Returns the count of in-progress orders for the given business user.
+        Returns the count of in-progress orders for the given business user,
+        read from the materialized BusinessOrderStats row.
         """
-        business_user = get_object_or_404(CustomUser, pk=business_user_id, type='business')
-        order_count = Order.objects.filter(business_user=business_user, status='in_progress').count()
+        order_count = get_status_count(business_user_id, 'in_progress')
+        if order_count is None:
+            raise NotFound()
         return Response({'order_count': order_count}, status=200)
 
 
@@ -149,8 +263,29 @@ class CompletedOrderView(APIView):
 
     def get(self, request, business_user_id):
         """
-        Returns the count of completed orders for the given business user.
+        Returns the count of completed orders for the given business user,
+        read from the materialized BusinessOrderStats row.
         """
-        business_user = get_object_or_404(CustomUser, pk=business_user_id, type='business')
-        completed_order_count = Order.objects.filter(business_user=business_user, status='completed').count()
+        completed_order_count = get_status_count(business_user_id, 'completed')
+        if completed_order_count is None:
+            raise NotFound()
         return Response({'completed_order_count': completed_order_count}, status=200)
+
+
+class OrderSummaryView(APIView):
+    """
+    API view to retrieve all order statistics of a specific business user at once.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, business_user_id):
+        """
+        Returns the order count per status, the total order count and revenue and
+        the average delivery time for the given business user.
+        - Aggregated with one GROUP BY status query and cached until the next
+          write to the user's orders.
+        """
+        summary = get_order_summary(business_user_id, lambda data: dict(OrderSummarySerializer(data).data))
+        if summary is None:
+            raise NotFound()
+        return Response(summary, status=200)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AppOrdersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app_orders'
+
+    def ready(self):
+        from app_orders import signals
@@ -0,0 +1,45 @@
+"""
+Idempotency keys for order creation (see OrderIdempotencyKey).
+
+A client retrying POST /api/orders/ with the same Idempotency-Key header gets
+the order created by its first attempt. Keys expire after
+ORDER_IDEMPOTENCY_KEY_TTL seconds; an expired key is deleted when it is sent
+again, and `manage.py purge_order_idempotency_keys` removes the rest.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from app_orders.models import OrderIdempotencyKey
+
+IDEMPOTENCY_KEY_MAX_LENGTH = OrderIdempotencyKey._meta.get_field('key').max_length
+
+
+def expiry_cutoff():
+    """
+    Returns the creation time before which keys are expired.
+    """
+    return timezone.now() - timedelta(seconds=settings.ORDER_IDEMPOTENCY_KEY_TTL)
+
+
+def get_idempotent_order(user, key):
+    """
+    Returns the order created with `key` by `user`, or None if the key is
+    unknown or expired (an expired key is deleted so it can be reused).
+    """
+    record = OrderIdempotencyKey.objects.select_related('order').filter(user=user, key=key).first()
+    if record is None:
+        return None
+    if record.created_at < expiry_cutoff():
+        record.delete()
+        return None
+    return record.order
+
+
+def purge_expired_keys():
+    """
+    Deletes all expired keys and returns their number.
+    """
+    deleted, _ = OrderIdempotencyKey.objects.filter(created_at__lt=expiry_cutoff()).delete()
+    return deleted
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from app_orders.idempotency import purge_expired_keys
+
+
+class Command(BaseCommand):
+    """
+    Deletes the order Idempotency-Keys older than ORDER_IDEMPOTENCY_KEY_TTL
+    seconds, keeping the table small. Meant to run periodically (e.g. cron).
+    """
+    help = "Delete expired order idempotency keys."
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_keys()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired idempotency keys."))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from app_orders.stats import rebuild_order_stats
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the BusinessOrderStats counter table from scratch with one grouped
+    query over the orders, repairing drift from writes that bypass the Order
+    signals (queryset.update(), raw SQL, restores).
+    """
+    help = "Rebuild the per-business-user order status counters from the orders."
+
+    def handle(self, *args, **options):
+        stats = rebuild_order_stats()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt order counters for {len(stats)} business users."))
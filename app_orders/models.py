@@ -37,8 +37,87 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # The order listing reads one range of each index per page (see OrderPagination).
+        indexes = [
+            models.Index(fields=['customer_user', 'created_at', 'id'], name='order_customer_created_id_idx'),
+            models.Index(fields=['business_user', 'created_at', 'id'], name='order_business_created_id_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the loaded business user and status, so saves can tell which
+        counters of BusinessOrderStats a status transition moves.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance.remember_counted_state()
+        return instance
+
+    def remember_counted_state(self):
+        self._counted_state = (self.__dict__.get('business_user_id'), self.__dict__.get('status'))
+
     def __str__(self):
         """
         Returns a string representation of the order, including its ID and title.
         """
         return f"Order {self.id} - {self.title}"
+
+
+class BusinessOrderStats(models.Model):
+    """
+    Materialized number of orders per status for one business user.
+
+    Kept current by the Order signals (creation, status transitions, deletion)
+    with atomic F() updates; `manage.py reconcile_order_stats` rebuilds the table
+    from the orders. A missing row means "not materialized yet", not zero orders.
+
+    Fields:
+        - business_user: The business user (primary key).
+        - in_progress_count / completed_count / cancelled_count: Orders per status.
+        - updated_at: Timestamp of the last change.
+    """
+    business_user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='order_stats'
+    )
+    in_progress_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    cancelled_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def count_field(status):
+        """
+        Returns the counter column for an order status.
+        """
+        return f'{status}_count'
+
+    def __str__(self):
+        return f"Order stats of user {self.business_user_id}"
+
+
+class OrderIdempotencyKey(models.Model):
+    """
+    An Idempotency-Key header sent with an order creation, mapped to the order it
+    created. The same user repeating the key within ORDER_IDEMPOTENCY_KEY_TTL
+    seconds gets that order back instead of a new one.
+
+    Fields:
+        - user: The customer who sent the key.
+        - key: The header value (unique per user).
+        - order: The order created by the first request with the key.
+        - created_at: Timestamp of the first request (expiry).
+    """
+    # the (user, key) constraint indexes user lookups already
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+', db_index=False)
+    key = models.CharField(max_length=255)
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='order_idempotency_user_key_uniq'),
+        ]
+
+    def __str__(self):
+        return f"Idempotency key {self.key} of user {self.user_id}"
@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app_orders.models import Order
+from app_orders.stats import count_order_change, invalidate_order_summaries, rebuild_order_stats
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, **kwargs):
+    """
+    Moves the business user's order counters on creation and status transitions.
+    Instances not loaded from the database have an unknown previous state, so
+    their business user's counters are rebuilt from the orders.
+    The cached statistics of the previous and current business user are dropped.
+    """
+    current = (instance.business_user_id, instance.status)
+    if created:
+        previous = None
+    elif hasattr(instance, '_counted_state'):
+        previous = instance._counted_state
+    else:
+        invalidate_order_summaries(instance.business_user_id)
+        rebuild_order_stats([instance.business_user_id])
+        instance.remember_counted_state()
+        return
+    invalidate_order_summaries(current[0], previous[0] if previous else None)
+    count_order_change(previous, current)
+    instance.remember_counted_state()
+
+
+@receiver(post_delete, sender=Order)
+def count_deleted_order(sender, instance, **kwargs):
+    """
+    Decrements the business user's counter for the deleted order's status and
+    drops its cached statistics.
+    """
+    previous = getattr(instance, '_counted_state', (instance.business_user_id, instance.status))
+    invalidate_order_summaries(previous[0])
+    count_order_change(previous, None)
@@ -0,0 +1,179 @@
+"""
+Per-business-user order counters (see BusinessOrderStats).
+
+Writes move counters with single `UPDATE ... SET x = x + 1` statements, so
+concurrent orders never lose increments. A business user's row is
+materialized from the orders the first time one of its counters grows (or is
+read), and the reconcile command rebuilds the whole table.
+
+The combined statistics (counts, revenue, delivery time) are aggregated on
+demand and cached per business user until the next write to its orders.
+"""
+from collections import Counter
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from app_authentication.models import CustomUser
+from app_offers.cache import PayloadCache
+from app_orders.models import BusinessOrderStats, Order
+
+ORDER_STATUSES = tuple(dict(Order.STATUS_CHOICES))
+COUNT_FIELDS = tuple(BusinessOrderStats.count_field(status) for status in ORDER_STATUSES)
+
+# No per-process layer: a business user sees its own order changes from every worker.
+order_summary_cache = PayloadCache("orders:summary", local=False)
+
+
+def adjust_order_stats(business_user_id, deltas, materialize=True):
+    """
+    Adds `deltas` ({status: change}) to the counters of one business user.
+    If the user has no row yet and materialize is set, the row is built from
+    the orders instead (which already include the change); otherwise the
+    change is dropped and left to the next rebuild.
+    """
+    changes = {
+        BusinessOrderStats.count_field(status): F(BusinessOrderStats.count_field(status)) + delta
+        for status, delta in deltas.items() if delta and status in ORDER_STATUSES
+    }
+    if not changes:
+        return
+    updated = BusinessOrderStats.objects.filter(pk=business_user_id).update(updated_at=timezone.now(), **changes)
+    if not updated and materialize:
+        rebuild_order_stats([business_user_id])
+
+
+def count_order_change(previous, current):
+    """
+    Moves the counters for an order whose (business_user_id, status) changed
+    from `previous` to `current`; None stands for "did not exist".
+    Deletions never create counter rows.
+    """
+    if previous == current:
+        return
+    deltas = {}
+    if previous is not None:
+        deltas.setdefault(previous[0], {})[previous[1]] = -1
+    if current is not None:
+        changes = deltas.setdefault(current[0], {})
+        changes[current[1]] = changes.get(current[1], 0) + 1
+    with transaction.atomic():
+        for business_user_id, changes in deltas.items():
+            adjust_order_stats(business_user_id, changes, materialize=any(delta > 0 for delta in changes.values()))
+
+
+def count_status_transitions(business_user_id, previous_statuses, status):
+    """
+    Moves the counters for orders of one business user that were changed from
+    `previous_statuses` (one entry per order) to `status` by a write bypassing
+    the Order signals (queryset.update()), and drops its cached statistics.
+    """
+    deltas = {previous: -count for previous, count in Counter(previous_statuses).items()}
+    deltas[status] = deltas.get(status, 0) + len(previous_statuses)
+    adjust_order_stats(business_user_id, deltas)
+    invalidate_order_summaries(business_user_id)
+
+
+def rebuild_order_stats(business_user_ids=None):
+    """
+    Recomputes the counters from the orders with one grouped query and stores
+    them. Without ids the whole table is rebuilt from scratch.
+    Returns {business_user_id: BusinessOrderStats}.
+    """
+    orders = Order.objects.all()
+    if business_user_ids is not None:
+        orders = orders.filter(business_user_id__in=business_user_ids)
+    aggregates = {
+        BusinessOrderStats.count_field(status): Count('id', filter=Q(status=status)) for status in ORDER_STATUSES
+    }
+    stats = {
+        row['business_user_id']: BusinessOrderStats(
+            business_user_id=row['business_user_id'], **{field: row[field] for field in aggregates}
+        )
+        for row in orders.order_by().values('business_user_id').annotate(**aggregates)
+    }
+    for business_user_id in business_user_ids or ():
+        stats.setdefault(business_user_id, BusinessOrderStats(business_user_id=business_user_id))
+
+    with transaction.atomic():
+        if business_user_ids is None:
+            BusinessOrderStats.objects.all().delete()
+        BusinessOrderStats.objects.bulk_create(
+            stats.values(),
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['business_user'],
+            update_fields=[*COUNT_FIELDS, 'updated_at'],
+        )
+    return stats
+
+
+def get_status_count(business_user_id, status):
+    """
+    Returns the number of orders in `status` for a business user, or None if
+    there is no business user with that id.
+    - A single primary-key lookup of the counter row (joined with the user for
+      its type); only the first read of a user without a row builds it.
+    """
+    field = BusinessOrderStats.count_field(status)
+    count = (
+        BusinessOrderStats.objects.filter(pk=business_user_id, business_user__type='business')
+        .values_list(field, flat=True).first()
+    )
+    if count is None:
+        if not CustomUser.objects.filter(pk=business_user_id, type='business').exists():
+            return None
+        count = getattr(rebuild_order_stats([business_user_id])[business_user_id], field)
+    return count
+
+
+def aggregate_order_summary(business_user_id):
+    """
+    Returns the order statistics of a business user from one `GROUP BY status`
+    query over its orders:
+    - status_counts: {status: count} for every status (0 if it has no orders)
+    - total_orders, total_revenue (sum of the order prices)
+    - average_delivery_time_in_days (None without orders)
+    """
+    rows = (
+        Order.objects.filter(business_user_id=business_user_id)
+        .order_by()
+        .values('status')
+        .annotate(count=Count('id'), revenue=Sum('price'), delivery_days=Sum('delivery_time_in_days'))
+    )
+    status_counts = dict.fromkeys(ORDER_STATUSES, 0)
+    revenue, delivery_days = Decimal('0'), 0
+    for row in rows:
+        status_counts[row['status']] = row['count']
+        revenue += row['revenue']
+        delivery_days += row['delivery_days']
+    total = sum(status_counts.values())
+    return {
+        'business_user': business_user_id,
+        'status_counts': status_counts,
+        'total_orders': total,
+        'total_revenue': revenue,
+        'average_delivery_time_in_days': delivery_days / total if total else None,
+    }
+
+
+def get_order_summary(business_user_id, serialize):
+    """
+    Returns `serialize(aggregate_order_summary(...))` for a business user from
+    order_summary_cache, or None if there is no business user with that id.
+    - A hit costs no query; a miss checks the user and runs the aggregate.
+    """
+    def load():
+        if not CustomUser.objects.filter(pk=business_user_id, type='business').exists():
+            return None
+        return serialize(aggregate_order_summary(business_user_id))
+    return order_summary_cache.get_or_load(business_user_id, load)
+
+
+def invalidate_order_summaries(*business_user_ids):
+    """
+    Drops the cached statistics of the given business users.
+    """
+    order_summary_cache.invalidate(*{pk for pk in business_user_ids if pk is not None})
@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from app_authentication.models import CustomUser
+from app_orders.models import BusinessOrderStats, Order, OrderIdempotencyKey
+
+
+@pytest.mark.django_db
+class TestOrderCommands:
+
+    def test_reconcile_order_stats_repairs_drift(self, capsys):
+        customer = CustomUser.objects.create(username="customer", email="customer@test.com", type="customer")
+        business = CustomUser.objects.create(username="business", email="business@test.com", type="business")
+        order = Order.objects.create(customer_user=customer, business_user=business, title="Order", delivery_time_in_days=1, price=10)
+        Order.objects.filter(pk=order.pk).update(status="completed")
+
+        call_command("reconcile_order_stats")
+
+        stats = BusinessOrderStats.objects.get(pk=business.pk)
+        assert (stats.in_progress_count, stats.completed_count) == (0, 1)
+        assert "1 business users" in capsys.readouterr().out
+
+    def test_purge_order_idempotency_keys_deletes_expired_keys(self, capsys, settings):
+        settings.ORDER_IDEMPOTENCY_KEY_TTL = 3600
+        customer = CustomUser.objects.create(username="customer", email="customer@test.com", type="customer")
+        business = CustomUser.objects.create(username="business", email="business@test.com", type="business")
+        order = Order.objects.create(customer_user=customer, business_user=business, title="Order", delivery_time_in_days=1, price=10)
+        OrderIdempotencyKey.objects.create(user=customer, key="fresh", order=order)
+        OrderIdempotencyKey.objects.create(user=customer, key="old", order=order)
+        OrderIdempotencyKey.objects.filter(key="old").update(created_at=timezone.now() - timedelta(hours=2))
+
+        call_command("purge_order_idempotency_keys")
+
+        assert list(OrderIdempotencyKey.objects.values_list("key", flat=True)) == ["fresh"]
+        assert "Deleted 1 expired" in capsys.readouterr().out
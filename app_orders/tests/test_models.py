@@ -2,7 +2,8 @@ import pytest
 from decimal import Decimal
 from django.contrib.auth import get_user_model
 from app_offers.models import Offer, Detail
-from app_orders.models import Order
+from app_orders.models import BusinessOrderStats, Order
+from app_orders.stats import rebuild_order_stats
 
 User = get_user_model()
 
@@ -90,3 +91,74 @@ class TestOrderModel:
         order.status = "invalid_status"
         with pytest.raises(ValidationError):
             order.full_clean()
+
+
+@pytest.mark.django_db
+class TestBusinessOrderStats:
+
+    @pytest.fixture
+    def users(self):
+        customer = User.objects.create(username="customer", email="customer@test.com", type="customer")
+        business = User.objects.create(username="business", email="business@test.com", type="business")
+        return customer, business
+
+    @staticmethod
+    def create_order(customer, business, **kwargs):
+        return Order.objects.create(customer_user=customer, business_user=business, title="Order", delivery_time_in_days=1, price=10, **kwargs)
+
+    @staticmethod
+    def counts(business):
+        stats = BusinessOrderStats.objects.get(pk=business.pk)
+        return stats.in_progress_count, stats.completed_count, stats.cancelled_count
+
+    def test_counters_follow_creation_transitions_and_deletes(self, users):
+        customer, business = users
+        first = self.create_order(customer, business)
+        self.create_order(customer, business)
+        assert self.counts(business) == (2, 0, 0)
+
+        first = Order.objects.get(pk=first.pk)
+        first.status = "completed"
+        first.save()
+        first.save()  # saving again is not a transition
+        assert self.counts(business) == (1, 1, 0)
+
+        first.status = "cancelled"
+        first.save()
+        assert self.counts(business) == (1, 0, 1)
+
+        first.delete()
+        assert self.counts(business) == (1, 0, 0)
+
+    def test_counters_for_unloaded_instances_and_cascades(self, users):
+        customer, business = users
+        order = self.create_order(customer, business)
+        Order.objects.filter(pk=order.pk).update(status="completed")  # bypasses the signals
+        assert self.counts(business) == (1, 0, 0)
+
+        # an instance not loaded from the database has an unknown previous state
+        Order(pk=order.pk, customer_user=customer, business_user=business, title="Order",
+              delivery_time_in_days=1, price=10, status="completed", created_at=order.created_at).save()
+        assert self.counts(business) == (0, 1, 0)
+
+        customer.delete()
+        assert self.counts(business) == (0, 0, 0)
+        self.create_order(User.objects.create(username="c2", email="c2@test.com", type="customer"), business)
+        business.delete()
+        assert not BusinessOrderStats.objects.exists()
+
+    def test_rebuild_from_scratch(self, users):
+        customer, business = users
+        other = User.objects.create(username="other", email="other@test.com", type="business")
+        self.create_order(customer, business)
+        self.create_order(customer, business, status="completed")
+        self.create_order(customer, other, status="cancelled")
+        BusinessOrderStats.objects.filter(pk=business.pk).update(in_progress_count=7)
+        BusinessOrderStats.objects.create(business_user=customer, completed_count=3)
+
+        stats = rebuild_order_stats()
+
+        assert set(stats) == {business.pk, other.pk}
+        assert self.counts(business) == (1, 1, 0)
+        assert self.counts(other) == (0, 0, 1)
+        assert not BusinessOrderStats.objects.filter(pk=customer.pk).exists()
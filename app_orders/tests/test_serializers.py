@@ -1,5 +1,6 @@
 import pytest
-from app_orders.api.serializers import OrderSerializer, OrderCreateSerializer
+from rest_framework.renderers import JSONRenderer
+from app_orders.api.serializers import OrderSerializer, OrderCreateSerializer, OrderFastSerializer
 from app_orders.models import Order
 from app_offers.models import Offer, Detail
 from app_authentication.models import CustomUser
@@ -69,3 +70,16 @@ class TestOrderSerializers:
         serializer = OrderCreateSerializer(data={"offer_detail_id": 999})
         assert not serializer.is_valid()
         assert "offer_detail_id" in serializer.errors or serializer.errors != {}
+
+    def test_order_fast_serializer_matches_order_serializer(self, order, customer, business):
+        Order.objects.create(
+            customer_user=customer, business_user=business, title="Logo", delivery_time_in_days=1,
+            price="19.90", features=["Vector", {"files": 3}], offer_type="premium", status="completed"
+        )
+        queryset = Order.objects.order_by("id")
+        fast = OrderFastSerializer()
+        expected = OrderSerializer(queryset, many=True).data
+        actual = fast.serialize(fast.prepare(queryset))
+
+        assert actual == expected
+        assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
@@ -1,10 +1,19 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
 import pytest
 from rest_framework.test import APIClient
+from django.db import connection
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
 from app_authentication.models import CustomUser
 from app_offers.models import Offer, Detail
-from app_orders.models import Order
+from app_orders.api import views
+from app_orders.api.pagination import OrderPagination
+from app_orders.models import Order, OrderIdempotencyKey
+from app_orders.stats import rebuild_order_stats
 
 @pytest.mark.django_db
 class TestOrdersViews:
@@ -47,7 +56,78 @@ class TestOrdersViews:
         url = reverse('orders')
         response = client_customer.get(url)
         assert response.status_code == 200
-        assert response.data == []
+        assert response.data == {"next": None, "previous": None, "results": []}
+
+    def test_get_orders_sparse_fieldset(self, client_customer, offer):
+        detail = offer.details.first()
+        client_customer.post(reverse('orders'), {"offer_detail_id": detail.id}, format='json')
+        response = client_customer.get(reverse('orders'), {"fields": "title,status"})
+        assert response.json()["results"] == [{"title": "Basic", "status": "in_progress"}]
+        response = client_customer.get(reverse('orders'), {"fields": "title,secret"})
+        assert response.status_code == 400
+        assert "secret" in response.json()["detail"]
+
+    @staticmethod
+    def create_orders(customer, business, count, **kwargs):
+        return [
+            Order.objects.create(customer_user=customer, business_user=business, title=f"Order {i}",
+                                 delivery_time_in_days=1, price=10, **kwargs)
+            for i in range(count)
+        ]
+
+    def test_get_orders_pages_through_both_roles(self, client_business, business, customer, django_assert_num_queries):
+        other = CustomUser.objects.create(username="other", email="other@test.com", type="business")
+        received = self.create_orders(customer, business, 3)
+        placed = self.create_orders(business, other, 2)
+        self_order = self.create_orders(business, business, 1)
+        self.create_orders(customer, other, 2)  # not related to business
+        expected = [order.id for order in received + placed + self_order][::-1]
+
+        # COUNT(*), then one limited, index-ordered query per role (SQLite has no sliced UNION)
+        with django_assert_num_queries(3):
+            response = client_business.get(reverse('orders'), {"page_size": 4, "include_total": "true"})
+        data = response.json()
+        assert data["count"] == 6
+        assert [o["id"] for o in data["results"]] == expected[:4]
+
+        data = client_business.get(data["next"]).json()
+        assert [o["id"] for o in data["results"]] == expected[4:]
+        assert data["next"] is None
+        data = client_business.get(data["previous"]).json()
+        assert [o["id"] for o in data["results"]] == expected[:4]
+
+        response = client_business.get(reverse('orders'), {"ordering": "created_at", "page_size": 10})
+        assert [o["id"] for o in response.json()["results"]] == expected[::-1]
+
+    def test_get_orders_filters(self, client_business, business, customer):
+        old, recent = self.create_orders(customer, business, 2)
+        Order.objects.filter(pk=old.pk).update(created_at=datetime(2024, 1, 10, 12, tzinfo=dt_timezone.utc))
+        Order.objects.filter(pk=recent.pk).update(created_at=datetime(2024, 3, 5, 8, tzinfo=dt_timezone.utc), status="completed")
+
+        def ids(**params):
+            return [o["id"] for o in client_business.get(reverse('orders'), params).json()["results"]]
+
+        assert ids(status="completed") == [recent.id]
+        assert ids(created_after="2024-02-01") == [recent.id]
+        assert ids(created_before="2024-01-10") == [old.id]
+        assert ids(created_after="2024-01-10T12:00:00Z", created_before="2024-03-05T08:00:00Z") == [old.id]
+
+    @pytest.mark.parametrize("params", [
+        {"status": "shipped"}, {"created_after": "yesterday"}, {"created_before": "2024-13-01"},
+        {"ordering": "price"}, {"cursor": "broken"},
+    ])
+    def test_get_orders_rejects_invalid_parameters(self, client_business, params):
+        assert client_business.get(reverse('orders'), params).status_code in (400, 404)
+
+    def test_order_pages_use_a_union_where_supported(self, business, monkeypatch):
+        monkeypatch.setattr(connection.features, "supports_slicing_ordering_in_compound", True)
+        paginator = OrderPagination()
+        paginator.branches = (Q(customer_user=business), Q(business_user=business))
+        page = paginator.get_page(Order.objects.values("id", "created_at"), ["-created_at", "-id"], 21)
+
+        sql = str(page.query)
+        assert sql.count("UNION") == 1 and sql.count("LIMIT 21") == 3
+        assert '"customer_user_id" =' in sql and '"business_user_id" =' in sql and " OR " not in sql
 
     def test_post_order_creates_order(self, client_customer, offer):
         url = reverse('orders')
@@ -59,6 +139,65 @@ class TestOrdersViews:
         assert data['customer_user'] == detail.offer.user.id or data['customer_user'] == client_customer.handler._force_user.id
         assert data['business_user'] == offer.user.id
 
+    def test_post_order_reads_detail_and_offer_once(self, client_customer, offer):
+        detail = offer.details.first()
+        rebuild_order_stats([offer.user_id])  # counters exist, so they are only incremented
+        with CaptureQueriesContext(connection) as queries:
+            response = client_customer.post(reverse('orders'), {"offer_detail_id": detail.id}, format='json')
+        assert response.status_code == 201
+        selects = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('SELECT')]
+        assert len(selects) == 1 and 'INNER JOIN "app_offers_offer"' in selects[0]
+        inserts = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('INSERT')]
+        assert len(inserts) == 1 and '"app_orders_order"' in inserts[0]
+
+        response = client_customer.post(reverse('orders'), {"offer_detail_id": 999}, format='json')
+        assert response.status_code == 400
+        assert response.data == {"offer_detail_id": ["Detail with this ID does not exist."]}
+
+    def test_post_order_with_idempotency_key(self, client_customer, customer, offer, settings):
+        detail = offer.details.first()
+        post = lambda key: client_customer.post(  # noqa: E731
+            reverse('orders'), {"offer_detail_id": detail.id}, format='json', HTTP_IDEMPOTENCY_KEY=key
+        )
+        first = post("retry-1")
+        assert first.status_code == 201 and "Idempotent-Replayed" not in first
+
+        replay = post("retry-1")
+        assert replay.status_code == 201 and replay["Idempotent-Replayed"] == "true"
+        assert replay.data == first.data
+        assert Order.objects.count() == 1
+
+        # keys are scoped per user
+        other = CustomUser.objects.create(username="other", email="other@test.com", type="customer")
+        client_customer.force_authenticate(user=other)
+        assert post("retry-1").data['id'] != first.data['id']
+        client_customer.force_authenticate(user=customer)
+
+        # expired keys create a new order
+        OrderIdempotencyKey.objects.filter(key="retry-1").update(created_at=timezone.now() - timedelta(days=2))
+        assert post("retry-1").data['id'] not in (first.data['id'], None)
+        assert OrderIdempotencyKey.objects.filter(user=customer, key="retry-1").count() == 1
+
+        assert post("x" * 256).status_code == 400
+        assert Order.objects.count() == 3
+
+    def test_post_order_returns_winner_of_concurrent_idempotent_requests(self, client_customer, customer, offer, monkeypatch):
+        detail = offer.details.first()
+        winner = client_customer.post(
+            reverse('orders'), {"offer_detail_id": detail.id}, format='json', HTTP_IDEMPOTENCY_KEY="race"
+        ).data
+        lookups = iter([None])
+        real_lookup = views.get_idempotent_order
+        # the losing request checked the key before the winner stored it
+        monkeypatch.setattr(views, "get_idempotent_order", lambda user, key: next(lookups, None) or real_lookup(user, key))
+
+        response = client_customer.post(
+            reverse('orders'), {"offer_detail_id": detail.id}, format='json', HTTP_IDEMPOTENCY_KEY="race"
+        )
+        assert response.status_code == 201 and response["Idempotent-Replayed"] == "true"
+        assert response.data['id'] == winner['id']
+        assert Order.objects.count() == 1
+
     def test_patch_order_status(self, client_business, offer, customer):
         detail = offer.details.first()
         order = Order.objects.create(
@@ -130,4 +269,104 @@ class TestOrdersViews:
         url_completed = reverse('completed_order_view', args=[offer.user.id])
         response_completed = client_business.get(url_completed)
         assert response_completed.status_code == 200
-        assert response_completed.data['completed_order_count'] == 1
\ No newline at end of file
+        assert response_completed.data['completed_order_count'] == 1
+
+    def test_order_count_views_read_one_counter_row(self, client_business, business, customer, django_assert_num_queries):
+        self.create_orders(customer, business, 2)
+        self.create_orders(customer, business, 1, status="completed")
+
+        with django_assert_num_queries(1):
+            assert client_business.get(reverse('order_count_view', args=[business.id])).data == {'order_count': 2}
+        with django_assert_num_queries(1):
+            assert client_business.get(reverse('completed_order_view', args=[business.id])).data == {'completed_order_count': 1}
+
+        # business users without orders get their (empty) row on first read
+        other = CustomUser.objects.create(username="other", email="other@test.com", type="business")
+        assert client_business.get(reverse('order_count_view', args=[other.id])).data == {'order_count': 0}
+        with django_assert_num_queries(1):
+            assert client_business.get(reverse('completed_order_view', args=[other.id])).data == {'completed_order_count': 0}
+
+        assert client_business.get(reverse('order_count_view', args=[customer.id])).status_code == 404
+        assert client_business.get(reverse('completed_order_view', args=[999])).status_code == 404
+
+    def test_order_summary_view(self, client_business, business, customer, django_assert_num_queries):
+        admin = CustomUser.objects.create(username="admin", email="admin@test.com", type="customer", is_staff=True)
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        self.create_orders(customer, business, 2)
+        completed = self.create_orders(customer, business, 1, status="completed")[0]
+        Order.objects.filter(pk=completed.pk).update(price=25, delivery_time_in_days=4)
+        url = reverse('order_summary_view', args=[business.id])
+
+        # user check plus one grouped aggregate, then served from the cache
+        with django_assert_num_queries(2):
+            response = client_business.get(url)
+        assert response.json() == {
+            'business_user': business.id,
+            'status_counts': {'in_progress': 2, 'completed': 1, 'cancelled': 0},
+            'total_orders': 3,
+            'total_revenue': '45.00',
+            'average_delivery_time_in_days': 2.0,
+        }
+        with django_assert_num_queries(0):
+            assert client_business.get(url).data['total_orders'] == 3
+
+        # creation, status changes and deletion drop the cached statistics
+        order = self.create_orders(customer, business, 1)[0]
+        assert client_business.get(url).data['status_counts']['in_progress'] == 3
+        client_business.patch(reverse('order', args=[order.id]), {'status': 'cancelled'}, format='json')
+        assert client_business.get(url).data['status_counts'] == {'in_progress': 2, 'completed': 1, 'cancelled': 1}
+        client.delete(reverse('order', args=[order.id]))
+        assert client_business.get(url).data['total_orders'] == 3
+
+        other = CustomUser.objects.create(username="other", email="other@test.com", type="business")
+        assert client_business.get(reverse('order_summary_view', args=[other.id])).json() == {
+            'business_user': other.id,
+            'status_counts': {'in_progress': 0, 'completed': 0, 'cancelled': 0},
+            'total_orders': 0,
+            'total_revenue': '0.00',
+            'average_delivery_time_in_days': None,
+        }
+        assert client_business.get(reverse('order_summary_view', args=[customer.id])).status_code == 404
+
+    def test_bulk_status_updates_owned_orders_in_one_statement(self, client_business, business, customer, django_assert_num_queries):
+        other = CustomUser.objects.create(username="other", email="other@test.com", type="business")
+        pending = self.create_orders(customer, business, 3)
+        done = self.create_orders(customer, business, 1, status="completed")[0]
+        foreign = self.create_orders(customer, other, 1)[0]
+        summary_url = reverse('order_summary_view', args=[business.id])
+        client_business.get(summary_url)  # cached before the update
+        ids = [pending[0].id, pending[1].id, done.id, foreign.id, 999, pending[0].id]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client_business.patch(reverse('order_bulk_status'), {"ids": ids, "status": "completed"}, format='json')
+        assert response.status_code == 200
+        assert response.data == {
+            "updated": [pending[0].id, pending[1].id],
+            "unchanged": [done.id],
+            "rejected": [foreign.id, 999],
+        }
+        statements = [query['sql'].split()[0] for query in queries.captured_queries]
+        # ownership check, the order UPDATE and the counter UPDATE
+        assert [sql for sql in statements if sql in ("SELECT", "UPDATE", "INSERT")] == ["SELECT", "UPDATE", "UPDATE"]
+
+        assert dict(Order.objects.values_list("id", "status")) == {
+            pending[0].id: "completed", pending[1].id: "completed", pending[2].id: "in_progress",
+            done.id: "completed", foreign.id: "in_progress",
+        }
+        assert client_business.get(reverse('order_count_view', args=[business.id])).data == {'order_count': 1}
+        assert client_business.get(reverse('completed_order_view', args=[business.id])).data == {'completed_order_count': 3}
+        assert client_business.get(summary_url).data['status_counts'] == {'in_progress': 1, 'completed': 3, 'cancelled': 0}
+
+    @pytest.mark.parametrize("payload", [
+        {"ids": [], "status": "completed"},
+        {"ids": [1], "status": "shipped"},
+        {"ids": ["a"], "status": "completed"},
+        {"status": "completed"},
+    ])
+    def test_bulk_status_rejects_invalid_payloads(self, client_business, payload):
+        assert client_business.patch(reverse('order_bulk_status'), payload, format='json').status_code == 400
+
+    def test_bulk_status_requires_business_user(self, client_customer):
+        response = client_customer.patch(reverse('order_bulk_status'), {"ids": [1], "status": "completed"}, format='json')
+        assert response.status_code == 403
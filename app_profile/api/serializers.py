@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from app_profile.models import Profile
+from core.fast_serializers import FastSerializer
+from core.images import ImageVariantsField
 
 
 class ProfileSerializer(serializers.ModelSerializer):
@@ -10,6 +12,7 @@ class ProfileSerializer(serializers.ModelSerializer):
     username = serializers.CharField(source='user.username', read_only=True)
     type = serializers.CharField(source='user.type', read_only=True)
     is_guest = serializers.BooleanField(source='user.is_guest', read_only=True)
+    file_thumbnails = ImageVariantsField(source='file_variants')
 
     class Meta:
         model = Profile
@@ -19,6 +22,7 @@ class ProfileSerializer(serializers.ModelSerializer):
             'first_name',
             'last_name',
             'file',
+            'file_thumbnails',
             'type',
             'is_guest',
         ]
@@ -48,6 +52,20 @@ class CustomerProfileSerializer(ProfileSerializer):
         fields = ProfileSerializer.Meta.fields + []
 
 
+class BusinessProfileFastSerializer(FastSerializer):
+    """
+    Dict-based fast path producing the same output as BusinessProfileSerializer.
+    """
+    serializer_class = BusinessProfileSerializer
+
+
+class CustomerProfileFastSerializer(FastSerializer):
+    """
+    Dict-based fast path producing the same output as CustomerProfileSerializer.
+    """
+    serializer_class = CustomerProfileSerializer
+
+
 class ProfileDetailSerializer(BusinessProfileSerializer):
     """
     Detailed serializer for business profiles.
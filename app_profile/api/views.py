@@ -1,14 +1,23 @@
 from django.shortcuts import get_object_or_404
 from rest_framework import status
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from app_authentication.models import CustomUser
 from app_authentication.api.permissions import IsProfileOwnerOrReadOnly
-from app_profile.api.serializers import BusinessProfileSerializer, CustomerProfileSerializer, ProfileDetailSerializer
+from app_profile.api.serializers import (
+    BusinessProfileSerializer, CustomerProfileSerializer, ProfileDetailSerializer,
+    BusinessProfileFastSerializer, CustomerProfileFastSerializer
+)
 from app_profile.models import Profile
+from core.conditional import make_etag, not_modified_response, set_validators
+from core.fast_serializers import FastSerializationMixin
+from core.fieldsets import get_fieldset, restrict_fields
+
+# ProfileDetailSerializer fields read from the related user
+USER_FIELDS = {'username', 'type', 'is_guest', 'email'}
 
 
 class ProfileDetailView(APIView):
@@ -24,10 +33,26 @@ class ProfileDetailView(APIView):
     def get(self, request, id):
         """
         Retrieves a profile by ID and returns its detailed serialized data.
+        Answers 304 when the ETag / Last-Modified validators (profile and user
+        timestamps) match, before the profile is loaded or serialized.
+        `fields` / `exclude` select a sparse fieldset; the user is only joined
+        when one of its fields is selected.
         """
-        profile = get_object_or_404(Profile, pk=id)
-        serializer = ProfileDetailSerializer(profile)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        fields = get_fieldset(request, ProfileDetailSerializer)
+        versions = Profile.objects.filter(pk=id).values_list("updated_at", "user__updated_at").first()
+        if versions is None:
+            raise NotFound()
+        etag, last_modified = make_etag("profile", id, *versions, *(fields or ())), max(versions)
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        queryset = Profile.objects.all()
+        if fields is None or USER_FIELDS.intersection(fields):
+            queryset = queryset.select_related("user")
+        profile = get_object_or_404(queryset, pk=id)
+        serializer = restrict_fields(ProfileDetailSerializer(profile), fields)
+        return set_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, last_modified)
 
     def patch(self, request, id):
         """
@@ -61,31 +86,35 @@ class ProfileDetailView(APIView):
         return Response(ProfileDetailSerializer(profile).data, status=status.HTTP_200_OK)
 
 
-class ProfileBusinessView(APIView):
+class ProfileBusinessView(FastSerializationMixin, APIView):
     """
     API view to list all business profiles.
     """
     permission_classes = [IsAuthenticated]
+    fast_serializer_class = BusinessProfileFastSerializer
 
     def get(self, request):
         """
         Retrieves all profiles associated with users of type 'business'.
+        `fields` / `exclude` select a sparse fieldset.
         """
+        fields = get_fieldset(request, BusinessProfileSerializer)
         business_profiles = Profile.objects.filter(user__type='business')
-        serializer = BusinessProfileSerializer(business_profiles, many=True)
-        return Response(serializer.data)
+        return Response(self.serialize_rows(self.prepare_queryset(business_profiles, fields), BusinessProfileSerializer, fields))
 
 
-class ProfileCustomerView(APIView):
+class ProfileCustomerView(FastSerializationMixin, APIView):
     """
     API view to list all customer profiles.
     """
     permission_classes = [IsAuthenticated]
+    fast_serializer_class = CustomerProfileFastSerializer
 
     def get(self, request):
         """
         Retrieves all profiles associated with users of type 'customer'.
+        `fields` / `exclude` select a sparse fieldset.
         """
+        fields = get_fieldset(request, CustomerProfileSerializer)
         customer_profiles = Profile.objects.filter(user__type='customer')
-        serializer = CustomerProfileSerializer(customer_profiles, many=True)
-        return Response(serializer.data)
+        return Response(self.serialize_rows(self.prepare_queryset(customer_profiles, fields), CustomerProfileSerializer, fields))
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AppProfileConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app_profile'
+
+    def ready(self):
+        from app_profile import signals
@@ -17,6 +17,7 @@ class Profile(models.Model):
         - working_hours: Working hours (for business users) (optional).
         - created_at: Timestamp when the profile was created.
         - updated_at: Timestamp when the profile was last updated.
+        - file_variants: Paths of the generated thumbnails of file (see core.images).
     """
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, related_name='profile')
     first_name = models.CharField(max_length=32, blank=True, default='')
@@ -28,6 +29,7 @@ class Profile(models.Model):
     working_hours = models.CharField(max_length=64, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    file_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     def __str__(self):
         """
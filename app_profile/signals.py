@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from app_profile.models import Profile
+from core.images import schedule_variants
+
+
+@receiver(post_save, sender=Profile)
+def generate_profile_file_variants(sender, instance, **kwargs):
+    """
+    Queues thumbnail generation when the profile file was uploaded or replaced.
+    """
+    schedule_variants(instance, 'file', 'file_variants')
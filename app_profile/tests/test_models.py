@@ -1,4 +1,5 @@
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from app_authentication.models import CustomUser
 from app_profile.models import Profile
 
@@ -48,3 +49,13 @@ class TestProfileModel:
         assert profile_customer.first_name == "John"
         assert profile_customer.last_name == "Doe"
         assert profile_business.location == "Berlin"
+
+    def test_file_variants_skip_non_image_files(self, users, settings, tmp_path, django_capture_on_commit_callbacks):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.IMAGE_PROCESSING_SYNC = True
+        customer, _ = users
+        with django_capture_on_commit_callbacks(execute=True):
+            profile = Profile.objects.create(user=customer, file=SimpleUploadedFile("cv.txt", b"not an image"))
+
+        profile.refresh_from_db()
+        assert profile.file_variants == {"source": profile.file.name}
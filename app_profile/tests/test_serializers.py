@@ -6,7 +6,10 @@ from app_profile.api.serializers import (
     BusinessProfileSerializer,
     CustomerProfileSerializer,
     ProfileDetailSerializer,
+    BusinessProfileFastSerializer,
+    CustomerProfileFastSerializer,
 )
+from rest_framework.renderers import JSONRenderer
 
 @pytest.fixture
 def users(db):
@@ -64,3 +67,21 @@ class TestProfileSerializers:
         assert data['email'] == profile_business.user.email
         assert 'created_at' in data
         assert 'updated_at' in data
+
+    @pytest.mark.parametrize("serializer_class, fast_class", [
+        (BusinessProfileSerializer, BusinessProfileFastSerializer),
+        (CustomerProfileSerializer, CustomerProfileFastSerializer),
+    ])
+    def test_fast_serializers_match_profile_serializers(self, profiles, serializer_class, fast_class):
+        profile_customer, _ = profiles
+        profile_customer.file = "profile/avatar.jpg"
+        profile_customer.file_variants = {"source": "profile/avatar.jpg", "small": {"webp": "thumbnails/profile/avatar_small.webp"}}
+        profile_customer.save()
+
+        queryset = Profile.objects.order_by("id")
+        fast = fast_class()
+        expected = serializer_class(queryset, many=True).data
+        actual = fast.serialize(fast.prepare(queryset))
+
+        assert actual == expected
+        assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
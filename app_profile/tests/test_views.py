@@ -64,3 +64,32 @@ class TestProfileViews:
         assert response.status_code == 200
         data = response.data
         assert any(p['username'] == profile_customer.user.username for p in data)
+
+    def test_profile_detail_conditional_get(self, client_customer, client_business, profiles):
+        _, profile_business = profiles
+        url = reverse('profile_detail', args=[profile_business.id])
+        response = client_customer.get(url)
+        etag = response['ETag']
+        assert 'Last-Modified' in response
+
+        assert client_customer.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        client_business.patch(url, {'email': 'new-business@test.com'}, format='json')
+        response = client_customer.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data['email'] == 'new-business@test.com'
+
+    def test_profile_sparse_fieldsets(self, client_customer, profiles, django_assert_num_queries):
+        _, profile_business = profiles
+        url = reverse('profile_detail', args=[profile_business.id])
+        full_etag = client_customer.get(url)['ETag']
+
+        # validators, then the profile without the user join
+        with django_assert_num_queries(2):
+            response = client_customer.get(url, {'fields': 'first_name,location'})
+        assert response.json() == {'first_name': 'Business', 'location': 'Berlin'}
+        assert response['ETag'] != full_etag
+
+        data = client_customer.get(reverse('profile_business'), {'exclude': 'file,file_thumbnails,description'}).json()
+        assert set(data[0]) == {'user', 'username', 'first_name', 'last_name', 'type', 'is_guest', 'location', 'tel', 'working_hours'}
+        assert client_customer.get(reverse('profile_customer'), {'fields': 'email'}).status_code == 400
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
 
 from app_reviews.models import Review
+from core.fast_serializers import FastSerializer
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -26,6 +27,13 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
 
 
+class ReviewFastSerializer(FastSerializer):
+    """
+    Dict-based fast path producing the same output as ReviewSerializer.
+    """
+    serializer_class = ReviewSerializer
+
+
 class ReviewCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating and updating reviews.
@@ -5,11 +5,13 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from app_authentication.api.permissions import IsReviewerOrReadOnly, IsCustomerUser
-from app_reviews.api.serializers import ReviewSerializer, ReviewCreateUpdateSerializer
+from app_reviews.api.serializers import ReviewSerializer, ReviewCreateUpdateSerializer, ReviewFastSerializer
 from app_reviews.models import Review
+from core.fast_serializers import FastSerializationMixin
+from core.fieldsets import get_fieldset
 
 
-class ReviewView(APIView):
+class ReviewView(FastSerializationMixin, APIView):
     """
     API view to manage reviews.
 
@@ -22,6 +24,8 @@ class ReviewView(APIView):
         - GET/POST: Requires authentication.
         - PATCH/DELETE: Requires authentication and reviewer ownership.
     """
+    fast_serializer_class = ReviewFastSerializer
+
     def get_permissions(self):
         if self.request.method in ["GET"]:
             return [IsAuthenticated()]
@@ -34,8 +38,9 @@ class ReviewView(APIView):
     def get(self, request):
         """
         Retrieve all reviews, optionally filtered by business_user_id or reviewer_id.
-        Allows ordering by 'updated_at' or 'rating'.
+        Allows ordering by 'updated_at' or 'rating'; `fields` / `exclude` select a sparse fieldset.
         """
+        fields = get_fieldset(request, ReviewSerializer)
         queryset = Review.objects.all()
 
         business_user_id = request.query_params.get("business_user_id")
@@ -50,8 +55,8 @@ class ReviewView(APIView):
         if ordering in ["updated_at", "rating"]:
             queryset = queryset.order_by(ordering)
 
-        serializer = ReviewSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = self.serialize_rows(self.prepare_queryset(queryset, fields), ReviewSerializer, fields)
+        return Response(data, status=status.HTTP_200_OK)
 
     def post(self, request):
         """
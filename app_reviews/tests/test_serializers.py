@@ -1,6 +1,7 @@
 import pytest
 from rest_framework.exceptions import ValidationError
-from app_reviews.api.serializers import ReviewSerializer, ReviewCreateUpdateSerializer
+from rest_framework.renderers import JSONRenderer
+from app_reviews.api.serializers import ReviewSerializer, ReviewCreateUpdateSerializer, ReviewFastSerializer
 from app_reviews.models import Review
 from app_authentication.models import CustomUser as User
 
@@ -68,3 +69,12 @@ class TestReviewSerializers:
         serializer = ReviewCreateUpdateSerializer(data=data, context={"request": type("Request", (), {"user": reviewer})()})
         with pytest.raises(ValidationError):
             serializer.is_valid(raise_exception=True)
+
+    def test_review_fast_serializer_matches_review_serializer(self, review):
+        queryset = Review.objects.all()
+        fast = ReviewFastSerializer()
+        expected = ReviewSerializer(queryset, many=True).data
+        actual = fast.serialize(fast.prepare(queryset))
+
+        assert actual == expected
+        assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
@@ -85,3 +85,8 @@ class TestReviewViews:
         data = response.json()
         assert len(data) == 1
         assert data[0]["reviewer"] == reviewer.id
+
+    def test_reviews_sparse_fieldset(self, client_reviewer, review):
+        response = client_reviewer.get(reverse("reviews"), {"fields": "id,rating"})
+        assert response.json() == [{"id": review.id, "rating": 4}]
+        assert client_reviewer.get(reverse("reviews"), {"exclude": "reviewer__password"}).status_code == 400
@@ -0,0 +1,19 @@
+import pytest
+from django.core.cache import cache
+
+from app_offers.suggest import title_index
+from core.lru import clear_local_caches
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Cached responses and counters must not leak between tests.
+    """
+    cache.clear()
+    clear_local_caches()
+    title_index.clear()
+    yield
+    cache.clear()
+    clear_local_caches()
+    title_index.clear()
@@ -0,0 +1,42 @@
+"""
+Helpers for conditional GET (ETag / Last-Modified) in API views.
+
+Validators are computed from cheap queries or cached version counters before
+any serialization happens, so unchanged resources are answered with a bare 304.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+
+def make_etag(*parts):
+    """
+    Returns a strong, quoted ETag derived from the given version parts.
+    """
+    raw = "|".join(str(part) for part in parts)
+    return quote_etag(hashlib.sha1(raw.encode("utf-8")).hexdigest())
+
+
+def not_modified_response(request, etag=None, last_modified=None):
+    """
+    Evaluates If-None-Match / If-Modified-Since (and If-Match / If-Unmodified-Since)
+    against the validators. Returns the 304/412 response to send, or None when
+    the full response must be built.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag=None, last_modified=None):
+    """
+    Adds ETag and Last-Modified headers to the response.
+    """
+    if etag:
+        response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
@@ -0,0 +1,228 @@
+"""
+Read-only fast path for list endpoints.
+
+A FastSerializer mirrors a DRF ModelSerializer but works on `.values()` rows
+instead of model instances. The serializer's fields are introspected once per
+class and compiled into one converter per column (Decimal quantization,
+timezone-aware datetime formatting, file URLs, ...), so serializing a row is a
+single dict comprehension instead of a walk through DRF field objects.
+The output is identical to the mirrored serializer.
+"""
+import decimal
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import fields, relations, serializers
+from rest_framework.settings import api_settings
+
+from core.fieldsets import restrict_fields
+from core.images import ImageVariantsField, variant_urls
+
+IDENTITY_FIELDS = (
+    fields.BooleanField,
+    fields.CharField,
+    fields.IntegerField,
+    fields.ReadOnlyField,
+    relations.PrimaryKeyRelatedField,
+)
+
+
+class FastSerializer:
+    """
+    Base class for dict-based read-only serializers.
+
+    Attributes:
+        - serializer_class: The DRF ModelSerializer whose output is reproduced.
+        - extra_values (tuple): Additional `.values()` keys needed by custom fields.
+        - represent_values (dict): `.values()` keys needed by a represent_<field_name>
+          method, only selected when that field is part of the output.
+
+    Fields the base class cannot compile (method fields, nested serializers,
+    custom fields) must be provided by a `represent_<field_name>(row)` method.
+    Batch lookups for such fields belong in `load_related(rows)`.
+
+    Passing `fields` (see core.fieldsets) restricts the output, and the
+    selected columns, to those fields.
+    """
+    serializer_class = None
+    extra_values = ()
+    represent_values = {}
+    _specs_cache = None
+
+    def __init__(self, context=None, fields=None):
+        self.context = context or {}
+        self.fields = fields
+
+    @classmethod
+    def get_specs(cls):
+        """
+        Returns the introspected (field_name, values_key, field) triples of
+        serializer_class, computed once per FastSerializer class.
+        """
+        if cls.__dict__.get("_specs_cache") is None:
+            specs = []
+            for name, field in cls.serializer_class().fields.items():
+                if field.write_only:
+                    continue
+                if hasattr(cls, f"represent_{name}"):
+                    specs.append((name, None, field))
+                elif isinstance(field, serializers.BaseSerializer) or field.source == "*":
+                    raise ImproperlyConfigured(f"{cls.__name__} must define represent_{name}().")
+                else:
+                    specs.append((name, "__".join(field.source_attrs), field))
+            cls._specs_cache = specs
+        return cls._specs_cache
+
+    @property
+    def specs(self):
+        """
+        Returns the specs of the fields this instance outputs.
+        """
+        if self.fields is None:
+            return self.get_specs()
+        return [spec for spec in self.get_specs() if spec[0] in self.fields]
+
+    def includes(self, name):
+        """
+        Returns True when the field is part of this instance's output.
+        """
+        return self.fields is None or name in self.fields
+
+    def get_value_keys(self):
+        """
+        Returns the keys to pass to `.values()`.
+        """
+        keys = []
+        for name, key, _ in self.specs:
+            keys.extend(self.represent_values.get(name, ()) if key is None else (key,))
+        return list(dict.fromkeys(keys + list(self.extra_values)))
+
+    def prepare(self, queryset, extra_values=()):
+        """
+        Turns a model queryset into the `.values()` queryset this serializer
+        consumes; `extra_values` adds keys the caller needs (e.g. for cursors).
+        """
+        keys = dict.fromkeys(self.get_value_keys() + list(extra_values))
+        return queryset.prefetch_related(None).values(*keys)
+
+    def load_related(self, rows):
+        """
+        Hook for batch-loading data needed by represent_<field_name> methods.
+        """
+
+    def serialize(self, rows):
+        """
+        Serializes an iterable of `.values()` rows into a list of dicts.
+        """
+        rows = list(rows)
+        self.load_related(rows)
+        plan = [(name, self.compile_column(name, key, field)) for name, key, field in self.specs]
+        return [{name: column(row) for name, column in plan} for row in rows]
+
+    def compile_column(self, name, key, field):
+        """
+        Returns a function mapping a row to the representation of one field.
+        """
+        if key is None:
+            return getattr(self, f"represent_{name}")
+
+        convert = self.compile_converter(field)
+        if convert is None:
+            return lambda row: row[key]
+
+        def column(row):
+            value = row[key]
+            return None if value is None else convert(value)
+        return column
+
+    def compile_converter(self, field):
+        """
+        Returns a converter for non-null values of the given DRF field, or None
+        when the database value can be used unchanged.
+        """
+        if isinstance(field, fields.DecimalField):
+            return self.compile_decimal(field)
+        if isinstance(field, fields.DateTimeField):
+            return self.compile_datetime(field)
+        if isinstance(field, fields.FileField):
+            return self.compile_file(field)
+        if isinstance(field, ImageVariantsField):
+            request = self.context.get("request")
+            return lambda variants: variant_urls(variants, request)
+        if isinstance(field, fields.JSONField) and not field.binary:
+            return None
+        if isinstance(field, fields.ChoiceField):
+            return None if all(isinstance(key, str) for key in field.choices) else field.to_representation
+        if isinstance(field, IDENTITY_FIELDS):
+            return None
+        return field.to_representation
+
+    def compile_decimal(self, field):
+        coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        if not coerce_to_string or field.localize or field.normalize_output or field.decimal_places is None:
+            return field.to_representation
+        quantum = decimal.Decimal(".1") ** field.decimal_places
+        context = decimal.getcontext().copy()
+        if field.max_digits is not None:
+            context.prec = field.max_digits
+        rounding = field.rounding
+
+        def convert(value):
+            return format(value.quantize(quantum, rounding=rounding, context=context), "f")
+        return convert
+
+    def compile_datetime(self, field):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if output_format is None or output_format.lower() != fields.ISO_8601:
+            return field.to_representation
+        field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        if field_timezone is None:
+            return field.to_representation
+
+        def convert(value):
+            if timezone.is_naive(value):
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+        return convert
+
+    def compile_file(self, field):
+        if not getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL):
+            return lambda name: name or None
+        storage = self.serializer_class.Meta.model._meta.get_field(field.source).storage
+        request = self.context.get("request")
+
+        def convert(name):
+            if not name:
+                return None
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+        return convert
+
+
+class FastSerializationMixin:
+    """
+    APIView mixin making the fast path selectable per view.
+
+    Set `fast_serializer_class` to a FastSerializer to serve list responses from
+    `.values()` rows; leave it as None to use the regular DRF serializer.
+    Both paths accept a sparse fieldset (see core.fieldsets).
+    """
+    fast_serializer_class = None
+
+    def prepare_queryset(self, queryset, fields=None, extra_values=()):
+        """
+        Switches the queryset to `.values()` rows when the fast path is enabled.
+        """
+        if self.fast_serializer_class is None:
+            return queryset
+        return self.fast_serializer_class(fields=fields).prepare(queryset, extra_values)
+
+    def serialize_rows(self, rows, serializer_class, fields=None):
+        """
+        Serializes prepared rows with the fast serializer, or model instances
+        with `serializer_class`.
+        """
+        if self.fast_serializer_class is None:
+            return restrict_fields(serializer_class(rows, many=True), fields).data
+        return self.fast_serializer_class(fields=fields).serialize(rows)
@@ -0,0 +1,75 @@
+"""
+Sparse fieldsets for read endpoints.
+
+Clients pass `?fields=id,title` to receive only those top-level fields, or
+`?exclude=description` to drop some (both may be combined and repeated).
+Views resolve the selection once per request and hand it to the serializer
+and to the queryset builder, so unrequested fields are neither serialized nor
+loaded: `.values()` rows only select the needed columns and joins, and
+prefetches for dropped nested fields are skipped.
+"""
+from functools import lru_cache
+
+from rest_framework.exceptions import ParseError
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+
+@lru_cache(maxsize=None)
+def readable_fields(serializer_class):
+    """
+    Returns the names of the fields serializer_class outputs, in output order.
+    """
+    return tuple(name for name, field in serializer_class().fields.items() if not field.write_only)
+
+
+def split_names(values):
+    return [name.strip() for value in values for name in value.split(",") if name.strip()]
+
+
+def get_fieldset(request, serializer_class):
+    """
+    Returns the tuple of field names selected by the `fields` / `exclude`
+    query parameters, in output order, or None when neither is given.
+
+    Raises:
+        ParseError: If a parameter names a field the serializer does not output.
+    """
+    params = request.query_params
+    requested = split_names(params.getlist(FIELDS_PARAM))
+    excluded = split_names(params.getlist(EXCLUDE_PARAM))
+    if not requested and not excluded:
+        return None
+
+    available = readable_fields(serializer_class)
+    unknown = [name for name in dict.fromkeys(requested + excluded) if name not in available]
+    if unknown:
+        raise ParseError(f"Unknown field(s): {', '.join(unknown)}. Allowed values: {', '.join(available)}.")
+    return tuple(
+        name for name in available
+        if (not requested or name in requested) and name not in excluded
+    )
+
+
+def restrict_fields(serializer, fields):
+    """
+    Removes the fields outside `fields` from a serializer (or, for many=True,
+    from its child) before it renders. A no-op when fields is None.
+    """
+    if fields is not None:
+        target = getattr(serializer, "child", serializer)
+        for name in list(target.fields):
+            if name not in fields:
+                target.fields.pop(name)
+    return serializer
+
+
+def select_fields(data, fields):
+    """
+    Returns the given fields of an already rendered representation (e.g. a
+    cached payload). A no-op when fields is None.
+    """
+    if fields is None:
+        return data
+    return {name: data[name] for name in fields if name in data}
@@ -0,0 +1,210 @@
+"""
+Background thumbnail pipeline for uploaded images.
+
+Uploads are stored as-is; after the saving transaction commits, a worker
+thread decodes the original once and writes one file per configured size and
+format next to it. JPEGs are decoded at reduced scale (Pillow's draft mode);
+other formats are decoded at full size, so images that would decode to more
+than IMAGE_MAX_DECODE_PIXELS pixels are skipped. The resulting paths are
+stored in a JSON "variants" field on the model:
+
+    {"source": "offers/pic.png",
+     "small": {"webp": "thumbnails/offers/pic.png_small.webp", "jpeg": "..."}, ...}
+
+`source` records which upload the variants belong to, so re-saving a model
+does not regenerate them and a replaced upload does.
+"""
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+PIL_FORMATS = {'webp': 'WEBP', 'jpeg': 'JPEG'}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Returns the process-wide thread pool running thumbnail jobs.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.IMAGE_WORKERS, thread_name_prefix='thumbnails')
+        return _executor
+
+
+def needs_variants(instance, file_field, variants_field):
+    """
+    Returns True when the stored variants do not belong to the current upload.
+    """
+    name = getattr(instance, file_field).name or ''
+    return getattr(instance, variants_field).get('source', '') != name
+
+
+def schedule_variants(instance, file_field, variants_field):
+    """
+    Queues variant generation for the instance's current upload once the
+    surrounding transaction commits. Runs inline if IMAGE_PROCESSING_SYNC is set.
+    """
+    if not needs_variants(instance, file_field, variants_field):
+        return
+    job = (type(instance), instance.pk, file_field, variants_field)
+
+    def submit():
+        if settings.IMAGE_PROCESSING_SYNC:
+            process_variants(*job)
+        else:
+            get_executor().submit(run_in_worker, *job)
+    transaction.on_commit(submit)
+
+
+def run_in_worker(*job):
+    """
+    Thread pool entry point: processes one job with a fresh database connection.
+    """
+    close_old_connections()
+    try:
+        process_variants(*job)
+    except Exception:
+        logger.exception('Generating image variants failed for %s', job[:2])
+    finally:
+        close_old_connections()
+
+
+def process_variants(model, pk, file_field, variants_field):
+    """
+    Generates the variants for the current upload of one model instance and
+    stores their paths. Variants of a previous upload are deleted afterwards.
+    """
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None or not needs_variants(instance, file_field, variants_field):
+        return
+    upload = getattr(instance, file_field)
+    previous = getattr(instance, variants_field)
+
+    variants = {'source': upload.name or ''}
+    if upload.name:
+        try:
+            with upload.open('rb') as source:
+                variants.update(render_variants(source, upload.name, upload.storage))
+        except (UnidentifiedImageError, OSError):
+            logger.info('Skipping variants for %s: not a readable image', upload.name)
+        except Image.DecompressionBombError:
+            logger.warning('Skipping variants for %s: image too large to decode', upload.name)
+
+    # Only store the result if the upload was not replaced in the meantime.
+    if not model.objects.filter(pk=pk, **{file_field: upload.name}).exists():
+        delete_variants(variants, upload.storage)
+        return
+    setattr(instance, variants_field, variants)
+    update_fields = [variants_field]
+    if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+        update_fields.append('updated_at')
+    instance.save(update_fields=update_fields)
+    delete_variants(previous, upload.storage, keep=variant_paths(variants))
+
+
+def render_variants(source, name, storage):
+    """
+    Renders every size in IMAGE_VARIANT_SIZES in every IMAGE_VARIANT_FORMATS
+    format and saves them to storage. Returns {size: {format: path}}.
+
+    Raises:
+        Image.DecompressionBombError: If the image would decode to more than
+            IMAGE_MAX_DECODE_PIXELS pixels.
+    """
+    sizes = sorted(settings.IMAGE_VARIANT_SIZES.items(), key=lambda item: item[1], reverse=True)
+    largest = sizes[0][1]
+    image = Image.open(source)
+    # JPEG: let the decoder produce a 1/2, 1/4 or 1/8 scale image directly.
+    # Other formats ignore draft() and are decoded at full size.
+    image.draft('RGB', (largest, largest))
+    # Only the header has been read so far; size is what load() would decode.
+    width, height = image.size
+    if width * height > settings.IMAGE_MAX_DECODE_PIXELS:
+        raise Image.DecompressionBombError(f'{width}x{height} exceeds IMAGE_MAX_DECODE_PIXELS')
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+
+    variants = {}
+    # Largest first, each size is derived from the previous one; `reducing_gap`
+    # makes Pillow shrink the decoded image with Image.reduce() before resampling.
+    for size_name, size in sizes:
+        image.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        variants[size_name] = {}
+        for fmt in settings.IMAGE_VARIANT_FORMATS:
+            # Named after the whole upload name (extension included), which the
+            # storage keeps unique; save() never overwrites, so a file owned by
+            # another upload gets a suffixed name instead of being replaced.
+            path = f'thumbnails/{name}_{size_name}.{fmt}'
+            variants[size_name][fmt] = storage.save(path, ContentFile(encode(image, fmt)))
+    return variants
+
+
+def encode(image, fmt):
+    """
+    Encodes an image as WebP or JPEG bytes (JPEG has no alpha channel).
+    """
+    if fmt == 'jpeg' and image.mode == 'RGBA':
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+    buffer = io.BytesIO()
+    image.save(buffer, PIL_FORMATS[fmt], quality=settings.IMAGE_VARIANT_QUALITY)
+    return buffer.getvalue()
+
+
+def delete_variants(variants, storage, keep=()):
+    """
+    Removes the files of a variants dict from storage, except those in `keep`.
+    """
+    for path in variant_paths(variants) - set(keep):
+        storage.delete(path)
+
+
+def variant_paths(variants):
+    """
+    Returns the set of file paths referenced by a variants dict.
+    """
+    return {path for size_name, paths in variants.items() if size_name != 'source' for path in paths.values()}
+
+
+class ImageVariantsField(serializers.Field):
+    """
+    Read-only field rendering a variants JSON field as {size: {format: url}}.
+    Empty until the variants have been generated.
+    """
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return variant_urls(value, self.context.get('request'))
+
+
+def variant_urls(variants, request=None):
+    """
+    Maps the stored variant paths to (absolute, if a request is given) URLs.
+    """
+    urls = {}
+    for size_name, paths in (variants or {}).items():
+        if size_name == 'source':
+            continue
+        urls[size_name] = {}
+        for fmt, path in paths.items():
+            url = default_storage.url(path)
+            urls[size_name][fmt] = request.build_absolute_uri(url) if request is not None else url
+    return urls
@@ -0,0 +1,88 @@
+"""
+Bounded per-process LRU cache with a time-to-live per entry.
+
+Used as a small first layer in front of the shared Django cache: entries are
+served without any network round-trip, at the price of up to `ttl` seconds of
+staleness for writes made by other processes.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+_instances = []
+
+
+class LocalLRUCache:
+    """
+    Thread-safe LRU mapping with per-entry expiry and hit/miss counters.
+
+    Attributes:
+        - max_entries (int): Least recently used entries are evicted beyond this size.
+        - ttl (float): Seconds an entry is served after it was stored.
+    """
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+        _instances.append(self)
+
+    def get(self, key, default=None):
+        """
+        Returns the live entry for key (marking it as recently used), or default.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """
+        Stores an entry, evicting the least recently used ones beyond max_entries.
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        """
+        Returns the entry count and hit/miss counters of this process.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+            }
+
+
+def clear_local_caches():
+    """
+    Empties every LocalLRUCache of this process (e.g. between tests).
+    """
+    for instance in _instances:
+        instance.clear()
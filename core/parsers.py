@@ -0,0 +1,47 @@
+"""
+JSON parser backed by orjson, the counterpart of core.renderers.FastJSONRenderer.
+
+Accepts exactly what DRF's JSONParser accepts with STRICT_JSON (NaN and
+Infinity are rejected) and raises the same ParseError. Falls back to
+JSONParser when orjson is not installed, for non-UTF-8 request bodies and
+when STRICT_JSON is disabled.
+"""
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+UTF8_NAMES = {'utf-8', 'utf8'}
+
+
+def loads(data):
+    """
+    Decodes one JSON document from bytes or str with orjson, if installed.
+    """
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+class FastJSONParser(JSONParser):
+    """
+    Drop-in replacement for JSONParser decoding with orjson.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as JSON and returns the resulting data.
+        """
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower() not in UTF8_NAMES:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,69 @@
+"""
+JSON renderer backed by orjson, a compiled JSON encoder.
+
+The output is byte-identical to DRF's JSONRenderer for API payloads: compact
+separators, UTF-8 instead of \\u escapes, datetimes with a "Z" suffix for UTC,
+and \\u2028 / \\u2029 escaped. Types orjson does not encode itself (Decimal,
+lazy translations, timedelta, ...) go through DRF's JSONEncoder.default, and
+anything orjson rejects (integers beyond 64 bits, non-string dict keys, ...)
+is rendered by the stdlib renderer. So is any output containing a float
+that Python prints in exponent notation (below 1e-4 or from 1e16 on), which
+orjson writes differently ("0.00001", "1e16"); the check looks at the bytes,
+so strings like "1e+5" or ".0000" (rare microseconds) take that path as well.
+
+Known difference: NaN and Infinity are rendered as null, where JSONRenderer
+raises ValueError (strict JSON). orjson gives no way to detect them short of
+walking the payload in Python.
+
+Falls back to DRF's JSONRenderer when orjson is not installed, for indented
+output (browsable API) and when UNICODE_JSON / COMPACT_JSON are disabled.
+"""
+import re
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LINE_SEPARATOR = '\u2028'.encode()
+PARAGRAPH_SEPARATOR = '\u2029'.encode()
+# Both separators start with these two bytes, so one scan tells if any is present.
+SEPARATOR_PREFIX = LINE_SEPARATOR[:2]
+# Floats whose orjson notation differs from Python's repr: orjson prints values
+# below 1e-4 as "0.0000..." and exponents without "+" or zero padding ("1e16",
+# "2.5e-7"). Both checks start with a literal so they scan at memchr speed.
+SMALL_FLOAT = b'.0000'
+EXPONENT = re.compile(rb'e(?<=[0-9]e)[-+0-9]')
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for JSONRenderer encoding with orjson.
+    """
+    default = staticmethod(JSONEncoder().default)
+    options = orjson.OPT_UTC_Z if orjson is not None else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if SMALL_FLOAT in ret or EXPONENT.search(ret):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Keep the output a strict javascript subset, like JSONRenderer.
+        if SEPARATOR_PREFIX in ret:
+            ret = ret.replace(LINE_SEPARATOR, b'\\u2028').replace(PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
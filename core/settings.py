@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 from pathlib import Path
 import os
 from pathlib import Path
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -32,6 +33,7 @@ DEBUG = os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes')
 
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', 'localhost').split(',')
 CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', '').split(',') if os.getenv('CORS_ALLOWED_ORIGINS') else []
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
 
 # Application definition
 
@@ -110,6 +112,37 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'coderr'),
+    }
+}
+
+# Seconds a cached public offers listing is served before it is rebuilt
+# (entries are also invalidated by any offer, detail or profile write).
+OFFERS_CACHE_TIMEOUT = int(os.getenv('OFFERS_CACHE_TIMEOUT', '60'))
+
+# Single offer / offer detail payloads: a per-process LRU (size per object type,
+# TTL bounding cross-worker staleness) over the shared cache above.
+PAYLOAD_CACHE_MAX_ENTRIES = int(os.getenv('PAYLOAD_CACHE_MAX_ENTRIES', '1024'))
+PAYLOAD_CACHE_LOCAL_TTL = float(os.getenv('PAYLOAD_CACHE_LOCAL_TTL', '5'))
+PAYLOAD_CACHE_TIMEOUT = int(os.getenv('PAYLOAD_CACHE_TIMEOUT', '300'))
+
+# In-memory offer title index behind /api/offers/suggest/ (see app_offers/suggest.py).
+SUGGEST_INDEX_MAX_TITLES = int(os.getenv('SUGGEST_INDEX_MAX_TITLES', '100000'))
+SUGGEST_INDEX_MAX_WORDS = 6
+SUGGEST_INDEX_KEY_LENGTH = 64
+SUGGEST_INDEX_TTL = int(os.getenv('SUGGEST_INDEX_TTL', '30'))
+
+# Seconds an Idempotency-Key sent with POST /api/orders/ is remembered; expired
+# keys are removed by `manage.py purge_order_idempotency_keys`.
+ORDER_IDEMPOTENCY_KEY_TTL = int(os.getenv('ORDER_IDEMPOTENCY_KEY_TTL', '86400'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -153,6 +186,18 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Thumbnails generated in the background for offer images and profile files
+# (see core/images.py). Sizes are the bounding box edge in pixels.
+IMAGE_VARIANT_SIZES = {'small': 160, 'medium': 480}
+IMAGE_VARIANT_FORMATS = ('webp', 'jpeg')
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_WORKERS = int(os.getenv('IMAGE_WORKERS', '2'))
+# Generate variants inline after commit instead of in the thread pool.
+IMAGE_PROCESSING_SYNC = os.getenv('IMAGE_PROCESSING_SYNC', 'False').lower() in ('true', '1', 'yes')
+# Largest image (in decoded pixels, after JPEG draft scaling) thumbnails are
+# generated for; bigger uploads are kept without variants.
+IMAGE_MAX_DECODE_PIXELS = int(os.getenv('IMAGE_MAX_DECODE_PIXELS', '40000000'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -164,6 +209,15 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework.authentication.TokenAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
     ],